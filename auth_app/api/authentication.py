@@ -0,0 +1,215 @@
+"""
+auth_app API authentication.
+
+This module provides a drop-in replacement for DRF's TokenAuthentication that
+caches resolved tokens, so repeated requests with the same token do not hit
+the authtoken/user tables.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+DEFAULTS = {
+    "MAX_SIZE": 10_000,
+    "TTL": 5,
+    "CACHE_ALIAS": None,
+    "KEY_PREFIX": "kanmind:token:",
+}
+
+
+def get_token_cache_settings():
+    """Return TOKEN_AUTH_CACHE from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "TOKEN_AUTH_CACHE", {})}
+
+
+class TokenCache:
+    """
+    Bounded, thread-safe LRU of token key -> (user, token) with a TTL.
+
+    Invalidation only reaches the in-process LRU of the worker that wrote, so
+    with several worker processes a revoked token stays valid in the others
+    for up to TTL seconds; keep the TTL short in that setup. If a Django cache
+    alias is configured, that shared cache replaces the in-process level:
+    every worker sees invalidations at once, at the cost of a cache round
+    trip per request.
+    """
+
+    def __init__(self, max_size, ttl, cache_alias=None, key_prefix=DEFAULTS["KEY_PREFIX"]):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        """Return the shared Django cache or None if not configured."""
+        return caches[self.cache_alias] if self.cache_alias else None
+
+    def _shared_key(self, key):
+        return self.key_prefix + hashlib.sha256(key.encode()).hexdigest()
+
+    def get_local(self, key, now=None):
+        """Return the in-process (user, token) pair or None; never does I/O."""
+        if self.cache_alias:
+            return None
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._discard(key)
+        return None
+
+    def get(self, key):
+        """Return the cached (user, token) pair or None on a miss."""
+        value = self.get_local(key)
+        if value is not None:
+            return value
+
+        shared = self.shared
+        value = shared.get(self._shared_key(key)) if shared is not None else None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Store a (user, token) pair in the shared cache or the in-process LRU."""
+        shared = self.shared
+        if shared is not None:
+            shared.set(self._shared_key(key), value, self.ttl)
+            return
+
+        with self._lock:
+            self._store(key, value, time.monotonic())
+
+    def invalidate(self, key):
+        """Drop a single token key from all levels."""
+        with self._lock:
+            self._discard(key)
+
+        shared = self.shared
+        if shared is not None:
+            shared.delete(self._shared_key(key))
+
+    def invalidate_user(self, user_id, keys=()):
+        """Drop every cached token of a user, plus any explicitly given keys."""
+        with self._lock:
+            keys = set(keys) | self._keys_by_user.get(user_id, set())
+            for key in keys:
+                self._discard(key)
+
+        shared = self.shared
+        if shared is not None and keys:
+            shared.delete_many([self._shared_key(key) for key in keys])
+
+    def clear(self):
+        """Drop all in-process entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counters and the current in-process size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _store(self, key, value, now):
+        self._discard(key)
+        self._entries[key] = (now + self.ttl, value)
+        self._keys_by_user.setdefault(value[0].pk, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[1][0].pk
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+def _build_token_cache():
+    config = get_token_cache_settings()
+    return TokenCache(
+        max_size=config["MAX_SIZE"],
+        ttl=config["TTL"],
+        cache_alias=config["CACHE_ALIAS"],
+        key_prefix=config["KEY_PREFIX"],
+    )
+
+
+token_cache = _build_token_cache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication backed by token_cache.
+
+    Cache hits perform no database queries. Entries are invalidated by the
+    auth_app signal handlers when tokens are deleted or users change.
+    """
+
+    cache = token_cache
+
+    def authenticate_credentials(self, key):
+        cached = self.cache.get(key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            self.cache.set(key, (copy.copy(user), token))
+            return user, token
+
+        return self._from_cache(cached)
+
+    async def aauthenticate(self, request):
+        """Async counterpart of authenticate() for plain async Django views."""
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed("Invalid token header.")
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed("Invalid token header.")
+        return await self.aauthenticate_credentials(key)
+
+    async def aauthenticate_credentials(self, key):
+        """Resolve a token without leaving the event loop on in-process cache hits."""
+        cached = self.cache.get_local(key)
+        if cached is None:
+            return await sync_to_async(self.authenticate_credentials)(key)
+        return self._from_cache(cached)
+
+    @staticmethod
+    def _from_cache(cached):
+        user, token = cached
+        if not user.is_active:
+            raise AuthenticationFailed("User inactive or deleted.")
+        return copy.copy(user), token
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class AuthAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "auth_app"
-    verbose_name = "Auth"
\ No newline at end of file
+    verbose_name = "Auth"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,52 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from auth_app.api.authentication import CachedTokenAuthentication
+
+BENCH_EMAIL = "benchmark-token-auth@example.com"
+
+
+class Command(BaseCommand):
+    help = "Compare stock TokenAuthentication with CachedTokenAuthentication."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(
+                email=BENCH_EMAIL, password=None, fullname="Benchmark"
+            )
+            token = Token.objects.create(user=user)
+            request = APIRequestFactory().get(
+                "/api/boards/", HTTP_AUTHORIZATION=f"Token {token.key}"
+            )
+
+            CachedTokenAuthentication.cache.clear()
+            for authentication in (TokenAuthentication(), CachedTokenAuthentication()):
+                self._run(authentication, request, iterations)
+
+            transaction.set_rollback(True)
+
+    def _run(self, authentication, request, iterations):
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                authentication.authenticate(request)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{type(authentication).__name__}: {iterations} requests in {elapsed:.3f}s "
+            f"({elapsed / iterations * 1e6:.1f} us/request, {len(ctx.captured_queries)} queries)"
+        )
+        if isinstance(authentication, CachedTokenAuthentication):
+            self.stdout.write(f"  cache stats: {authentication.cache.stats()}")
@@ -0,0 +1,31 @@
+"""
+auth_app signal handlers.
+
+Keep the cached token authentication in sync with token and user writes.
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .api.authentication import token_cache
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """Drop a token from the cache when it is saved, regenerated or deleted."""
+    token_cache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """Drop all cached tokens of a user when the user changes or is deleted."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+
+    keys = Token.objects.filter(user_id=instance.pk).values_list("key", flat=True)
+    token_cache.invalidate_user(instance.pk, keys if token_cache.shared else ())
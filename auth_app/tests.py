@@ -1,3 +1,94 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from auth_app.api.authentication import CachedTokenAuthentication, TokenCache
+
+User = get_user_model()
+
+
+class CachedTokenAuthenticationTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@example.com", password="pw123456", fullname="User"
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+        self.auth.cache.clear()
+
+    def authenticate(self, key=None):
+        request = APIRequestFactory().get(
+            "/api/boards/", HTTP_AUTHORIZATION=f"Token {key or self.token.key}"
+        )
+        return self.auth.authenticate(request)
+
+    def test_cache_hit_runs_no_queries(self):
+        self.authenticate()
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(token.key, self.token.key)
+        self.assertEqual(self.auth.cache.stats()["hits"], 1)
+        self.assertEqual(self.auth.cache.stats()["misses"], 1)
+
+    def test_token_delete_invalidates(self):
+        self.authenticate()
+        self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_user_deactivation_invalidates(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_user_change_is_visible(self):
+        self.authenticate()
+        self.user.fullname = "Renamed"
+        self.user.save()
+        user, _ = self.authenticate()
+        self.assertEqual(user.fullname, "Renamed")
+
+    def test_returned_user_is_not_the_cached_instance(self):
+        self.authenticate()
+        user, _ = self.authenticate()
+        user.fullname = "Mutated"
+        user, _ = self.authenticate()
+        self.assertEqual(user.fullname, "User")
+
+
+class TokenCacheTests(TestCase):
+
+    def test_lru_eviction_and_ttl(self):
+        user = User(pk=1)
+        cache = TokenCache(max_size=2, ttl=60)
+        cache.set("a", (user, None))
+        cache.set("b", (user, None))
+        cache.get("a")
+        cache.set("c", (user, None))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+        expired = TokenCache(max_size=2, ttl=-1)
+        expired.set("a", (user, None))
+        self.assertIsNone(expired.get("a"))
+
+    @override_settings(CACHES={"shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_shared_cache_revocations_reach_every_worker(self):
+        user = User(pk=1)
+        workers = [TokenCache(max_size=10, ttl=60, cache_alias="shared") for _ in range(2)]
+        workers[0].set("a", (user, None))
+        self.assertIsNotNone(workers[1].get("a"))
+        self.assertIsNotNone(workers[0].get("a"))
+
+        workers[1].invalidate("a")
+        self.assertIsNone(workers[0].get("a"))
+        self.assertIsNone(workers[0].get_local("a"))
@@ -0,0 +1,106 @@
+"""
+boards_app API access resolver.
+
+This module provides a request-scoped view of the boards a user may access.
+Permission classes and validators in boards_app and tasks_app share it, so a
+request loads the user's board memberships with a single query.
+"""
+
+from functools import cached_property
+
+from django.db.models import Exists, OuterRef
+
+from boards_app.models import Board
+
+
+class BoardAccess:
+    """Boards the user created or is a member of, loaded once and memoized."""
+
+    request_attribute = "_board_access"
+
+    def __init__(self, user):
+        self.user = user
+        self._board_member_ids = {}
+
+    @classmethod
+    def for_request(cls, request):
+        """Return the resolver attached to the request, creating it on first use."""
+        http_request = getattr(request, "_request", request)
+        access = getattr(http_request, cls.request_attribute, None)
+        if access is None or access.user is not request.user:
+            access = cls(request.user)
+            setattr(http_request, cls.request_attribute, access)
+        return access
+
+    def _rows(self):
+        is_member = Exists(
+            Board.members.through.objects.filter(
+                board_id=OuterRef("pk"), user_id=self.user.id
+            )
+        )
+        return (
+            Board.objects.accessible_to(self.user)
+            .order_by()
+            .annotate(is_member=is_member)
+            .values_list("id", "is_member", "version")
+        )
+
+    @cached_property
+    def _boards(self):
+        """Map each accessible board ID to (is_member, version)."""
+        if not self.user.is_authenticated:
+            return {}
+        return {board_id: (member, version) for board_id, member, version in self._rows()}
+
+    async def aload(self):
+        """Load the accessible boards with the async ORM (for async views)."""
+        if "_boards" in self.__dict__ or not self.user.is_authenticated:
+            return
+        self.__dict__["_boards"] = {
+            board_id: (member, version) async for board_id, member, version in self._rows()
+        }
+
+    @property
+    def board_ids(self):
+        """Return the IDs of all boards the user created or is a member of."""
+        return self._boards.keys()
+
+    def can_access(self, board_id):
+        """Return True if the user is the creator or a member of the board."""
+        return board_id in self._boards
+
+    def version(self, board_id):
+        """Return the board's version as loaded for this request, or None."""
+        entry = self._boards.get(board_id)
+        return entry[1] if entry is not None else None
+
+    def versions(self):
+        """Return (board_id, version) pairs of all accessible boards, sorted."""
+        return sorted((board_id, entry[1]) for board_id, entry in self._boards.items())
+
+    def prefetch_members(self, board_ids):
+        """Load the member sets of several boards with a single query."""
+        missing = set(board_ids) - self._board_member_ids.keys()
+        if not missing:
+            return
+
+        members = {board_id: set() for board_id in missing}
+        rows = Board.members.through.objects.filter(board_id__in=missing).values_list(
+            "board_id", "user_id"
+        )
+        for board_id, user_id in rows:
+            members[board_id].add(user_id)
+        for board_id, user_ids in members.items():
+            self._board_member_ids[board_id] = frozenset(user_ids)
+
+    def is_member(self, board, user):
+        """Return True if the given user is a member of the board."""
+        if user.id == self.user.id:
+            entry = self._boards.get(board.id)
+            return entry is not None and entry[0]
+
+        if board.id not in self._board_member_ids:
+            self._board_member_ids[board.id] = frozenset(
+                board.members.values_list("id", flat=True)
+            )
+        return user.id in self._board_member_ids[board.id]
@@ -0,0 +1,56 @@
+"""
+boards_app API async views.
+
+Async versions of BoardViewSet.list and BoardViewSet.retrieve for ASGI
+(see core.async_views). They return the same JSON as the viewset and leave
+errors and non-GET methods to it.
+"""
+
+from django.contrib.auth import get_user_model
+
+from boards_app.models import Board
+from core.async_views import async_read_view, json_response
+from tasks_app.api.fast import requested_task_fields, serialize_task_rows, task_values
+from .access import BoardAccess
+from .conditional import etag_matches, make_etag
+from .serializers import BoardListSerializer, UserMiniSerializer
+from .sparse import selection_key
+from .urls import router
+from .views import requested_includes
+
+User = get_user_model()
+
+drf_views = {url.name: url.callback for url in router.urls}
+
+
+@async_read_view(drf_views["boards-list"])
+async def board_list(request, drf_request):
+    """GET /api/boards/"""
+    boards = [board async for board in Board.objects.accessible_to(request.user).aiterator()]
+    return json_response(BoardListSerializer(boards, many=True).data)
+
+
+@async_read_view(drf_views["boards-detail"])
+async def board_detail(request, drf_request, pk):
+    """GET /api/boards/<pk>/"""
+    access = BoardAccess.for_request(request)
+    await access.aload()
+    version = access.version(pk)
+    if version is None:
+        return None
+
+    include = requested_includes(drf_request.query_params)
+    fields = requested_task_fields(drf_request.query_params)
+    etag = make_etag("board", pk, version, *selection_key(include=include, fields=fields))
+    if etag_matches(request, etag):
+        return json_response(None, status=304, headers={"ETag": etag})
+
+    board = await Board.objects.only("id", "title", "created_by").aget(pk=pk)
+    data = {"id": board.id, "title": board.title, "owner_id": board.created_by_id}
+    if include is None or "members" in include:
+        members = User.objects.filter(boards=board).only("id", "email", "fullname")
+        data["members"] = UserMiniSerializer([user async for user in members], many=True).data
+    if include is None or "tasks" in include:
+        tasks = [row async for row in task_values(board.tasks.all(), fields)]
+        data["tasks"] = serialize_task_rows(tasks, fields)
+    return json_response(data, headers={"ETag": etag})
@@ -0,0 +1,34 @@
+"""
+boards_app API conditional requests.
+
+Helpers for strong ETags derived from board versions and for answering
+matching If-None-Match requests with 304 Not Modified.
+"""
+
+import hashlib
+
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    """Return a quoted strong ETag built from the given parts."""
+    raw = ":".join(str(part) for part in parts)
+    return quote_etag(hashlib.sha256(raw.encode()).hexdigest()[:32])
+
+
+def etag_matches(request, etag):
+    """Return True if the request's If-None-Match header matches the ETag."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in etags
+
+
+def not_modified(request, etag):
+    """Return a 304 response if If-None-Match matches the ETag, else None."""
+    if etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
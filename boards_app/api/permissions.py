@@ -6,14 +6,15 @@ This module contains permission classes used by boards_app API views.
 
 from rest_framework.permissions import BasePermission
 
+from .access import BoardAccess
+
 
 class IsBoardMemberOrCreator(BasePermission):
     """Allow object access if the user is the board creator or a board member."""
 
     def has_object_permission(self, request, view, obj):
         """Return True if user is board creator or board member."""
-        user_id = request.user.id
-        return obj.created_by_id == user_id or obj.members.filter(id=user_id).exists()
+        return BoardAccess.for_request(request).can_access(obj.pk)
 
 
 class IsBoardCreatorOnly(BasePermission):
@@ -5,12 +5,10 @@ This module defines contract-based serializers for the boards endpoints.
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count
 from rest_framework import serializers
 
 from boards_app.models import Board
-from tasks_app.api.serializers import TaskReadSerializer
-from tasks_app.models import Task
+from tasks_app.api.fast import serialize_task_rows, task_values
 from .validators import validate_not_empty
 
 User = get_user_model()
@@ -25,13 +23,17 @@ class UserMiniSerializer(serializers.ModelSerializer):
 
 
 class BoardListSerializer(serializers.ModelSerializer):
-    """Response serializer for GET /api/boards/ and POST /api/boards/ (response)."""
+    """
+    Response serializer for GET /api/boards/ and POST /api/boards/ (response).
+
+    The counters are denormalized columns on Board, so no aggregates are run.
+    """
 
     owner_id = serializers.IntegerField(source="created_by_id", read_only=True)
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(read_only=True)
+    tasks_to_do_count = serializers.IntegerField(read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -45,25 +47,16 @@ class BoardListSerializer(serializers.ModelSerializer):
             "owner_id",
         ]
 
-    def get_member_count(self, obj):
-        """Return the number of members on this board."""
-        return obj.members.count()
-
-    def get_ticket_count(self, obj):
-        """Return the number of tasks (tickets) on this board."""
-        return obj.tasks.count()
-
-    def get_tasks_to_do_count(self, obj):
-        """Return the number of tasks in TODO status."""
-        return obj.tasks.filter(status=Task.Status.TODO).count()
 
-    def get_tasks_high_prio_count(self, obj):
-        """Return the number of tasks with HIGH priority."""
-        return obj.tasks.filter(priority=Task.Priority.HIGH).count()
+class BoardDetailSerializer(serializers.ModelSerializer):
+    """
+    Response serializer for GET /api/boards/<id>/.
 
+    The context may carry "include" (which of INCLUDES to embed, default
+    all) and "task_fields" (sparse fieldset of the embedded tasks).
+    """
 
-class BoardDetailSerializer(serializers.ModelSerializer):
-    """Response serializer for GET /api/boards/<id>/."""
+    INCLUDES = ("members", "tasks")
 
     owner_id = serializers.IntegerField(source="created_by_id", read_only=True)
     members = UserMiniSerializer(many=True, read_only=True)
@@ -73,14 +66,18 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         model = Board
         fields = ["id", "title", "owner_id", "members", "tasks"]
 
+    def get_fields(self):
+        fields = super().get_fields()
+        include = self.context.get("include")
+        if include is not None:
+            for name in set(self.INCLUDES).difference(include):
+                del fields[name]
+        return fields
+
     def get_tasks(self, obj):
-        """Return the board's tasks with comment counts."""
-        qs = (
-            obj.tasks.all()
-            .select_related("assigned_to", "reviewer")
-            .annotate(comments_count=Count("task_comments"))
-        )
-        return TaskReadSerializer(qs, many=True, context=self.context).data
+        """Return the board's tasks like TaskReadSerializer (tasks_app.api.fast)."""
+        fields = self.context.get("task_fields")
+        return serialize_task_rows(task_values(obj.tasks.all(), fields), fields)
 
 
 class BoardPatchResponseSerializer(serializers.ModelSerializer):
@@ -0,0 +1,36 @@
+"""
+boards_app API sparse fieldsets.
+
+Parsing of the comma-separated ?fields= and ?include= query parameters used
+by the board and task read endpoints. Without the parameter the endpoints
+return their full, documented representation.
+"""
+
+from rest_framework.exceptions import ValidationError
+
+
+def parse_selection(params, name, choices):
+    """
+    Return the choices named in query parameter name, in choices order.
+
+    Returns None if the parameter is absent and an empty tuple if it is
+    empty; unknown names are rejected with a 400.
+    """
+    value = params.get(name)
+    if value is None:
+        return None
+
+    names = {part.strip() for part in value.split(",")} - {""}
+    unknown = names.difference(choices)
+    if unknown:
+        raise ValidationError({name: f"Unbekannte Werte: {', '.join(sorted(unknown))}."})
+    return tuple(choice for choice in choices if choice in names)
+
+
+def selection_key(**selections):
+    """Return ETag parts for the given selections, skipping absent ones."""
+    return [
+        f"{name}={','.join(selection)}"
+        for name, selection in sorted(selections.items())
+        if selection is not None
+    ]
@@ -0,0 +1,124 @@
+"""
+boards_app API streams.
+
+Async Server-Sent Events endpoint that streams board change events to
+connected board members. Served efficiently through core/asgi.py: an idle
+connection is a suspended coroutine waiting on its subscription.
+
+EventSource cannot send headers, so browsers authenticate with ?token=. A
+query string ends up in access logs and proxy caches, so it only accepts a
+short-lived stream token for one board (POST /api/boards/<id>/events/token/),
+never the API token itself. Access is checked again on every heartbeat,
+resync and board event; the stream ends once the user lost access.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+
+from auth_app.api.authentication import CachedTokenAuthentication
+from boards_app.events import RESYNC_EVENT, get_broker, get_events_settings
+from boards_app.models import Board
+
+User = get_user_model()
+
+STREAM_TOKEN_SALT = "kanmind.board-events"
+
+# Sent before the stream ends because the user lost access to the board.
+REVOKED_FRAME = "event: access-revoked\ndata: {}\n\n"
+
+
+def make_stream_token(user, board_id):
+    """Return a signed token letting user open the event stream of board_id."""
+    return signing.dumps({"user": user.pk, "board": board_id}, salt=STREAM_TOKEN_SALT)
+
+
+async def _read_stream_token(value, board_id):
+    """Return the active user a stream token was issued to, or None."""
+    max_age = get_events_settings()["STREAM_TOKEN_MAX_AGE"]
+    try:
+        data = signing.loads(value, salt=STREAM_TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:
+        return None
+    if data.get("board") != board_id:
+        return None
+    return await User.objects.filter(pk=data.get("user"), is_active=True).afirst()
+
+
+async def _authenticate(request, board_id):
+    """Authenticate by Authorization header or by ?token= stream token."""
+    header = request.headers.get("Authorization", "")
+    keyword, _, key = header.partition(" ")
+    if keyword == CachedTokenAuthentication.keyword and key:
+        try:
+            user, _ = await CachedTokenAuthentication().aauthenticate_credentials(key.strip())
+        except AuthenticationFailed:
+            return None
+        return user
+
+    token = request.GET.get("token")
+    if not token:
+        return None
+    return await _read_stream_token(token, board_id)
+
+
+async def _has_access(user, board_id):
+    return await Board.objects.accessible_to(user).filter(pk=board_id).aexists()
+
+
+def _format_event(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+def _needs_access_check(batch):
+    """Heartbeats, resyncs and board events (membership, deletion) re-check access."""
+    return not batch or any(
+        event["type"] == RESYNC_EVENT["type"] or event["type"].startswith("board.")
+        for event in batch
+    )
+
+
+async def _stream(user, board_id):
+    """Yield SSE frames for a board until the client disconnects or loses access."""
+    heartbeat = get_events_settings()["HEARTBEAT"]
+    subscription = get_broker().subscribe(board_id)
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            batch = await subscription.next_batch(heartbeat)
+            if _needs_access_check(batch) and not await _has_access(user, board_id):
+                yield REVOKED_FRAME
+                return
+            if not batch:
+                yield ": keep-alive\n\n"
+                continue
+            yield "".join(_format_event(event) for event in batch)
+    finally:
+        subscription.close()
+
+
+async def board_events(request, board_id):
+    """GET /api/boards/<board_id>/events/ as text/event-stream."""
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    user = await _authenticate(request, board_id)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."}, status=401
+        )
+
+    if not await Board.objects.filter(pk=board_id).aexists():
+        return JsonResponse({"detail": "Board wurde nicht gefunden."}, status=404)
+    if not await _has_access(user, board_id):
+        return JsonResponse(
+            {"detail": "Du bist weder Board-Member noch Owner."}, status=403
+        )
+
+    response = StreamingHttpResponse(_stream(user, board_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
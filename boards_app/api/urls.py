@@ -1,12 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import SimpleRouter
 
-from .views import BoardViewSet, EmailCheckView
+from .streams import board_events
+from .views import BoardViewSet, EmailCheckView, UserSearchView
 
 router = SimpleRouter()
 router.register("boards", BoardViewSet, basename="boards")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("boards/<int:board_id>/events/", board_events),
     path("email-check/", EmailCheckView.as_view()),
+    path("users/search/", UserSearchView.as_view()),
 ]
\ No newline at end of file
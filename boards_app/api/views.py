@@ -7,21 +7,38 @@ View classes:
 - BoardViewSet:
   CRUD for boards with access limited to board members or the board creator.
   Responses are aligned with the endpoint documentation by returning different
-  serializers for list/retrieve and for create/update responses.
+  serializers for list/retrieve and for create/update responses. Board detail
+  responses carry an ETag derived from Board.version and accept ?include=
+  (members, tasks) and ?fields= (fields of the embedded tasks). The export
+  action streams the board with its tasks and comments as NDJSON; the
+  events_token action issues short-lived tokens for the event stream.
 
 - EmailCheckView:
   Helper endpoint to look up a user by email (case-insensitive). Requires
   authentication and returns a minimal user payload on success.
+
+- UserSearchView:
+  Prefix autocomplete on email and fullname for the member picker. Both
+  lookups use index range scans and a result limit (see
+  CustomUserManager.search).
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from boards_app.events import get_events_settings, publish_board_event
 from boards_app.models import Board
+from boards_app.transfer import export_board
+from tasks_app.api.fast import requested_task_fields
+from .access import BoardAccess
+from .conditional import make_etag, not_modified
 from .permissions import IsBoardCreatorOnly, IsBoardMemberOrCreator
 from .serializers import (
     BoardDetailSerializer,
@@ -29,24 +46,37 @@ from .serializers import (
     BoardPatchResponseSerializer,
     BoardWriteSerializer,
 )
+from .sparse import parse_selection, selection_key
+from .streams import make_stream_token
 
 User = get_user_model()
 
 
+def requested_includes(params):
+    """Return the board detail relations selected by ?include=, or None for all."""
+    return parse_selection(params, "include", BoardDetailSerializer.INCLUDES)
+
+
 class BoardViewSet(viewsets.ModelViewSet):
     """CRUD operations for boards limited to authorized users."""
 
     permission_classes = [IsAuthenticated, IsBoardMemberOrCreator]
 
     def get_queryset(self):
-        user = self.request.user
         """Return querysets depending on action."""
+        user = self.request.user
 
         if self.action == "list":
-            return Board.objects.filter(
-                Q(members=user) | Q(created_by=user)
-            ).distinct()
-            
+            return Board.objects.accessible_to(user)
+
+        if self.action == "retrieve":
+            queryset = Board.objects.only("id", "title", "created_by")
+            include = requested_includes(self.request.query_params)
+            if include is None or "members" in include:
+                members = User.objects.only("id", "email", "fullname")
+                queryset = queryset.prefetch_related(Prefetch("members", queryset=members))
+            return queryset
+
         return Board.objects.all()
 
     def get_serializer_class(self):
@@ -57,16 +87,80 @@ class BoardViewSet(viewsets.ModelViewSet):
             return BoardDetailSerializer
         return BoardListSerializer
 
+    def get_serializer_context(self):
+        """Pass the ?include= and ?fields= selections to BoardDetailSerializer."""
+        context = super().get_serializer_context()
+        if self.action == "retrieve":
+            context["include"] = requested_includes(self.request.query_params)
+            context["task_fields"] = requested_task_fields(self.request.query_params)
+        return context
+
     def get_permissions(self):
         """Use stricter permissions for destructive actions."""
         if self.action == "destroy":
             return [IsAuthenticated(), IsBoardCreatorOnly()]
         return [IsAuthenticated(), IsBoardMemberOrCreator()]
 
+    def retrieve(self, request, *args, **kwargs):
+        """Return the board detail, or 304 if the client's ETag is current."""
+        try:
+            board_id = int(kwargs[self.lookup_field])
+        except (KeyError, ValueError):
+            return super().retrieve(request, *args, **kwargs)
+
+        version = BoardAccess.for_request(request).version(board_id)
+        if version is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        params = request.query_params
+        selection = selection_key(
+            include=requested_includes(params), fields=requested_task_fields(params)
+        )
+        etag = make_etag("board", board_id, version, *selection)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        response = super().retrieve(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+    @action(detail=True, methods=["get"])
+    def export(self, request, pk=None):
+        """Stream the board, its members, tasks and comments as NDJSON."""
+        board = self.get_object()
+        response = StreamingHttpResponse(
+            export_board(board), content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = f'attachment; filename="board-{board.pk}.ndjson"'
+        return response
+
+    @action(detail=True, methods=["post"], url_path="events/token")
+    def events_token(self, request, pk=None):
+        """Issue a short-lived ?token= for the board's event stream (EventSource)."""
+        board = self.get_object()
+        return Response(
+            {
+                "token": make_stream_token(request.user, board.pk),
+                "expires_in": get_events_settings()["STREAM_TOKEN_MAX_AGE"],
+            }
+        )
+
     def perform_create(self, serializer):
         """Assign the current user as the board creator."""
         serializer.save(created_by=self.request.user)
 
+    def perform_update(self, serializer):
+        """Save the board and notify subscribers."""
+        board = serializer.save()
+        publish_board_event(board.pk, "board.updated", id=board.pk)
+
+    def perform_destroy(self, instance):
+        """Delete the board and notify subscribers."""
+        board_id = instance.pk
+        instance.delete()
+        publish_board_event(board_id, "board.deleted", id=board_id)
+
     def create(self, request, *args, **kwargs):
         """Create a board and return a contract-compliant response."""
         response = super().create(request, *args, **kwargs)
@@ -117,7 +211,7 @@ class EmailCheckView(APIView):
             )
 
         try:
-            user = User.objects.get(email__iexact=email)
+            user = User.objects.get_by_email(email)
         except User.DoesNotExist:
             return Response(
                 {"detail": "Email not found."},
@@ -128,3 +222,25 @@ class EmailCheckView(APIView):
             {"id": user.id, "email": user.email, "fullname": user.fullname},
             status=status.HTTP_200_OK,
         )
+
+
+class UserSearchView(APIView):
+    """Autocomplete users by email or fullname prefix (query params: ?q=...&limit=...)."""
+
+    permission_classes = [IsAuthenticated]
+    default_limit = 10
+    max_limit = 25
+
+    def get(self, request):
+        """Return up to limit users matching the prefix as id/email/fullname dicts."""
+        term = request.query_params.get("q", "").strip()
+        if not term:
+            raise ValidationError({"q": "Suchbegriff fehlt."})
+
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Ungültiges Limit."})
+        limit = max(1, min(limit, self.max_limit))
+
+        return Response(User.objects.search(term, limit))
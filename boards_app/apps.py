@@ -4,3 +4,6 @@ class BoardsAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "boards_app"
     verbose_name = "Boards"
+
+    def ready(self):
+        from . import signals  # noqa: F401
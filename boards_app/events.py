@@ -0,0 +1,181 @@
+"""
+Board change events.
+
+Writes publish small change events ("task.updated", "comment.created", ...)
+per board through a pluggable broker. Subscribers are asyncio consumers, e.g.
+the Server-Sent Events endpoint in boards_app.api.streams.
+
+Events are hints: clients refetch the referenced objects. This allows bursts
+to be coalesced per object and a slow subscriber to be told to resync
+instead of buffering without bound.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+DEFAULTS = {
+    "BROKER": "boards_app.events.InProcessBroker",
+    "MAX_PENDING": 100,
+    "COALESCE_WINDOW": 0.1,
+    "HEARTBEAT": 15,
+    "STREAM_TOKEN_MAX_AGE": 60,
+}
+
+RESYNC_EVENT = {"type": "resync"}
+
+
+def get_events_settings():
+    """Return BOARD_EVENTS from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "BOARD_EVENTS", {})}
+
+
+class Subscription:
+    """
+    A subscriber's pending events for one board, owned by an event loop.
+
+    Pending events are keyed by the object they refer to, so a burst of
+    updates to one task is delivered once. If more than max_pending distinct
+    objects pile up, the queue is dropped and a single resync event is sent.
+    """
+
+    def __init__(self, broker, board_id, loop, max_pending, coalesce_window):
+        self.broker = broker
+        self.board_id = board_id
+        self.loop = loop
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self.overflowed = False
+        self._pending = OrderedDict()
+        self._wakeup = asyncio.Event()
+
+    def deliver(self, event):
+        """Queue an event. Must be called on the subscription's event loop."""
+        if not self.overflowed:
+            key = (event["type"].split(".", 1)[0], event.get("id"))
+            self._pending.pop(key, None)
+            self._pending[key] = event
+            if len(self._pending) > self.max_pending:
+                self._pending.clear()
+                self.overflowed = True
+        self._wakeup.set()
+
+    async def next_batch(self, timeout):
+        """Wait for events and return them coalesced; [] after a quiet timeout."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        if self.coalesce_window:
+            await asyncio.sleep(self.coalesce_window)
+
+        self._wakeup.clear()
+        if self.overflowed:
+            self.overflowed = False
+            return [RESYNC_EVENT]
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """Fan out events to subscriptions held by this process."""
+
+    def __init__(self, max_pending=DEFAULTS["MAX_PENDING"], coalesce_window=DEFAULTS["COALESCE_WINDOW"]):
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id):
+        """Register a subscription on the running event loop."""
+        subscription = Subscription(
+            self,
+            board_id,
+            asyncio.get_running_loop(),
+            self.max_pending,
+            self.coalesce_window,
+        )
+        with self._lock:
+            self._subscriptions.setdefault(board_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.board_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.board_id]
+
+    def subscriber_count(self, board_id):
+        with self._lock:
+            return len(self._subscriptions.get(board_id, ()))
+
+    def publish(self, board_id, event):
+        """Deliver an event to every subscriber of the board. Thread-safe."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+
+class LoopbackBroker(InProcessBroker):
+    """
+    Local stand-in for a multi-node backend such as Redis pub/sub.
+
+    Events are serialized to JSON and handed to a background thread before
+    delivery, like a message that leaves the process and comes back. This
+    surfaces serialization and cross-thread issues without external services.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._outbox = queue.Queue()
+        threading.Thread(target=self._pump, name="board-events", daemon=True).start()
+
+    def publish(self, board_id, event):
+        self._outbox.put(json.dumps({"board": board_id, "event": event}).encode())
+
+    def _pump(self):
+        while True:
+            message = json.loads(self._outbox.get())
+            super().publish(message["board"], message["event"])
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the process-wide broker configured in BOARD_EVENTS."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = get_events_settings()
+                _broker = import_string(config["BROKER"])(
+                    max_pending=config["MAX_PENDING"],
+                    coalesce_window=config["COALESCE_WINDOW"],
+                )
+    return _broker
+
+
+def publish_board_event(board_id, event_type, **payload):
+    """Publish an event for a board once the current transaction commits."""
+    event = {"type": event_type, "board": board_id, **payload}
+    transaction.on_commit(lambda: get_broker().publish(board_id, event))
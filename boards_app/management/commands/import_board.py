@@ -0,0 +1,46 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from boards_app.transfer import BoardImporter, BoardImportError
+
+
+class Command(BaseCommand):
+    help = "Import a board from an NDJSON export (GET /api/boards/<id>/export/)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Export file, or - to read from stdin.")
+        parser.add_argument("--owner", help="Email of the new board's creator (default: as exported).")
+        parser.add_argument(
+            "--create-users",
+            action="store_true",
+            help="Create users missing in this database instead of aborting.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        owner = None
+        if options["owner"]:
+            User = get_user_model()
+            try:
+                owner = User.objects.get_by_email(options["owner"])
+            except User.DoesNotExist:
+                raise CommandError(f"Unknown owner {options['owner']}.")
+
+        importer = BoardImporter(
+            owner=owner,
+            create_users=options["create_users"],
+            batch_size=options["batch_size"],
+        )
+        try:
+            if options["path"] == "-":
+                board = importer.run(sys.stdin)
+            else:
+                with open(options["path"], encoding="utf-8") as lines:
+                    board = importer.run(lines)
+        except (OSError, BoardImportError) as exc:
+            raise CommandError(str(exc))
+
+        counts = ", ".join(f"{count} {name.replace('_', ' ')}" for name, count in importer.counts.items())
+        self.stdout.write(self.style.SUCCESS(f'Imported board {board.pk} "{board.title}": {counts}.'))
@@ -1,10 +1,34 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F, Q
+
+
+class BoardQuerySet(models.QuerySet):
+    """QuerySet helpers for boards."""
+
+    def accessible_to(self, user):
+        """Return boards where the user is a member or the creator."""
+        member_board_ids = Board.members.through.objects.filter(
+            user_id=user.id
+        ).values("board_id")
+        return self.filter(Q(pk__in=member_board_ids) | Q(created_by_id=user.id))
+
+    def touch(self, **changes):
+        """Bump the version of the selected boards, applying extra updates."""
+        return self.update(version=F("version") + 1, **changes)
 
 
 class Board(models.Model):
     """A Kanban board with members and a creator."""
-    
+
+    COUNTER_FIELDS = (
+        "member_count",
+        "ticket_count",
+        "tasks_to_do_count",
+        "tasks_high_prio_count",
+        "version",
+    )
+
     title = models.CharField(max_length=255)
 
     created_by = models.ForeignKey(
@@ -21,10 +45,36 @@ class Board(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Denormalized counters, maintained by tasks_app.models and
+    # boards_app.signals; repaired by the reconcile_counters command.
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+    ticket_count = models.PositiveIntegerField(default=0, editable=False)
+    tasks_to_do_count = models.PositiveIntegerField(default=0, editable=False)
+    tasks_high_prio_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Generation counter bumped on every change to the board, its members,
+    # tasks or comments. Used to build ETags for conditional GETs.
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    objects = BoardQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Board"
         verbose_name_plural = "Boards"
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
+
+    def save(self, **kwargs):
+        """Save the board without overwriting concurrently updated counters."""
+        adding = self._state.adding
+        if not adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(**kwargs)
+        if not adding:
+            Board.objects.filter(pk=self.pk).touch()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+boards_app signal handlers.
+
+Keep Board.member_count in sync with the members relation and bump board
+versions when data embedded in board responses changes.
+"""
+
+from django.conf import settings
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from .models import Board
+
+Membership = Board.members.through
+
+
+def recount_members(board_ids):
+    """Recompute member_count for the given boards with one UPDATE."""
+    counts = (
+        Membership.objects.filter(board_id=OuterRef("pk"))
+        .order_by()
+        .values("board_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Board.objects.filter(pk__in=board_ids).touch(
+        member_count=Coalesce(Subquery(counts), 0)
+    )
+
+
+@receiver(m2m_changed, sender=Membership)
+def update_member_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Apply membership changes to Board.member_count.
+
+    Adds only report newly created rows, so they are applied with F().
+    Removals and clears may name rows that did not exist and are recounted.
+    """
+    if reverse and action == "pre_clear":
+        instance._cleared_board_ids = list(
+            instance.boards.values_list("id", flat=True)
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_add" and not pk_set:
+        return
+
+    if reverse:
+        board_ids = pk_set or getattr(instance, "_cleared_board_ids", [])
+    else:
+        board_ids = [instance.pk]
+
+    if action == "post_add":
+        increment = 1 if reverse else len(pk_set)
+        Board.objects.filter(pk__in=board_ids).touch(
+            member_count=F("member_count") + increment
+        )
+    else:
+        recount_members(board_ids)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def touch_user_boards(sender, instance, created, update_fields=None, **kwargs):
+    """Bump boards that embed the user's name or email in their responses."""
+    if created or (update_fields is not None and set(update_fields) == {"last_login"}):
+        return
+
+    Board.objects.filter(
+        Q(members=instance) | Q(tasks__assigned_to=instance) | Q(tasks__reviewer=instance)
+    ).touch()
@@ -1,3 +1,395 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models.functions import Lower
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from boards_app.events import RESYNC_EVENT, InProcessBroker, get_broker
+from boards_app.models import Board
+from boards_app.transfer import BoardImporter, export_board
+from tasks_app.models import Comment, Task
+
+User = get_user_model()
+
+
+class BoardListQueryCountTests(APITestCase):
+    """GET /api/boards/ must not issue queries per board."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.other = User.objects.create_user(
+            email="member@example.com", password="pw123456", fullname="Member"
+        )
+        self.client.force_authenticate(self.user)
+
+    def _create_boards(self, count):
+        for index in range(count):
+            board = Board.objects.create(title=f"Board {index}", created_by=self.user)
+            board.members.set([self.user, self.other])
+            Task.objects.create(
+                board=board,
+                title="todo",
+                status=Task.Status.TODO,
+                priority=Task.Priority.HIGH,
+                created_by=self.user,
+            )
+            Task.objects.create(
+                board=board,
+                title="done",
+                status=Task.Status.DONE,
+                created_by=self.user,
+            )
+
+    def test_query_count_is_constant(self):
+        self._create_boards(1)
+        with self.assertNumQueries(1):
+            self.client.get("/api/boards/")
+
+        self._create_boards(10)
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/boards/")
+
+        self.assertEqual(len(response.data), 11)
+
+    def test_counters(self):
+        self._create_boards(1)
+        response = self.client.get("/api/boards/")
+
+        board = response.data[0]
+        self.assertEqual(board["member_count"], 2)
+        self.assertEqual(board["ticket_count"], 2)
+        self.assertEqual(board["tasks_to_do_count"], 1)
+        self.assertEqual(board["tasks_high_prio_count"], 1)
+
+    def test_lists_created_boards_without_membership(self):
+        Board.objects.create(title="Solo", created_by=self.user)
+        foreign = Board.objects.create(title="Foreign", created_by=self.other)
+        foreign.members.set([self.other])
+
+        response = self.client.get("/api/boards/")
+
+        self.assertEqual([b["title"] for b in response.data], ["Solo"])
+        self.assertEqual(response.data[0]["member_count"], 0)
+
+
+class BoardDetailSelectionTests(APITestCase):
+    """?include= and ?fields= on GET /api/boards/<id>/."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.board = Board.objects.create(title="Board", created_by=self.user)
+        self.board.members.set([self.user])
+        Task.objects.create(
+            board=self.board, title="Task", description="x" * 1000, created_by=self.user,
+            assigned_to=self.user,
+        )
+        self.url = f"/api/boards/{self.board.id}/"
+        self.client.force_authenticate(self.user)
+
+    def get(self, query=""):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{self.url}{query}")
+        return response, " ".join(query["sql"] for query in queries)
+
+    def test_default_embeds_members_and_full_tasks(self):
+        response, _ = self.get()
+        self.assertEqual(list(response.data), ["id", "title", "owner_id", "members", "tasks"])
+        self.assertEqual(len(response.data["tasks"][0]), 10)
+
+    def test_include_skips_relations_and_their_queries(self):
+        response, sql = self.get("?include=members")
+        self.assertEqual(list(response.data), ["id", "title", "owner_id", "members"])
+        self.assertNotIn("tasks_app_task", sql)
+        self.assertNotIn('"password"', sql)
+
+        response, sql = self.get("?include=")
+        self.assertEqual(list(response.data), ["id", "title", "owner_id"])
+        self.assertNotIn("users_app_user", sql)
+
+    def test_fields_trim_embedded_tasks(self):
+        response, sql = self.get("?include=tasks&fields=title,status")
+        task = self.board.tasks.get()
+        self.assertEqual(response.data["tasks"], [{"id": task.id, "title": "Task", "status": "to-do"}])
+        self.assertNotIn('"description"', sql)
+
+        full, _ = self.get()
+        self.assertNotEqual(response["ETag"], full["ETag"])
+        self.assertEqual(self.get("?include=nothing")[0].status_code, 400)
+
+
+class BoardEventBrokerTests(TestCase):
+
+    async def test_bursts_are_coalesced_per_object(self):
+        broker = InProcessBroker(max_pending=10, coalesce_window=0)
+        subscription = broker.subscribe(1)
+
+        for title in ("a", "b", "c"):
+            broker.publish(1, {"type": "task.updated", "id": 7, "title": title})
+        broker.publish(1, {"type": "comment.created", "id": 3})
+        broker.publish(2, {"type": "task.updated", "id": 8})
+
+        batch = await subscription.next_batch(timeout=1)
+        self.assertEqual(
+            batch,
+            [
+                {"type": "task.updated", "id": 7, "title": "c"},
+                {"type": "comment.created", "id": 3},
+            ],
+        )
+        self.assertEqual(await subscription.next_batch(timeout=0.01), [])
+
+    async def test_slow_consumer_gets_resync(self):
+        broker = InProcessBroker(max_pending=2, coalesce_window=0)
+        subscription = broker.subscribe(1)
+
+        for task_id in range(5):
+            broker.publish(1, {"type": "task.updated", "id": task_id})
+
+        self.assertEqual(await subscription.next_batch(timeout=1), [RESYNC_EVENT])
+
+        subscription.close()
+        self.assertEqual(broker.subscriber_count(1), 0)
+
+
+class BoardEventStreamTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(title="Board", created_by=self.user)
+        self.url = f"/api/boards/{self.board.id}/events/"
+
+    async def test_requires_access(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+        other = await User.objects.acreate(email="other@example.com", fullname="Other")
+        token = await Token.objects.acreate(user=other)
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Token {token.key}"}
+        )
+        self.assertEqual(response.status_code, 403)
+
+    async def stream_token(self, user):
+        token = await Token.objects.acreate(user=user) if user != self.user else self.token
+        response = await self.async_client.post(
+            f"/api/boards/{self.board.id}/events/token/", headers={"Authorization": f"Token {token.key}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["token"]
+
+    async def test_query_accepts_only_stream_tokens(self):
+        response = await self.async_client.get(f"{self.url}?token={self.token.key}")
+        self.assertEqual(response.status_code, 401)
+
+        stream_token = await self.stream_token(self.user)
+        other = await Board.objects.acreate(title="Other", created_by=self.user)
+        response = await self.async_client.get(f"/api/boards/{other.id}/events/?token={stream_token}")
+        self.assertEqual(response.status_code, 401)
+
+        with override_settings(BOARD_EVENTS={"STREAM_TOKEN_MAX_AGE": -1}):
+            response = await self.async_client.get(f"{self.url}?token={stream_token}")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_ends_when_access_is_lost(self):
+        member = await User.objects.acreate(email="member@example.com", fullname="Member")
+        await self.board.members.aadd(member)
+        with override_settings(BOARD_EVENTS={"HEARTBEAT": 0.01}):
+            response = await self.async_client.get(f"{self.url}?token={await self.stream_token(member)}")
+            stream = aiter(response.streaming_content)
+            self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+            self.assertEqual(await anext(stream), b": keep-alive\n\n")
+
+            await self.board.members.aremove(member)
+            self.assertIn(b"event: access-revoked", await anext(stream))
+            with self.assertRaises(StopAsyncIteration):
+                await anext(stream)
+
+    async def test_streams_published_events(self):
+        response = await self.async_client.get(f"{self.url}?token={await self.stream_token(self.user)}")
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+
+        frame = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        get_broker().publish(self.board.id, {"type": "task.created", "id": 1})
+
+        self.assertIn(b"event: task.created", await asyncio.wait_for(frame, 2))
+        await stream.aclose()
+
+
+class BoardTransferTests(APITestCase):
+    """NDJSON export and import_board round trip."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.member = User.objects.create_user(
+            email="member@example.com", password="pw123456", fullname="Member"
+        )
+        self.board = Board.objects.create(title="Board", created_by=self.user)
+        self.board.members.set([self.user, self.member])
+        for index in range(5):
+            task = Task.objects.create(
+                board=self.board,
+                title=f"Task {index}",
+                priority=Task.Priority.HIGH if index % 2 else Task.Priority.LOW,
+                assigned_to=self.member if index == 3 else None,
+                created_by=self.user,
+            )
+            for number in range(index):
+                Comment.objects.create(task=task, author=self.member, text=f"{index}.{number}")
+        self.client.force_authenticate(self.user)
+
+    def import_lines(self, lines, *args):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as export:
+            export.writelines(lines)
+            export.flush()
+            call_command("import_board", export.name, *args, stdout=StringIO())
+        return Board.objects.latest("pk")
+
+    def test_export_streams_ndjson(self):
+        response = self.client.get(f"/api/boards/{self.board.pk}/export/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        types = [record["type"] for record in records]
+        self.assertEqual(types[:5], ["board", "user", "user", "member", "member"])
+        self.assertEqual(types.count("task"), 5)
+        self.assertEqual(types.count("comment"), 10)
+
+        outsider = User.objects.create_user(email="out@example.com", fullname="Out")
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(f"/api/boards/{self.board.pk}/export/").status_code, 403)
+
+    def test_round_trip_in_small_blocks(self):
+        board = self.import_lines(export_board(self.board, chunk_size=2), "--batch-size", "2")
+
+        self.assertNotEqual(board.pk, self.board.pk)
+        self.assertEqual(board.created_by, self.user)
+        self.assertEqual(set(board.members.all()), {self.user, self.member})
+        self.assertEqual(
+            (board.member_count, board.ticket_count, board.tasks_high_prio_count), (2, 5, 2)
+        )
+        tasks = {task.title: task for task in board.tasks.all()}
+        self.assertEqual(tasks["Task 3"].assigned_to, self.member)
+        for index in range(5):
+            task = tasks[f"Task {index}"]
+            self.assertEqual(task.comments_count, index)
+            self.assertEqual(
+                sorted(task.task_comments.values_list("text", flat=True)),
+                [f"{index}.{number}" for number in range(index)],
+            )
+
+    def test_task_map_only_holds_the_current_block(self):
+        board = Board.objects.create(title="Quiet", created_by=self.user)
+        Task.objects.bulk_create(
+            Task(board=board, title=f"Quiet {index}", created_by=self.user) for index in range(5)
+        )
+        importer = BoardImporter(batch_size=10)
+        imported = importer.run(export_board(board, chunk_size=2))
+
+        self.assertEqual(imported.tasks.count(), 5)
+        self.assertLessEqual(len(importer.tasks), 2)
+
+    def test_users_are_matched_by_email_ignoring_case(self):
+        lines = [line.replace("member@example.com", "Member@Example.com") for line in export_board(self.board)]
+        users = User.objects.count()
+        board = self.import_lines(lines)
+        self.assertEqual(User.objects.count(), users)
+        self.assertEqual(set(board.members.all()), {self.user, self.member})
+
+    def test_unknown_users_abort_unless_created(self):
+        lines = [line.replace("member@example.com", "new@example.com") for line in export_board(self.board)]
+        boards = Board.objects.count()
+        with self.assertRaisesMessage(CommandError, "new@example.com"):
+            self.import_lines(lines)
+        self.assertEqual(Board.objects.count(), boards)
+
+        board = self.import_lines(lines, "--create-users", "--owner", "member@example.com")
+        self.assertEqual(board.created_by, self.member)
+        new_user = User.objects.get(email="new@example.com")
+        self.assertFalse(new_user.has_usable_password())
+        self.assertIn(new_user, board.members.all())
+
+
+class UserLookupTests(APITestCase):
+    """Email check and member search use the Lower() expression indexes."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="Anna.Schmidt@Example.com", password="pw123456", fullname="Anna Schmidt"
+        )
+        self.others = [
+            User.objects.create_user(email=email, password="pw123456", fullname=fullname)
+            for email, fullname in [
+                ("andreas@example.com", "Zoe Anders"),
+                ("bernd@example.com", "anja Becker"),
+                ("berta@example.com", "Berta Brandt"),
+            ]
+        ]
+        self.client.force_authenticate(self.user)
+
+    def search(self, query):
+        response = self.client.get(f"/api/users/search/?{query}")
+        return response.status_code, response.json()
+
+    def test_email_check_ignores_case(self):
+        response = self.client.get("/api/email-check/?email=anna.schmidt@example.COM")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], self.user.id)
+
+    def test_lookups_match_non_ascii_letters(self):
+        umlaut = User.objects.create_user(
+            email="JÖRG@example.com", password="pw123456", fullname="Özlem Jörg"
+        )
+        response = self.client.get("/api/email-check/?email=jÖrg@example.com")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], umlaut.id)
+
+        self.assertEqual([row["id"] for row in self.search("q=Özl")[1]], [umlaut.id])
+        self.assertEqual([row["id"] for row in self.search("q=JÖ")[1]], [umlaut.id])
+
+    def test_search_matches_email_then_fullname_prefix(self):
+        status, data = self.search("q=AN")
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [row["email"] for row in data],
+            ["andreas@example.com", self.user.email, "bernd@example.com"],
+        )
+        self.assertEqual(data[0], {"id": self.others[0].id, "email": "andreas@example.com", "fullname": "Zoe Anders"})
+
+        self.assertEqual(len(self.search("q=an&limit=2")[1]), 2)
+        self.assertEqual(self.search("q=anz")[1], [])
+
+    def test_search_validates_parameters(self):
+        self.assertEqual(self.search("q=%20")[0], 400)
+        self.assertEqual(self.search("q=an&limit=x")[0], 400)
+        self.assertEqual(len(self.search("q=an&limit=0")[1]), 1)
+
+    def test_lookups_use_the_expression_indexes(self):
+        plans = [
+            User.objects.alias(key=Lower("email")).filter(key="x").explain(),
+            User.objects.alias(key=Lower("fullname")).filter(key__gte="a", key__lt="b").explain(),
+        ]
+        if connection.vendor == "sqlite":
+            self.assertIn("user_email_lower_idx", plans[0])
+            self.assertIn("user_fullname_lower_idx", plans[1])
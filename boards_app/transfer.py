@@ -0,0 +1,303 @@
+"""
+Board export and import as NDJSON.
+
+An export is one JSON object per line, in this order:
+
+- {"type": "board", "format": 1, "block_size": ..., ...}
+- {"type": "user", "id": ..., "email": ..., "fullname": ...} for every user
+  the board refers to
+- {"type": "member", "user": <user id>} per member
+- blocks of {"type": "task", ...} lines, each followed by the
+  {"type": "comment", ...} lines of its tasks
+
+IDs in the file are those of the exporting database. The importer maps users
+by email (ignoring case) and tasks by position, so it only has to remember
+the current block of tasks: a block ends after its comments or after
+block_size tasks. Both directions run in constant memory regardless of board
+size.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from boards_app.models import Board
+from core.utils import chunks
+from tasks_app.counters import recount_boards, task_counter_expressions
+from tasks_app.models import Comment, Task
+
+User = get_user_model()
+
+FORMAT_VERSION = 1
+CHUNK_SIZE = 2000
+
+TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "assigned_to",
+    "reviewer",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+COMMENT_FIELDS = ("id", "task", "author", "text", "created_at")
+
+
+class BoardImportError(ValueError):
+    """Raised for malformed or inconsistent import files."""
+
+
+def _line(kind, data):
+    return json.dumps({"type": kind, **data}, cls=DjangoJSONEncoder) + "\n"
+
+
+def export_board(board, chunk_size=CHUNK_SIZE):
+    """Yield the NDJSON lines of a board export."""
+    yield _line(
+        "board",
+        {
+            "format": FORMAT_VERSION,
+            "block_size": chunk_size,
+            "id": board.pk,
+            "title": board.title,
+            "created_by": board.created_by_id,
+            "created_at": board.created_at,
+        },
+    )
+
+    tasks = Task.objects.filter(board=board)
+    referenced = (
+        Q(pk=board.created_by_id)
+        | Q(pk__in=Board.members.through.objects.filter(board=board).values("user_id"))
+        | Q(pk__in=tasks.values("created_by_id"))
+        | Q(pk__in=tasks.filter(assigned_to__isnull=False).values("assigned_to_id"))
+        | Q(pk__in=tasks.filter(reviewer__isnull=False).values("reviewer_id"))
+        | Q(pk__in=Comment.objects.filter(task__board=board).values("author_id"))
+    )
+    users = User.objects.filter(referenced).order_by("pk").values("id", "email", "fullname")
+    for user in users.iterator(chunk_size=chunk_size):
+        yield _line("user", user)
+
+    members = Board.members.through.objects.filter(board=board).order_by("user_id")
+    for user_id in members.values_list("user_id", flat=True).iterator(chunk_size=chunk_size):
+        yield _line("member", {"user": user_id})
+
+    rows = tasks.order_by("pk").values(*TASK_FIELDS).iterator(chunk_size=chunk_size)
+    for chunk in chunks(rows, chunk_size):
+        for task in chunk:
+            yield _line("task", task)
+
+        comments = (
+            Comment.objects.filter(task_id__in=[task["id"] for task in chunk])
+            .order_by("task_id", "pk")
+            .values(*COMMENT_FIELDS)
+        )
+        for comment in comments.iterator(chunk_size=chunk_size):
+            yield _line("comment", comment)
+
+
+class BoardImporter:
+    """
+    Load an export into a new board.
+
+    Users are matched by email. Missing users are created with an unusable
+    password if create_users is set, otherwise the import is refused before
+    anything is written. Timestamps are set to the time of the import.
+    """
+
+    def __init__(self, owner=None, create_users=False, batch_size=1000):
+        self.owner = owner
+        self.create_users = create_users
+        self.batch_size = batch_size
+        self.board = None
+        self.users = {}
+        self.tasks = {}
+        self.block_size = None
+        self.block_tasks = 0
+        self.pending_members = set()
+        self.pending_tasks = []
+        self.pending_comments = []
+        self.in_comments = False
+        self.counts = {"users_created": 0, "members": 0, "tasks": 0, "comments": 0}
+
+    def run(self, lines):
+        """Import all lines inside a single transaction; return the board."""
+        with transaction.atomic():
+            pending_users = []
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    kind = record.pop("type")
+                except (ValueError, KeyError, AttributeError) as exc:
+                    raise BoardImportError(f"Line {number}: invalid record ({exc}).")
+
+                if kind == "board":
+                    self._start_board(record)
+                elif self.board is None:
+                    raise BoardImportError(f"Line {number}: the board record must come first.")
+                elif kind == "user":
+                    pending_users.append(record)
+                else:
+                    if pending_users:
+                        self._resolve_users(pending_users)
+                        pending_users = []
+                    self._handle(number, kind, record)
+
+            if self.board is None:
+                raise BoardImportError("The file contains no board.")
+            if pending_users:
+                self._resolve_users(pending_users)
+            self._save_board()
+            self._flush_members()
+            self._flush_tasks()
+            self._flush_comments()
+            self._finish()
+        return self.board
+
+    def _start_board(self, record):
+        if self.board is not None:
+            raise BoardImportError("The file contains more than one board.")
+        if record.get("format") != FORMAT_VERSION:
+            raise BoardImportError(f"Unsupported export format {record.get('format')!r}.")
+        self.board_record = record
+        self.block_size = record.get("block_size")
+        self.board = Board(title=record["title"])
+
+    def _resolve_users(self, records):
+        """Map exported user IDs to local users, creating or refusing missing ones."""
+        for chunk in chunks(records, self.batch_size):
+            keys = {record["id"]: User.objects.fold_case(record["email"]) for record in chunk}
+            existing = self._users_by_email_key(keys.values())
+            missing = {}
+            for record in chunk:
+                if keys[record["id"]] not in existing:
+                    missing.setdefault(keys[record["id"]], record)
+            if missing and not self.create_users:
+                emails = ", ".join(sorted(record["email"] for record in missing.values()))
+                raise BoardImportError(f"Unknown users: {emails}. Use --create-users to create them.")
+
+            created = []
+            for record in missing.values():
+                user = User(email=record["email"], fullname=record.get("fullname", ""))
+                user.set_unusable_password()
+                created.append(user)
+            User.objects.bulk_create(created)
+            existing.update(self._users_by_email_key(missing))
+            self.counts["users_created"] += len(created)
+            for exported_id, key in keys.items():
+                self.users[exported_id] = existing[key]
+
+    @staticmethod
+    def _users_by_email_key(keys):
+        """Return {Lower(email): pk} for the users with the given lowered emails."""
+        return dict(
+            User.objects.annotate(email_key=Lower("email"))
+            .filter(email_key__in=set(keys))
+            .values_list("email_key", "pk")
+        )
+
+    def _save_board(self):
+        if self.board.pk is None:
+            owner = self.owner.pk if self.owner else self._user(self.board_record["created_by"])
+            self.board.created_by_id = owner
+            self.board.save()
+
+    def _user(self, exported_id, required=True):
+        if exported_id is None and not required:
+            return None
+        try:
+            return self.users[exported_id]
+        except KeyError:
+            raise BoardImportError(f"Unknown user ID {exported_id!r}.")
+
+    def _handle(self, number, kind, record):
+        self._save_board()
+        if kind == "member":
+            self.pending_members.add(self._user(record["user"]))
+        elif kind == "task":
+            if self.in_comments or self.block_tasks == self.block_size:
+                self._start_task_block()
+            self.block_tasks += 1
+            self.pending_tasks.append(self._task(record))
+            if len(self.pending_tasks) >= self.batch_size:
+                self._flush_tasks()
+        elif kind == "comment":
+            self._flush_tasks()
+            self.in_comments = True
+            try:
+                task_id = self.tasks[record["task"]]
+            except KeyError:
+                raise BoardImportError(
+                    f"Line {number}: comment refers to task {record['task']!r}, "
+                    "which is not in the preceding block of tasks."
+                )
+            self.pending_comments.append(
+                Comment(task_id=task_id, author_id=self._user(record["author"]), text=record["text"])
+            )
+            if len(self.pending_comments) >= self.batch_size:
+                self._flush_comments()
+        else:
+            raise BoardImportError(f"Line {number}: unknown record type {kind!r}.")
+
+    def _start_task_block(self):
+        """Forget the previous block's tasks; its comments cannot follow any more."""
+        self._flush_tasks()
+        self._flush_comments()
+        self.tasks = {}
+        self.block_tasks = 0
+        self.in_comments = False
+
+    def _task(self, record):
+        task = Task(
+            board_id=self.board.pk,
+            title=record["title"],
+            description=record.get("description", ""),
+            status=record.get("status", Task.Status.TODO),
+            priority=record.get("priority", Task.Priority.MEDIUM),
+            due_date=record.get("due_date"),
+            assigned_to_id=self._user(record.get("assigned_to"), required=False),
+            reviewer_id=self._user(record.get("reviewer"), required=False),
+            created_by_id=self._user(record["created_by"]),
+        )
+        task._exported_id = record["id"]
+        return task
+
+    def _flush_members(self):
+        Membership = Board.members.through
+        Membership.objects.bulk_create(
+            [Membership(board_id=self.board.pk, user_id=user_id) for user_id in self.pending_members],
+            ignore_conflicts=True,
+        )
+        self.counts["members"] = len(self.pending_members)
+
+    def _flush_tasks(self):
+        if not self.pending_tasks:
+            return
+        Task.objects.bulk_create(self.pending_tasks)
+        for task in self.pending_tasks:
+            self.tasks[task._exported_id] = task.pk
+        self.counts["tasks"] += len(self.pending_tasks)
+        self.pending_tasks = []
+
+    def _flush_comments(self):
+        if not self.pending_comments:
+            return
+        Comment.objects.bulk_create(self.pending_comments)
+        self.counts["comments"] += len(self.pending_comments)
+        self.pending_comments = []
+
+    def _finish(self):
+        """Bring the denormalized counters of the new board and its tasks up to date."""
+        Task.objects.filter(board_id=self.board.pk).update(**task_counter_expressions())
+        recount_boards([self.board.pk])
+        self.board.refresh_from_db()
@@ -2,6 +2,8 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are resolved against core.asgi_urls, which serves the read
+endpoints with async views and everything else like WSGI does.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -9,8 +11,23 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+# Read by the settings: persistent connections default to off under ASGI.
+os.environ.setdefault('KANMIND_ASGI', '1')
 
-application = get_asgi_application()
+ASYNC_URLCONF = "core.asgi_urls"
+
+
+class KanMindASGIHandler(ASGIHandler):
+    """ASGIHandler resolving requests against ASYNC_URLCONF."""
+
+    async def get_response_async(self, request):
+        request.urlconf = ASYNC_URLCONF
+        return await super().get_response_async(request)
+
+
+django.setup(set_prefix=False)
+application = KanMindASGIHandler()
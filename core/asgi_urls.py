@@ -0,0 +1,21 @@
+"""
+URLconf used by core/asgi.py.
+
+The async read views (core.async_views) come first; every other URL, and
+every method they do not handle, is served by the regular URLconf.
+"""
+
+from django.urls import include, path
+
+from boards_app.api import async_views as board_views
+from tasks_app.api import async_views as task_views
+
+urlpatterns = [
+    path("api/boards/", board_views.board_list),
+    path("api/boards/<int:pk>/", board_views.board_detail),
+    path("api/tasks/", task_views.task_list),
+    path("api/tasks/assigned-to-me/", task_views.assigned_to_me),
+    path("api/tasks/reviewing/", task_views.reviewing),
+    path("api/tasks/<int:task_id>/comments/", task_views.comment_list),
+    path("", include("core.urls")),
+]
@@ -0,0 +1,101 @@
+"""
+Async read views.
+
+DRF views are synchronous, so under ASGI every request occupies a worker
+thread while it waits for the database. async_read_view builds an async
+Django view for the JSON GET path of a DRF view; the async ORM does the
+reads and the event loop serves other clients in between.
+
+Everything else is delegated to the DRF view (run in a thread): other
+methods, the browsable API, and any request the async handler does not
+answer itself, i.e. unauthenticated requests and permission or validation
+errors. Responses therefore match the DRF view, including error bodies.
+
+The views are routed through core/asgi_urls.py, which core/asgi.py uses;
+WSGI keeps serving the DRF views directly.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from auth_app.api.authentication import CachedTokenAuthentication
+
+HTTP_METHOD_NAMES = ("get", "post", "put", "patch", "delete", "head", "options", "trace")
+
+
+def _allow_header(drf_view):
+    """Return the Allow header DRF sends for the view."""
+    actions = getattr(drf_view, "actions", None)
+    if actions is None:
+        methods = {name for name in HTTP_METHOD_NAMES if hasattr(drf_view.view_class, name)}
+    else:
+        methods = set(actions) | {"options"} | ({"head"} if "get" in actions else set())
+    return ", ".join(name.upper() for name in HTTP_METHOD_NAMES if name in methods)
+
+
+def _wants_json(request):
+    return (
+        api_settings.URL_FORMAT_OVERRIDE not in request.GET
+        and "text/html" not in request.headers.get("Accept", "")
+    )
+
+
+def json_response(data, renderer_class=JSONRenderer, status=200, headers=None):
+    """Return data rendered like a DRF Response with the JSON renderer."""
+    if data is None:
+        response = HttpResponse(status=status, headers=headers)
+        del response["Content-Type"]
+        return response
+    return HttpResponse(
+        renderer_class().render(data), status=status, content_type="application/json", headers=headers
+    )
+
+
+def async_read_view(drf_view):
+    """
+    Decorate an async GET handler to serve drf_view's JSON GET path.
+
+    The handler is called as handler(request, drf_request, *args, **kwargs)
+    after token authentication (request.user is set) and returns a response
+    or None to let the DRF view answer. APIExceptions also fall back to it.
+    """
+    delegate = sync_to_async(drf_view)
+    allow = _allow_header(drf_view)
+    authentication = CachedTokenAuthentication()
+
+    def decorator(handler):
+        @wraps(handler)
+        async def view(request, *args, **kwargs):
+            if request.method == "GET" and _wants_json(request):
+                response = await _handle(request, args, kwargs)
+                if response is not None:
+                    return response
+            return await delegate(request, *args, **kwargs)
+
+        async def _handle(request, args, kwargs):
+            try:
+                result = await authentication.aauthenticate(request)
+                if result is None:
+                    return None
+                request.user = result[0]
+                response = await handler(request, Request(request), *args, **kwargs)
+            except APIException:
+                return None
+            if response is not None:
+                response["Allow"] = allow
+                response["Vary"] = "Accept"
+            return response
+
+        view.csrf_exempt = True
+        # Same labels as the DRF view in monitoring_app.metrics.
+        view.cls = getattr(drf_view, "cls", getattr(drf_view, "view_class", None))
+        view.actions = getattr(drf_view, "actions", None)
+        return view
+
+    return decorator
@@ -0,0 +1,63 @@
+"""
+SQLite connection tuning.
+
+configure_connection runs on connection_created and applies the PRAGMAs
+from SQLITE_TUNING to every new SQLite connection:
+
+- journal_mode=WAL lets readers run while one writer commits,
+- synchronous=NORMAL only fsyncs at WAL checkpoints (safe with WAL),
+- mmap_size and cache_size keep hot pages in memory,
+- busy_timeout makes a connection wait for the write lock instead of
+  failing with "database is locked".
+
+IMMEDIATE transactions and persistent connections are configured in
+DATABASES ("transaction_mode" and CONN_MAX_AGE). A PRAGMA set to None is
+left at SQLite's default; a "TUNING" dict in a DATABASES entry overrides
+SQLITE_TUNING for that alias. Other database vendors are not touched.
+"""
+
+from django.conf import settings
+
+DEFAULTS = {
+    "JOURNAL_MODE": "WAL",
+    "SYNCHRONOUS": "NORMAL",
+    "MMAP_SIZE": 256 * 1024 * 1024,
+    "CACHE_SIZE": -64 * 1024,
+    "BUSY_TIMEOUT": 5000,
+}
+
+PRAGMAS = (
+    ("JOURNAL_MODE", "journal_mode"),
+    ("SYNCHRONOUS", "synchronous"),
+    ("MMAP_SIZE", "mmap_size"),
+    ("CACHE_SIZE", "cache_size"),
+    ("BUSY_TIMEOUT", "busy_timeout"),
+)
+
+
+def get_sqlite_tuning_settings():
+    """Return SQLITE_TUNING from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "SQLITE_TUNING", {})}
+
+
+def pragma_statements(config):
+    """Return the PRAGMA statements for a tuning config, skipping None values."""
+    statements = []
+    for key, pragma in PRAGMAS:
+        value = config.get(key)
+        if value is None or value == "":
+            continue
+        if not str(value).lstrip("-").isalnum():
+            raise ValueError(f"Invalid value for SQLITE_TUNING[{key!r}]: {value!r}")
+        statements.append(f"PRAGMA {pragma} = {value}")
+    return statements
+
+
+def configure_connection(sender, connection, **kwargs):
+    """connection_created receiver applying the SQLite PRAGMAs."""
+    if connection.vendor != "sqlite":
+        return
+    config = {**get_sqlite_tuning_settings(), **connection.settings_dict.get("TUNING", {})}
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(config):
+            cursor.execute(statement)
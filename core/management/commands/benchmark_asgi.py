@@ -0,0 +1,220 @@
+import asyncio
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from rest_framework.authtoken.models import Token
+
+from boards_app.models import Board
+from core.asgi import KanMindASGIHandler
+from tasks_app.models import Comment, Task
+
+HOST = "testserver"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare WSGI (thread pool) and ASGI (event loop) throughput of the read "
+        "endpoints with many concurrent clients that receive responses slowly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=200, help="Concurrent clients.")
+        parser.add_argument("--requests", type=int, default=5, help="Requests per client.")
+        parser.add_argument("--threads", type=int, default=8, help="WSGI worker threads.")
+        parser.add_argument(
+            "--client-delay-ms", type=float, default=200,
+            help="Time each client takes to receive a response.",
+        )
+        parser.add_argument("--tasks", type=int, default=50, help="Tasks on the benchmark board.")
+
+    def handle(self, *args, **options):
+        if min(options["clients"], options["requests"], options["threads"]) < 1:
+            raise CommandError("--clients, --requests and --threads must be positive.")
+
+        user = get_user_model().objects.create_user(
+            email=f"benchmark-asgi-{uuid.uuid4().hex[:8]}@example.com", password=None, fullname="Benchmark"
+        )
+        try:
+            paths = self._seed(user, options["tasks"])
+            token = Token.objects.create(user=user).key
+            self.stdout.write(
+                f"{options['clients']} clients x {options['requests']} requests, "
+                f"{options['client_delay_ms']:.0f} ms per response; WSGI with {options['threads']} threads"
+            )
+            with override_settings(ALLOWED_HOSTS=[HOST]):
+                results = {
+                    "wsgi": async_to_sync(self._run_wsgi)(paths, token, options),
+                    "asgi": async_to_sync(self._run_asgi)(paths, token, options),
+                }
+        finally:
+            Board.objects.filter(created_by=user).delete()
+            user.delete()
+
+        for name, result in results.items():
+            self.stdout.write(self._format(name, result))
+        if results["wsgi"]["throughput"]:
+            gain = results["asgi"]["throughput"] / results["wsgi"]["throughput"]
+            self.stdout.write(f"ASGI/WSGI throughput: {gain:.1f}x")
+
+    def _seed(self, user, count):
+        board = Board.objects.create(title="Benchmark", created_by=user)
+        board.members.add(user)
+        tasks = [
+            Task.objects.create(
+                board=board, title=f"Task {index}", created_by=user, assigned_to=user, reviewer=user
+            )
+            for index in range(count)
+        ]
+        if tasks:
+            Comment.objects.create(task=tasks[0], author=user, text="Benchmark")
+        paths = [
+            "/api/boards/",
+            f"/api/boards/{board.id}/",
+            "/api/tasks/?page_size=50",
+            "/api/tasks/assigned-to-me/",
+            "/api/tasks/reviewing/",
+        ]
+        if tasks:
+            paths.append(f"/api/tasks/{tasks[0].id}/comments/")
+        return paths
+
+    async def _run_wsgi(self, paths, token, options):
+        """Emulate a threaded WSGI server: a worker is busy until the client has the response."""
+        application = WSGIHandler()
+        delay = options["client_delay_ms"] / 1000
+        pool = ThreadPoolExecutor(options["threads"])
+        loop = asyncio.get_running_loop()
+        latencies, failures = [], []
+
+        def handle(path):
+            statuses = []
+            body = application(_environ(path, token), lambda status, headers: statuses.append(status))
+            b"".join(body)
+            body.close()
+            time.sleep(delay)
+            return statuses[0]
+
+        async def client(number):
+            for index in range(options["requests"]):
+                started = time.perf_counter()
+                status = await loop.run_in_executor(pool, handle, paths[(number + index) % len(paths)])
+                latencies.append(time.perf_counter() - started)
+                if not status.startswith("200"):
+                    failures.append(status)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(client(number) for number in range(options["clients"])))
+        finally:
+            pool.shutdown()
+        return _summary(latencies, failures, time.perf_counter() - started)
+
+    async def _run_asgi(self, paths, token, options):
+        """Drive core.asgi.application directly; slow clients only hold a coroutine."""
+        application = KanMindASGIHandler()
+        delay = options["client_delay_ms"] / 1000
+        latencies, failures = [], []
+
+        async def request(path):
+            started = time.perf_counter()
+            sent = asyncio.Event()
+            statuses = []
+
+            async def receive():
+                if not statuses:
+                    statuses.append(None)
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                await sent.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses[0] = message["status"]
+                elif not message.get("more_body"):
+                    await asyncio.sleep(delay)
+                    sent.set()
+
+            await application(_scope(path, token), receive, send)
+            latencies.append(time.perf_counter() - started)
+            if statuses[0] != 200:
+                failures.append(statuses[0])
+
+        async def client(number):
+            for index in range(options["requests"]):
+                await request(paths[(number + index) % len(paths)])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(number) for number in range(options["clients"])))
+        return _summary(latencies, failures, time.perf_counter() - started)
+
+    @staticmethod
+    def _format(name, result):
+        return (
+            f"{name}  {result['requests']:>6} requests  {result['failures']:>3} failed  "
+            f"{result['throughput']:>8.1f} req/s  p50 {result['p50_ms']:.0f} ms  p95 {result['p95_ms']:.0f} ms"
+        )
+
+
+def _split(path):
+    path, _, query = path.partition("?")
+    return path, query
+
+
+def _environ(path, token):
+    path, query = _split(path)
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SCRIPT_NAME": "",
+        "SERVER_NAME": HOST,
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_HOST": HOST,
+        "HTTP_AUTHORIZATION": f"Token {token}",
+        "wsgi.input": BytesIO(),
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": BytesIO(),
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+        "wsgi.version": (1, 0),
+    }
+
+
+def _scope(path, token):
+    path, query = _split(path)
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", HOST.encode()), (b"authorization", f"Token {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": (HOST, 80),
+    }
+
+
+def _summary(latencies, failures, elapsed):
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "failures": len(failures),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000,
+    }
@@ -0,0 +1,154 @@
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+
+from core.db import get_sqlite_tuning_settings
+
+# Connection profiles compared by the benchmark. "baseline" is a stock
+# Django SQLite setup: rollback journal, DEFERRED transactions and a new
+# connection per request.
+PROFILES = {
+    "baseline": {
+        "TUNING": {
+            "JOURNAL_MODE": "DELETE",
+            "SYNCHRONOUS": "FULL",
+            "MMAP_SIZE": None,
+            "CACHE_SIZE": None,
+            "BUSY_TIMEOUT": None,
+        },
+        "OPTIONS": {},
+        "CONN_MAX_AGE": 0,
+    },
+    "tuned": {
+        "TUNING": None,
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+        "CONN_MAX_AGE": None,
+    },
+}
+
+SCHEMA = (
+    "CREATE TABLE bench_counter (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TABLE bench_event (id INTEGER PRIMARY KEY, counter_id INTEGER NOT NULL, payload TEXT NOT NULL)",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure SQLite write throughput under thread contention with the stock "
+        "configuration and with the SQLITE_TUNING / IMMEDIATE / CONN_MAX_AGE setup."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--transactions", type=int, default=200, help="Transactions per thread.")
+        parser.add_argument("--counters", type=int, default=10, help="Rows the writers compete for.")
+        parser.add_argument(
+            "--profile", action="append", choices=sorted(PROFILES), help="Profiles to run (default: all)."
+        )
+
+    def handle(self, *args, **options):
+        if connections["default"].vendor != "sqlite":
+            raise CommandError("This benchmark only applies to SQLite.")
+        if options["threads"] < 1 or options["transactions"] < 1:
+            raise CommandError("--threads and --transactions must be positive.")
+
+        self.stdout.write(
+            f"{options['threads']} threads x {options['transactions']} transactions "
+            f"(read + update + insert) on {options['counters']} counters"
+        )
+        results = {}
+        for name in options["profile"] or list(PROFILES):
+            with tempfile.TemporaryDirectory() as directory:
+                results[name] = self._run(name, Path(directory) / "bench.sqlite3", options)
+            self.stdout.write(self._format(name, results[name]))
+
+        if "baseline" in results and "tuned" in results and results["baseline"]["throughput"]:
+            gain = results["tuned"]["throughput"] / results["baseline"]["throughput"]
+            self.stdout.write(f"Throughput gain: {gain:.1f}x")
+
+    def _run(self, name, path, options):
+        alias = f"benchmark_{name}"
+        profile = PROFILES[name]
+        settings_dict = {
+            **connections["default"].settings_dict,
+            "NAME": str(path),
+            "OPTIONS": profile["OPTIONS"],
+            "CONN_MAX_AGE": profile["CONN_MAX_AGE"],
+            "TUNING": profile["TUNING"] or get_sqlite_tuning_settings(),
+            "TEST": {},
+        }
+        connections.settings[alias] = settings_dict
+        try:
+            with connections[alias].cursor() as cursor:
+                for statement in SCHEMA:
+                    cursor.execute(statement)
+                cursor.executemany(
+                    "INSERT INTO bench_counter (id, value) VALUES (%s, 0)",
+                    [(pk,) for pk in range(options["counters"])],
+                )
+            latencies, errors = [], []
+            threads = [
+                threading.Thread(
+                    target=self._worker, args=(alias, index, options, latencies, errors)
+                )
+                for index in range(options["threads"])
+            ]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+
+        latencies.sort()
+        return {
+            "committed": len(latencies),
+            "errors": len(errors),
+            "seconds": elapsed,
+            "throughput": len(latencies) / elapsed,
+            "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+            "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+        }
+
+    def _worker(self, alias, index, options, latencies, errors):
+        """Run read-modify-write transactions like a request moving a task would."""
+        connection = connections[alias]
+        try:
+            for number in range(options["transactions"]):
+                counter_id = (index + number) % options["counters"]
+                started = time.perf_counter()
+                try:
+                    with transaction.atomic(using=alias), connection.cursor() as cursor:
+                        cursor.execute("SELECT value FROM bench_counter WHERE id = %s", [counter_id])
+                        value = cursor.fetchone()[0]
+                        cursor.execute(
+                            "UPDATE bench_counter SET value = %s WHERE id = %s", [value + 1, counter_id]
+                        )
+                        cursor.execute(
+                            "INSERT INTO bench_event (counter_id, payload) VALUES (%s, %s)",
+                            [counter_id, f"thread {index} transaction {number}"],
+                        )
+                except OperationalError as error:
+                    errors.append(str(error))
+                else:
+                    latencies.append(time.perf_counter() - started)
+                # What request_finished does at the end of every request.
+                connection.close_if_unusable_or_obsolete()
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _format(name, result):
+        return (
+            f"{name:<9} {result['committed']:>6} committed  {result['errors']:>5} locked  "
+            f"{result['throughput']:>8.1f} tx/s  p50 {result['p50_ms']:.1f} ms  p95 {result['p95_ms']:.1f} ms"
+        )
@@ -0,0 +1,49 @@
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from core.replicas import get_replica_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the primary SQLite database into the SQLite replica aliases with the "
+        "online backup API; a local stand-in for database replication."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=float, default=0, help="Repeat every N seconds until interrupted."
+        )
+
+    def handle(self, *args, **options):
+        primary = connections["default"].settings_dict
+        replicas = [connections[alias].settings_dict for alias in get_replica_settings()["ALIASES"]]
+        if not replicas:
+            raise CommandError("No replicas configured (DATABASE_REPLICAS['ALIASES']).")
+        for settings_dict in [primary, *replicas]:
+            if settings_dict["ENGINE"] != "django.db.backends.sqlite3":
+                raise CommandError("sync_replicas only copies SQLite databases.")
+
+        while True:
+            started = time.perf_counter()
+            for replica in replicas:
+                self.copy(primary["NAME"], replica["NAME"])
+            self.stdout.write(
+                f"Synced {len(replicas)} replica(s) in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    @staticmethod
+    def copy(source_path, target_path):
+        source = sqlite3.connect(str(source_path))
+        target = sqlite3.connect(str(target_path))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
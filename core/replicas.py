@@ -0,0 +1,208 @@
+"""
+Read replica routing.
+
+ReplicaRoutingMiddleware marks GET/HEAD/OPTIONS requests as replica-safe and
+ReplicaRouter sends their ORM reads to one of DATABASE_REPLICAS["ALIASES"].
+Everything else reads from the primary ("default"):
+
+- requests with other methods, and the rest of a request once it wrote,
+- reads inside a transaction on the primary,
+- reads of PRIMARY_MODELS (tokens, so freshly issued tokens work at once),
+- requests of a client that wrote in the last PIN_SECONDS (read-after-write
+  stickiness). Clients are identified by their Authorization header,
+  otherwise by session cookie or address.
+
+A replica that fails its health check (SELECT from django_migrations) is
+skipped for HEALTH_CHECK_SECONDS; without a healthy replica reads fall back
+to the primary. Replicas are never migrated: they receive the schema with
+the data (see the sync_replicas command for a local SQLite stand-in).
+
+Pins live in the CACHE_ALIAS cache, which every worker process must share;
+a local-memory cache would pin a client only in the process that served its
+write, so the middleware refuses to start with one.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils.connection import ConnectionDoesNotExist
+
+DEFAULTS = {
+    "ALIASES": [],
+    "PIN_SECONDS": 5,
+    "HEALTH_CHECK_SECONDS": 10,
+    "PRIMARY_MODELS": ["authtoken.token"],
+    "CACHE_ALIAS": "default",
+    "KEY_PREFIX": "kanmind:pin:",
+}
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_routing = ContextVar("replica_routing", default=None)
+
+
+def get_replica_settings():
+    """Return DATABASE_REPLICAS from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "DATABASE_REPLICAS", {})}
+
+
+class RoutingState:
+    """Per-request routing decision; wrote is set by the first write."""
+
+    __slots__ = ("use_replica", "wrote")
+
+    def __init__(self, use_replica):
+        self.use_replica = use_replica
+        self.wrote = False
+
+
+def client_key(request):
+    """Return a stable key for the client sending the request."""
+    credential = (
+        request.headers.get("Authorization")
+        or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        or request.META.get("REMOTE_ADDR", "")
+    )
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+class ReplicaHealth:
+    """Process-wide cache of replica health check results."""
+
+    def __init__(self):
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def is_healthy(self, alias, ttl):
+        now = time.monotonic()
+        with self._lock:
+            result = self._results.get(alias)
+        if result is not None and result[1] > now:
+            return result[0]
+
+        healthy = self.check(alias)
+        with self._lock:
+            self._results[alias] = (healthy, now + ttl)
+        return healthy
+
+    @staticmethod
+    def check(alias):
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT 1 FROM django_migrations LIMIT 1")
+        except (ConnectionDoesNotExist, DatabaseError):
+            return False
+        return True
+
+    def reset(self):
+        with self._lock:
+            self._results.clear()
+
+
+health = ReplicaHealth()
+
+
+class ReplicaRoutingMiddleware:
+    """Enable replica reads for safe requests of clients that are not pinned."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.config = get_replica_settings()
+        if not self.config["ALIASES"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.cache = caches[self.config["CACHE_ALIAS"]]
+        if isinstance(self.cache, LocMemCache):
+            raise ImproperlyConfigured(
+                f"DATABASE_REPLICAS['CACHE_ALIAS'] ({self.config['CACHE_ALIAS']!r}) is a "
+                "local-memory cache; read-after-write pins need a cache shared by all workers."
+            )
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        key = self.config["KEY_PREFIX"] + client_key(request)
+        safe = request.method in SAFE_METHODS
+        state = RoutingState(use_replica=safe and self.cache.get(key) is None)
+
+        token = _routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+
+        if state.wrote or not safe:
+            self.cache.set(key, True, self.config["PIN_SECONDS"])
+        return response
+
+    async def __acall__(self, request):
+        key = self.config["KEY_PREFIX"] + client_key(request)
+        safe = request.method in SAFE_METHODS
+        state = RoutingState(use_replica=safe and await self.cache.aget(key) is None)
+
+        token = _routing.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+
+        if state.wrote or not safe:
+            await self.cache.aset(key, True, self.config["PIN_SECONDS"])
+        return response
+
+
+class ReplicaRouter:
+    """Database router for ReplicaRoutingMiddleware; see DATABASE_REPLICAS in settings."""
+
+    def __init__(self):
+        config = get_replica_settings()
+        self.replicas = list(config["ALIASES"])
+        self.health_check_seconds = config["HEALTH_CHECK_SECONDS"]
+        self.primary_models = {label.lower() for label in config["PRIMARY_MODELS"]}
+
+    # Both methods return the primary explicitly: returning None would make
+    # Django fall back to the database an instance was loaded from.
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if state is None or not state.use_replica or state.wrote:
+            return DEFAULT_DB_ALIAS
+        if model._meta.label_lower in self.primary_models:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        for alias in random.sample(self.replicas, len(self.replicas)):
+            if health.is_healthy(alias, self.health_check_seconds):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *self.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in self.replicas:
+            return False
+        return None
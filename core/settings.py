@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -52,10 +53,15 @@ INSTALLED_APPS = [
     "users_app.apps.UsersAppConfig",
     "boards_app.apps.BoardsAppConfig",
     "tasks_app.apps.TasksAppConfig",
+    "monitoring_app.apps.MonitoringAppConfig",
+    "core.apps.CoreConfig",
     
 ]
 
 MIDDLEWARE = [
+    "monitoring_app.metrics.MetricsMiddleware",
+    "monitoring_app.sql.SQLInstrumentationMiddleware",
+    "core.replicas.ReplicaRoutingMiddleware",
     'django.middleware.security.SecurityMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -64,6 +70,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    "monitoring_app.profiling.ProfilingMiddleware",
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -89,13 +96,71 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Writes start with BEGIN IMMEDIATE, so a transaction takes the write lock
+# up front and waits for it (busy_timeout) instead of failing with
+# "database is locked" when it upgrades from a read. Connections are kept
+# for DB_CONN_MAX_AGE seconds (0 closes them after every request). Under
+# ASGI (core.asgi sets KANMIND_ASGI) the default is 0: async requests run
+# their queries in short-lived executor threads, and Django recommends
+# disabling persistent connections there.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.getenv("DB_CONN_MAX_AGE", "0" if os.getenv("KANMIND_ASGI") else "60")),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': os.getenv("DB_TRANSACTION_MODE", "IMMEDIATE"),
+        },
     }
 }
 
+# Read replicas (core.replicas): DB_REPLICA_PATHS is a comma-separated list
+# of SQLite files registered as replica_1, replica_2, ... Safe requests read
+# from them unless the client wrote within PIN_SECONDS. Locally, keep them
+# up to date with python manage.py sync_replicas --interval 1.
+#
+# Pins are stored in the CACHE_ALIAS cache, which must be shared by all
+# worker processes (the middleware raises ImproperlyConfigured for a
+# local-memory cache). The replica_pins file cache works for workers on one
+# host; with several hosts configure that alias with Redis or Memcached.
+for index, path in enumerate(filter(None, os.getenv("DB_REPLICA_PATHS", "").split(",")), start=1):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "NAME": path.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["core.replicas.ReplicaRouter"]
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "replica_pins": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "DB_REPLICA_PIN_CACHE_DIR", os.path.join(tempfile.gettempdir(), "kanmind-replica-pins")
+        ),
+    },
+}
+
+DATABASE_REPLICAS = {
+    "ALIASES": [alias for alias in DATABASES if alias.startswith("replica_")],
+    "PIN_SECONDS": int(os.getenv("DB_REPLICA_PIN_SECONDS", "5")),
+    "HEALTH_CHECK_SECONDS": 10,
+    "PRIMARY_MODELS": ["authtoken.token"],
+    "CACHE_ALIAS": "replica_pins",
+}
+
+# SQLite PRAGMAs applied to every new connection (core.db). An empty
+# variable keeps SQLite's default for that PRAGMA.
+SQLITE_TUNING = {
+    "JOURNAL_MODE": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "SYNCHRONOUS": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "MMAP_SIZE": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+    "CACHE_SIZE": os.getenv("SQLITE_CACHE_SIZE", str(-64 * 1024)),
+    "BUSY_TIMEOUT": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -137,9 +202,92 @@ AUTH_USER_MODEL = "users_app.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.api.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-}
\ No newline at end of file
+}
+
+# Cached token authentication (auth_app.api.authentication)
+# Without CACHE_ALIAS tokens are cached per worker process and a revoked token
+# stays valid in the other workers for up to TTL seconds, so keep TTL short.
+# CACHE_ALIAS names a Django cache shared between worker processes (e.g.
+# Redis); it is then the only cache level, revocations apply at once and TTL
+# can be raised.
+TOKEN_AUTH_CACHE = {
+    "MAX_SIZE": int(os.getenv("TOKEN_AUTH_CACHE_MAX_SIZE", "10000")),
+    "TTL": int(os.getenv("TOKEN_AUTH_CACHE_TTL", "5")),
+    "CACHE_ALIAS": os.getenv("TOKEN_AUTH_CACHE_ALIAS") or None,
+}
+
+# Board change events (boards_app.events), streamed at /api/boards/<id>/events/.
+# BROKER may be "boards_app.events.LoopbackBroker" to emulate a multi-node setup.
+# Open streams re-check board access every HEARTBEAT seconds; stream tokens
+# for EventSource (?token=) expire after STREAM_TOKEN_MAX_AGE seconds.
+BOARD_EVENTS = {
+    "BROKER": os.getenv("BOARD_EVENTS_BROKER", "boards_app.events.InProcessBroker"),
+    "MAX_PENDING": 100,
+    "COALESCE_WINDOW": 0.1,
+    "HEARTBEAT": 15,
+    "STREAM_TOKEN_MAX_AGE": 60,
+}
+
+# Delta sync (GET /api/sync/): tombstones older than this are pruned by
+# prune_tombstones, and cursors older than this must do a full sync.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Start page counts (GET /api/dashboard/, tasks_app.dashboard), cached per
+# user and board versions for TIMEOUT seconds.
+DASHBOARD = {
+    "CACHE_ALIAS": os.getenv("DASHBOARD_CACHE_ALIAS", "default"),
+    "TIMEOUT": int(os.getenv("DASHBOARD_CACHE_TIMEOUT", "300")),
+}
+
+# Per-request SQL statistics (monitoring_app.sql): Server-Timing headers and
+# JSON log lines on the "kanmind.sql" logger for slow requests, slow queries
+# and repeated query patterns. Off unless SQL_INSTRUMENTATION=1.
+SQL_INSTRUMENTATION = {
+    "ENABLED": os.getenv("SQL_INSTRUMENTATION", "0") == "1",
+    "SAMPLE_RATE": float(os.getenv("SQL_INSTRUMENTATION_SAMPLE_RATE", "1.0")),
+    "SLOW_REQUEST_MS": 500,
+    "SLOW_QUERY_MS": 100,
+    "DUPLICATE_THRESHOLD": 3,
+    "SERVER_TIMING": True,
+}
+
+# On-demand profiling (monitoring_app.profiling): staff users send
+# "X-Profile: 1" to profile a request; SAMPLE_RATE profiles random requests.
+# Inspect results with python manage.py profiles list / show <id>.
+PROFILING = {
+    "ENABLED": os.getenv("PROFILING_ENABLED", "1") == "1",
+    "HEADER": "X-Profile",
+    "SAMPLE_RATE": float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+    "DIRECTORY": os.getenv("PROFILING_DIRECTORY", str(BASE_DIR / "profiles")),
+    "MAX_PROFILES": 50,
+    "MAX_AGE_HOURS": 72,
+}
+
+# Prometheus metrics (monitoring_app.metrics), served at /metrics.
+# With several worker processes set METRICS_MODE=file and METRICS_DIRECTORY
+# to a directory shared by the workers and emptied on start. METRICS_TOKEN
+# requires scrapers to send "Authorization: Bearer <token>"; metrics are
+# only on by default when it is set (METRICS_ENABLED=1 serves them openly).
+METRICS = {
+    "ENABLED": os.getenv("METRICS_ENABLED", "1" if os.getenv("METRICS_TOKEN") else "0") == "1",
+    "MODE": os.getenv("METRICS_MODE", "local"),
+    "DIRECTORY": os.getenv("METRICS_DIRECTORY", str(BASE_DIR / "metrics")),
+    "FLUSH_INTERVAL": 1.0,
+    "TOKEN": os.getenv("METRICS_TOKEN") or None,
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "kanmind": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
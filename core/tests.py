@@ -0,0 +1,237 @@
+import contextlib
+import re
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from rest_framework.authtoken.models import Token
+
+from boards_app.api.views import BoardViewSet
+from boards_app.models import Board
+from core.db import pragma_statements
+from core.replicas import ReplicaHealth, ReplicaRouter, ReplicaRoutingMiddleware, health
+from tasks_app.api.views import CommentViewSet, TaskViewSet
+from tasks_app.models import Comment, Task
+
+User = get_user_model()
+
+
+class SQLiteTuningTests(SimpleTestCase):
+
+    def connect(self, name, **extra):
+        default = connections["default"]
+        connection = type(default)({**default.settings_dict, "NAME": name, **extra}, "tuning_test")
+        self.addCleanup(connection.close)
+        return connection.cursor()
+
+    def pragma(self, cursor, name):
+        return cursor.execute(f"PRAGMA {name}").fetchone()[0]
+
+    @override_settings(SQLITE_TUNING={"MMAP_SIZE": 1024 * 1024, "BUSY_TIMEOUT": 1234})
+    def test_pragmas_are_applied_to_new_connections(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cursor = self.connect(str(Path(directory) / "db.sqlite3"))
+            self.assertEqual(self.pragma(cursor, "journal_mode"), "wal")
+            self.assertEqual(self.pragma(cursor, "synchronous"), 1)
+            self.assertEqual(self.pragma(cursor, "mmap_size"), 1024 * 1024)
+            self.assertEqual(self.pragma(cursor, "cache_size"), -64 * 1024)
+            self.assertEqual(self.pragma(cursor, "busy_timeout"), 1234)
+            cursor.close()
+
+    def test_per_alias_override_and_validation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cursor = self.connect(
+                str(Path(directory) / "db.sqlite3"), TUNING={"JOURNAL_MODE": None, "SYNCHRONOUS": "FULL"}
+            )
+            self.assertEqual(self.pragma(cursor, "journal_mode"), "delete")
+            self.assertEqual(self.pragma(cursor, "synchronous"), 2)
+            cursor.close()
+
+        with self.assertRaises(ValueError):
+            pragma_statements({"JOURNAL_MODE": "WAL; DROP TABLE x"})
+
+
+
+class WriteContentionBenchmarkTests(SimpleTestCase):
+
+    def test_tuned_profile_commits_everything(self):
+        out = StringIO()
+        # The command registers a temporary alias per profile on its own files.
+        allowed = {*self.databases, "benchmark_baseline", "benchmark_tuned"}
+        with mock.patch.object(type(self), "databases", allowed):
+            call_command("benchmark_sqlite_writes", "--threads", "4", "--transactions", "10", stdout=out)
+        self.assertRegex(out.getvalue(), re.compile(r"^tuned\s+40 committed\s+0 locked", re.MULTILINE))
+        self.assertIn("Throughput gain:", out.getvalue())
+
+
+@override_settings(
+    DATABASE_REPLICAS={"ALIASES": ["replica_1"], "PIN_SECONDS": 60, "CACHE_ALIAS": "pins"}
+)
+class ReplicaRoutingTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(
+            override_settings(
+                CACHES={
+                    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                    "pins": {
+                        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                        "LOCATION": directory,
+                    },
+                }
+            )
+        )
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.middleware = ReplicaRoutingMiddleware(self.view)
+        self.write = False
+        healthy = mock.patch.object(health, "is_healthy", return_value=True)
+        self.is_healthy = healthy.start()
+        self.addCleanup(healthy.stop)
+
+    def view(self, request):
+        if self.write:
+            self.router.db_for_write(Task)
+        self.databases_used = (self.router.db_for_read(Board), self.router.db_for_read(Token))
+        return HttpResponse()
+
+    def route(self, method, client="Token a", write=False):
+        self.write = write
+        self.middleware(getattr(self.factory, method)("/api/boards/", HTTP_AUTHORIZATION=client))
+        return self.databases_used
+
+    def test_safe_requests_read_from_replica_except_tokens(self):
+        self.assertEqual(self.route("get", "Token safe"), ("replica_1", "default"))
+        self.assertEqual(self.router.db_for_read(Board), "default")
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        self.assertEqual(self.route("post", "Token writer"), ("default", "default"))
+        self.assertEqual(self.route("get", "Token writer"), ("default", "default"))
+        self.assertEqual(self.route("get", "Token other"), ("replica_1", "default"))
+
+        self.assertEqual(self.route("get", "Token sneaky", write=True), ("default", "default"))
+        self.assertEqual(self.route("get", "Token sneaky"), ("default", "default"))
+
+    def test_unhealthy_replica_falls_back_to_primary(self):
+        self.is_healthy.return_value = False
+        self.assertEqual(self.route("get", "Token down"), ("default", "default"))
+        self.assertFalse(ReplicaHealth.check("replica_missing"))
+
+    def test_local_memory_pin_cache_is_rejected(self):
+        with override_settings(DATABASE_REPLICAS={"ALIASES": ["replica_1"], "CACHE_ALIAS": "default"}):
+            with self.assertRaises(ImproperlyConfigured):
+                ReplicaRoutingMiddleware(self.view)
+
+    def test_replicas_are_not_migrated(self):
+        self.assertIs(self.router.allow_migrate("replica_1", "tasks_app"), False)
+        self.assertIsNone(self.router.allow_migrate("default", "tasks_app"))
+
+
+class AsyncReadViewTests(TestCase):
+    """The ASGI read views must answer exactly like the DRF views they replace."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="pw123456", fullname="Owner")
+        self.member = User.objects.create_user(email="member@example.com", password="pw123456", fullname="Ö")
+        self.outsider = User.objects.create_user(email="out@example.com", password="pw123456", fullname="Out")
+        self.board = Board.objects.create(title="Board", created_by=self.user)
+        self.board.members.set([self.user, self.member])
+        self.task = Task.objects.create(
+            board=self.board, title="Task  ", created_by=self.user, assigned_to=self.user,
+            reviewer=self.member, due_date=date(2026, 1, 2),
+        )
+        Task.objects.create(board=self.board, title="Other", created_by=self.user, reviewer=self.user)
+        Comment.objects.create(task=self.task, author=self.member, text="Hallo")
+        self.auth = {"Authorization": f"Token {Token.objects.create(user=self.user).key}"}
+
+    def assertSameResponse(self, url, drf_method=None, headers=None):
+        """Compare the WSGI/DRF response with the ASGI one; drf_method must not be called."""
+        headers = self.auth if headers is None else headers
+        expected = self.client.get(url, headers=headers)
+        patch = (
+            mock.patch.object(*drf_method, side_effect=AssertionError("delegated"))
+            if drf_method else contextlib.nullcontext()
+        )
+        with override_settings(ROOT_URLCONF="core.asgi_urls"), patch:
+            actual = async_to_sync(self.async_client.get)(url, headers=headers)
+
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(actual.content, expected.content)
+        for header in ("Content-Type", "Allow", "Vary", "ETag"):
+            self.assertEqual(actual.get(header), expected.get(header), header)
+        return actual
+
+    def test_boards(self):
+        self.assertSameResponse("/api/boards/", (BoardViewSet, "list"))
+        self.assertSameResponse(f"/api/boards/{self.board.id}/?include=members", (BoardViewSet, "retrieve"))
+        self.assertSameResponse(
+            f"/api/boards/{self.board.id}/?include=tasks&fields=title,assignee", (BoardViewSet, "retrieve")
+        )
+        response = self.assertSameResponse(f"/api/boards/{self.board.id}/", (BoardViewSet, "retrieve"))
+        self.assertSameResponse(
+            f"/api/boards/{self.board.id}/",
+            (BoardViewSet, "retrieve"),
+            headers={**self.auth, "If-None-Match": response["ETag"]},
+        )
+
+    def test_tasks(self):
+        response = self.assertSameResponse("/api/tasks/", (TaskViewSet, "list"))
+        self.assertSameResponse(
+            "/api/tasks/", (TaskViewSet, "list"), headers={**self.auth, "If-None-Match": response["ETag"]}
+        )
+        page = self.assertSameResponse("/api/tasks/?page_size=1", (TaskViewSet, "list")).json()
+        self.assertSameResponse(page["next"].removeprefix("http://testserver"), (TaskViewSet, "list"))
+        self.assertSameResponse("/api/tasks/assigned-to-me/", (TaskViewSet, "assigned_to_me"))
+        self.assertSameResponse("/api/tasks/?fields=title,reviewer&page_size=1", (TaskViewSet, "list"))
+        self.assertSameResponse("/api/tasks/reviewing/?page_size=5", (TaskViewSet, "reviewing"))
+        self.assertSameResponse(f"/api/tasks/{self.task.id}/comments/", (CommentViewSet, "list"))
+        Comment.objects.create(task=self.task, author=self.user, text="Zweiter")
+        comments = f"/api/tasks/{self.task.id}/comments/"
+        page = self.assertSameResponse(f"{comments}?page_size=1", (CommentViewSet, "list")).json()
+        self.assertSameResponse(page["next"].removeprefix("http://testserver"), (CommentViewSet, "list"))
+        self.assertSameResponse(f"{comments}?since_id={page['results'][0]['id']}", (CommentViewSet, "list"))
+
+    def test_errors_and_other_requests_use_the_drf_views(self):
+        self.assertSameResponse("/api/tasks/", headers={})
+        self.assertSameResponse("/api/boards/", headers={"Authorization": "Token invalid"})
+        self.assertSameResponse("/api/boards/999/")
+        self.assertSameResponse("/api/tasks/999/comments/")
+        self.assertSameResponse("/api/tasks/?cursor=broken")
+        self.assertSameResponse("/api/tasks/?fields=secret")
+        self.assertSameResponse(f"/api/boards/{self.board.id}/?include=secret")
+        self.assertSameResponse(f"/api/tasks/{self.task.id}/comments/?since_id=x")
+
+        self.auth = {"Authorization": f"Token {Token.objects.create(user=self.outsider).key}"}
+        self.assertSameResponse(f"/api/boards/{self.board.id}/")
+        self.assertSameResponse(f"/api/tasks/{self.task.id}/comments/")
+
+        with override_settings(ROOT_URLCONF="core.asgi_urls"):
+            response = async_to_sync(self.async_client.post)(
+                "/api/boards/", {"title": "New"}, content_type="application/json", headers=self.auth
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Board.objects.filter(title="New", created_by=self.outsider).exists())
+
+
+class ASGIBenchmarkTests(TransactionTestCase):
+
+    def test_both_servers_answer_every_request(self):
+        out = StringIO()
+        call_command(
+            "benchmark_asgi", "--clients", "3", "--requests", "4", "--threads", "2",
+            "--client-delay-ms", "0", "--tasks", "2", stdout=out,
+        )
+        self.assertRegex(out.getvalue(), r"wsgi\s+12 requests\s+0 failed")
+        self.assertRegex(out.getvalue(), r"asgi\s+12 requests\s+0 failed")
+        self.assertFalse(Board.objects.exists())
+        self.assertFalse(User.objects.exists())
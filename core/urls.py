@@ -1,9 +1,12 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from monitoring_app.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("auth_app.api.urls")),
     path("api/", include("boards_app.api.urls")),
     path("api/", include("tasks_app.api.urls")),
+    path("metrics", metrics_view),
 ]
\ No newline at end of file
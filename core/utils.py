@@ -0,0 +1,10 @@
+"""Small helpers shared by the apps."""
+
+from itertools import islice
+
+
+def chunks(iterable, size):
+    """Yield lists of up to size items from iterable, consuming it lazily."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,48 @@
+import io
+import pstats
+
+from django.core.management.base import BaseCommand, CommandError
+
+from monitoring_app.profiling import list_profiles, profile_directory
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+class Command(BaseCommand):
+    help = "List captured request profiles or summarize one of them."
+
+    def add_arguments(self, parser):
+        subcommands = parser.add_subparsers(dest="subcommand", required=True)
+        subcommands.add_parser("list", help="List stored profiles, newest first.")
+        show = subcommands.add_parser("show", help="Print the top functions of a profile.")
+        show.add_argument("profile_id")
+        show.add_argument("--sort", choices=SORT_KEYS, default="cumulative")
+        show.add_argument("--limit", type=int, default=25)
+
+    def handle(self, *args, **options):
+        if options["subcommand"] == "list":
+            self._list()
+        else:
+            self._show(options["profile_id"], options["sort"], options["limit"])
+
+    def _list(self):
+        profiles = list_profiles()
+        if not profiles:
+            self.stdout.write(f"No profiles in {profile_directory()}.")
+            return
+        for profile in profiles:
+            self.stdout.write(
+                f"{profile['id']}  {profile['method']:<6} {profile['path']:<40} "
+                f"{profile['status']}  {profile['duration_ms']:>8.1f} ms  ({profile['trigger']})"
+            )
+
+    def _show(self, profile_id, sort, limit):
+        path = profile_directory() / f"{profile_id}.prof"
+        if not path.exists():
+            raise CommandError(f"Profile {profile_id} not found in {profile_directory()}.")
+
+        output = io.StringIO()
+        stats = pstats.Stats(str(path), stream=output)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        self.stdout.write(output.getvalue())
+        self.stdout.write(f"Collapsed stacks: {path.with_suffix('.collapsed')}")
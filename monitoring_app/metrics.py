@@ -0,0 +1,305 @@
+"""
+Prometheus metrics.
+
+A small in-process registry of counters and histograms. MetricsMiddleware
+records every request labeled by view, action, method and status, and
+metrics_view serves the registry at /metrics in the Prometheus text
+exposition format.
+
+With several worker processes each process only sees its own requests. In
+"file" mode every process writes a snapshot of its registry to
+METRICS["DIRECTORY"] (at most every FLUSH_INTERVAL seconds, and before
+serving /metrics), and /metrics sums the snapshots of all processes. The
+directory should be emptied when the server (re)starts. Snapshot files are
+named after the writing process when it first flushes, so workers forked
+from a parent that imported the app (gunicorn --preload) do not share one.
+"""
+
+import atexit
+import hmac
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MODE": "local",
+    "DIRECTORY": None,
+    "FLUSH_INTERVAL": 1.0,
+    "TOKEN": None,
+}
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def get_metrics_settings():
+    """Return METRICS from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "METRICS", {})}
+
+
+class Metric:
+    """Base class: a named family of samples keyed by label values."""
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self):
+        with self._lock:
+            samples = [[list(key), _copy(value)] for key, value in self._samples.items()]
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": samples,
+        }
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    """Cumulative histogram; each sample is [bucket counts..., sum, count]."""
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                sample = self._samples[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample[index] += 1
+            sample[-2] += value
+            sample[-1] += 1
+
+    def snapshot(self):
+        return {**super().snapshot(), "buckets": list(self.buckets)}
+
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
+
+
+class Registry:
+    """Collection of metrics with optional file-based aggregation across processes."""
+
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        self._file_pid = None
+        self._file_name = None
+
+    def register(self, metric):
+        with self._lock:
+            self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self):
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def flush(self, directory):
+        """Atomically write this process's snapshot into the directory."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / self._snapshot_file_name()
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, path)
+        self._last_flush = time.monotonic()
+
+    def _snapshot_file_name(self):
+        """Return this process's snapshot file name, choosing a new one after a fork."""
+        pid = os.getpid()
+        if self._file_pid != pid:
+            self._file_pid = pid
+            self._file_name = f"{pid}-{uuid.uuid4().hex[:8]}.json"
+        return self._file_name
+
+    def maybe_flush(self, config):
+        """Flush in file mode if FLUSH_INTERVAL has passed since the last flush."""
+        if config["MODE"] == "file" and time.monotonic() - self._last_flush >= config["FLUSH_INTERVAL"]:
+            self.flush(config["DIRECTORY"])
+
+    def collect(self, config):
+        """Return the snapshot to expose: this process's, or all processes' in file mode."""
+        if config["MODE"] != "file":
+            return self.snapshot()
+
+        self.flush(config["DIRECTORY"])
+        snapshots = []
+        for path in Path(config["DIRECTORY"]).glob("*.json"):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return merge(snapshots)
+
+
+def merge(snapshots):
+    """Sum snapshots of several processes sample by sample."""
+    merged = {}
+    for snapshot in snapshots:
+        for name, family in snapshot.items():
+            target = merged.setdefault(name, {**family, "samples": {}})
+            for labels, value in family["samples"]:
+                key = tuple(labels)
+                current = target["samples"].get(key)
+                if current is None:
+                    target["samples"][key] = _copy(value)
+                elif isinstance(value, list):
+                    target["samples"][key] = [a + b for a, b in zip(current, value)]
+                else:
+                    target["samples"][key] = current + value
+    for family in merged.values():
+        family["samples"] = [[list(key), value] for key, value in family["samples"].items()]
+    return merged
+
+
+def _escape(value):
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(snapshot):
+    """Render a snapshot in the Prometheus text exposition format."""
+    lines = []
+    for name, family in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        names = family["labelnames"]
+        for values, value in sorted(family["samples"]):
+            if family["type"] == "histogram":
+                for bound, count in zip(family["buckets"], value):
+                    lines.append(f"{name}_bucket{_labels(names, values, [('le', _number(float(bound)))])} {count}")
+                lines.append(f"{name}_bucket{_labels(names, values, [('le', '+Inf')])} {value[-1]}")
+                lines.append(f"{name}_sum{_labels(names, values)} {_number(value[-2])}")
+                lines.append(f"{name}_count{_labels(names, values)} {value[-1]}")
+            else:
+                lines.append(f"{name}{_labels(names, values)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_LABELS = ("view", "action", "method", "status")
+
+requests_total = registry.counter(
+    "kanmind_http_requests_total", "HTTP requests by view and action.", REQUEST_LABELS
+)
+request_duration = registry.histogram(
+    "kanmind_http_request_duration_seconds",
+    "HTTP request latency by view and action.",
+    REQUEST_LABELS,
+)
+
+
+def _view_labels(view_func, method):
+    """Return (view, action) for a resolved view, e.g. ("TaskViewSet", "assigned_to_me")."""
+    cls = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    if cls is None:
+        return view_func.__name__, method.lower()
+    actions = getattr(view_func, "actions", None) or {}
+    return cls.__name__, actions.get(method.lower(), method.lower())
+
+
+class MetricsMiddleware:
+    """Count requests and observe their latency per view, action and status."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.config = get_metrics_settings()
+        if not self.config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        if self.config["MODE"] == "file":
+            atexit.register(registry.flush, self.config["DIRECTORY"])
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, elapsed):
+        match = request.resolver_match
+        if match is None:
+            view, action = "unmatched", request.method.lower()
+        else:
+            view, action = _view_labels(match.func, request.method)
+        labels = {"view": view, "action": action, "method": request.method, "status": response.status_code}
+        requests_total.inc(**labels)
+        request_duration.observe(elapsed, **labels)
+        registry.maybe_flush(self.config)
+
+
+def metrics_view(request):
+    """Serve the registry; requires "Authorization: Bearer <TOKEN>" if METRICS["TOKEN"] is set."""
+    config = get_metrics_settings()
+    if not config["ENABLED"]:
+        return HttpResponse(status=404)
+    token = config["TOKEN"]
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return HttpResponse(status=401)
+    return HttpResponse(render(registry.collect(config)), content_type=CONTENT_TYPE)
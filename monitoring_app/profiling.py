@@ -0,0 +1,215 @@
+"""
+On-demand request profiling.
+
+ProfilingMiddleware runs the view, i.e. the full DRF dispatch including
+authentication, permissions and serialization, under cProfile when
+
+- a staff user sends the trigger header (X-Profile: 1 by default), or
+- the request is picked by PROFILING["SAMPLE_RATE"].
+
+Each profile is stored in PROFILING["DIRECTORY"] as a pstats .prof file, a
+collapsed-stack .collapsed file (input for flamegraph.pl or speedscope) and
+a .json file with request metadata. The directory is a ring: the oldest
+profiles are removed beyond MAX_PROFILES or MAX_AGE_HOURS. The profile ID
+is returned in the X-Profile-Id response header; the profiles management
+command lists and summarizes stored profiles. Profiling is only available
+when served through WSGI.
+"""
+
+import cProfile
+import inspect
+import json
+import pstats
+import random
+import re
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+DEFAULTS = {
+    "ENABLED": True,
+    "HEADER": "X-Profile",
+    "SAMPLE_RATE": 0.0,
+    "DIRECTORY": "profiles",
+    "MAX_PROFILES": 50,
+    "MAX_AGE_HOURS": 72,
+}
+
+MAX_STACK_DEPTH = 100
+MIN_STACK_SECONDS = 1e-6
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+def get_profiling_settings():
+    """Return PROFILING from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "PROFILING", {})}
+
+
+def profile_directory():
+    return Path(get_profiling_settings()["DIRECTORY"])
+
+
+def _function_label(function):
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{Path(filename).stem}:{name}:{line}"
+
+
+def collapsed_stacks(stats):
+    """
+    Convert pstats data into collapsed stacks ("a;b;c <microseconds>").
+
+    cProfile only records caller/callee pairs, so time is attributed to full
+    stacks by following each call edge in proportion to its share of the
+    callee's cumulative time. Recursive edges are cut.
+    """
+    callees = defaultdict(list)
+    roots = []
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(function)
+        for caller, edge in callers.items():
+            callees[caller].append((function, edge[3]))
+
+    totals = defaultdict(float)
+
+    def walk(function, stack, fraction):
+        _, _, self_time, cumulative, _ = stats.stats[function]
+        stack = stack + (function,)
+        totals[stack] += self_time * fraction
+        if len(stack) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees[function]:
+            callee_cumulative = stats.stats[callee][3]
+            share = edge_time * fraction
+            if callee in stack or not callee_cumulative or share < MIN_STACK_SECONDS:
+                continue
+            walk(callee, stack, share / callee_cumulative)
+
+    for root in roots:
+        walk(root, (), 1.0)
+
+    return [
+        f"{';'.join(_function_label(function) for function in stack)} {round(seconds * 1e6)}"
+        for stack, seconds in sorted(totals.items())
+        if round(seconds * 1e6) > 0
+    ]
+
+
+def store_profile(profiler, metadata):
+    """Write the profile files, enforce the ring limits and return the ID."""
+    config = get_profiling_settings()
+    directory = profile_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    slug = _SLUG_RE.sub("-", metadata["path"]).strip("-")[:40] or "root"
+    profile_id = f"{timezone.now():%Y%m%dT%H%M%S}-{metadata['method'].lower()}-{slug}-{uuid.uuid4().hex[:6]}"
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(directory / f"{profile_id}.prof")
+    (directory / f"{profile_id}.collapsed").write_text("\n".join(collapsed_stacks(stats)) + "\n")
+    metadata = {"id": profile_id, "created_at": timezone.now().isoformat(), **metadata}
+    (directory / f"{profile_id}.json").write_text(json.dumps(metadata, indent=2))
+
+    prune_profiles(config["MAX_PROFILES"], config["MAX_AGE_HOURS"])
+    return profile_id
+
+
+def list_profiles():
+    """Return the metadata of stored profiles, newest first."""
+    profiles = []
+    for path in profile_directory().glob("*.json"):
+        try:
+            profiles.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return sorted(profiles, key=lambda profile: profile["id"], reverse=True)
+
+
+def prune_profiles(max_profiles, max_age_hours):
+    """Delete profiles beyond the newest max_profiles or older than max_age_hours."""
+    directory = profile_directory()
+    cutoff = time.time() - max_age_hours * 3600
+    metadata_files = sorted(directory.glob("*.json"), reverse=True)
+    for index, path in enumerate(metadata_files):
+        if index >= max_profiles or path.stat().st_mtime < cutoff:
+            for suffix in (".json", ".prof", ".collapsed"):
+                path.with_suffix(suffix).unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """Profile the view of triggered or sampled requests; see PROFILING in settings."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = get_profiling_settings()
+        # Under ASGI the read views are coroutines, which cProfile cannot
+        # follow across awaits; stepping aside keeps the middleware chain async.
+        if not config["ENABLED"] or iscoroutinefunction(get_response):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.header = "HTTP_" + config["HEADER"].upper().replace("-", "_")
+        self.sample_rate = config["SAMPLE_RATE"]
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if inspect.iscoroutinefunction(view_func):
+            return None
+
+        if request.META.get(self.header) in ("1", "true"):
+            trigger = "header"
+            if not self._is_staff(request):
+                return None
+        elif self.sample_rate and random.random() < self.sample_rate:
+            trigger = "sample"
+        else:
+            return None
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        response = profiler.runcall(view_func, request, *view_args, **view_kwargs)
+        if hasattr(response, "render") and callable(response.render):
+            response = profiler.runcall(response.render)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        user = getattr(request, "user", None)
+        profile_id = store_profile(
+            profiler,
+            {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration_ms": round(duration_ms, 1),
+                "trigger": trigger,
+                "user": user.pk if user is not None and user.is_authenticated else None,
+            },
+        )
+        response["X-Profile-Id"] = profile_id
+        return response
+
+    @staticmethod
+    def _is_staff(request):
+        """Authenticate like the API does and return True for staff users."""
+        drf_request = Request(
+            request,
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        try:
+            return drf_request.user.is_staff
+        except APIException:
+            return False
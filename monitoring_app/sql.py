@@ -0,0 +1,191 @@
+"""
+Per-request SQL instrumentation.
+
+SQLInstrumentationMiddleware wraps every database connection with a
+QueryRecorder for the duration of a sampled request. The recorder counts
+queries, sums their time and groups them by a normalized fingerprint, so
+repeated identical statements (typically an N+1 pattern) stand out.
+
+Results are added as a Server-Timing header and, for slow requests, slow
+queries and duplicate patterns, written to the "kanmind.sql" logger as one
+JSON object per line. Queries run while a streaming response is consumed
+are not recorded.
+"""
+
+import json
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from functools import lru_cache
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger("kanmind.sql")
+
+DEFAULTS = {
+    "ENABLED": False,
+    "SAMPLE_RATE": 1.0,
+    "SLOW_REQUEST_MS": 500,
+    "SLOW_QUERY_MS": 100,
+    "DUPLICATE_THRESHOLD": 3,
+    "SERVER_TIMING": True,
+}
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN \((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_VALUES_RE = re.compile(r"\bVALUES \(.*\)$", re.IGNORECASE | re.DOTALL)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def get_sql_instrumentation_settings():
+    """Return SQL_INSTRUMENTATION from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "SQL_INSTRUMENTATION", {})}
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql):
+    """Normalize SQL so statements differing only in literals compare equal."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    sql = _VALUES_RE.sub("VALUES (...)", sql)
+    return _SPACE_RE.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """Database execute wrapper collecting statistics for one request."""
+
+    def __init__(self, slow_query_ms):
+        self.slow_query_ms = slow_query_ms
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints = Counter()
+        self.slow_queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.seconds += elapsed
+            self.fingerprints[sql] += 1
+            if elapsed * 1000 >= self.slow_query_ms:
+                self.slow_queries.append((sql, elapsed))
+
+    def duplicates(self, threshold):
+        """Return (fingerprint, count) pairs seen at least threshold times, most frequent first."""
+        counts = Counter()
+        for sql, count in self.fingerprints.items():
+            counts[fingerprint(sql)] += count
+        return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Opt-in SQL statistics per request; see SQL_INSTRUMENTATION in settings.
+
+    With ENABLED off, Django drops the middleware at startup. Requests that
+    are not sampled only cost one random() call.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = get_sql_instrumentation_settings()
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.sample_rate = config["SAMPLE_RATE"]
+        self.slow_request_ms = config["SLOW_REQUEST_MS"]
+        self.slow_query_ms = config["SLOW_QUERY_MS"]
+        self.duplicate_threshold = config["DUPLICATE_THRESHOLD"]
+        self.server_timing = config["SERVER_TIMING"]
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        recorder = QueryRecorder(self.slow_query_ms)
+        started = time.perf_counter()
+        with self._record(recorder):
+            response = self.get_response(request)
+        return self._finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        # Connections are per thread: install the wrappers in the
+        # thread-sensitive thread that runs the request's ORM calls.
+        recorder = QueryRecorder(self.slow_query_ms)
+        started = time.perf_counter()
+        stack = await sync_to_async(self._record)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, recorder, started)
+
+    def _sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    @staticmethod
+    def _record(recorder):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def _finish(self, request, response, recorder, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        sql_ms = recorder.seconds * 1000
+
+        if self.server_timing:
+            timing = f'db;desc="{recorder.count} queries";dur={sql_ms:.1f}, app;dur={total_ms:.1f}'
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        self._log(request, response, recorder, total_ms, sql_ms)
+        return response
+
+    def _log(self, request, response, recorder, total_ms, sql_ms):
+        base = {"method": request.method, "path": request.path}
+        for sql, elapsed in recorder.slow_queries:
+            _log_event("slow_query", **base, duration_ms=round(elapsed * 1000, 1), sql=fingerprint(sql))
+
+        duplicates = recorder.duplicates(self.duplicate_threshold)
+        if duplicates:
+            _log_event(
+                "duplicate_queries",
+                **base,
+                patterns=[{"sql": sql, "count": count} for sql, count in duplicates],
+            )
+
+        if total_ms >= self.slow_request_ms:
+            _log_event(
+                "slow_request",
+                **base,
+                status=response.status_code,
+                duration_ms=round(total_ms, 1),
+                sql_ms=round(sql_ms, 1),
+                queries=recorder.count,
+                duplicate_patterns=len(duplicates),
+            )
+
+
+def _log_event(event, **fields):
+    logger.warning(json.dumps({"event": event, **fields}, default=str))
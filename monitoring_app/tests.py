@@ -0,0 +1,226 @@
+import json
+import re
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from monitoring_app.metrics import Registry, render
+from monitoring_app.profiling import list_profiles
+from monitoring_app.sql import QueryRecorder, fingerprint
+
+User = get_user_model()
+
+
+class SQLFingerprintTests(SimpleTestCase):
+
+    def test_literals_and_lists_are_normalized(self):
+        self.assertEqual(
+            fingerprint("SELECT *  FROM t\nWHERE id IN (1, 2, 3) AND name = 'O''Brien' AND x > -1.5"),
+            "SELECT * FROM t WHERE id IN (...) AND name = ? AND x > ?",
+        )
+        self.assertEqual(
+            fingerprint('SELECT "t"."col1" FROM "t" WHERE "t"."id" = %s'),
+            'SELECT "t"."col1" FROM "t" WHERE "t"."id" = %s',
+        )
+
+
+class QueryRecorderTests(TestCase):
+
+    def test_counts_and_groups_repeated_queries(self):
+        recorder = QueryRecorder(slow_query_ms=0)
+        with connection.execute_wrapper(recorder), connection.cursor() as cursor:
+            for board_id in range(3):
+                cursor.execute(f"SELECT id FROM boards_app_board WHERE id = {board_id}")
+            cursor.execute("SELECT 1")
+
+        self.assertEqual(recorder.count, 4)
+        self.assertEqual(len(recorder.slow_queries), 4)
+        self.assertEqual(
+            recorder.duplicates(threshold=2),
+            [("SELECT id FROM boards_app_board WHERE id = ?", 3)],
+        )
+
+
+class SQLInstrumentationMiddlewareTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        Board.objects.create(title="Board", created_by=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_disabled_by_default(self):
+        response = self.client.get("/api/boards/")
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(SQL_INSTRUMENTATION={"ENABLED": True, "SLOW_REQUEST_MS": 0})
+    def test_server_timing_and_slow_request_log(self):
+        with self.assertLogs("kanmind.sql", "WARNING") as logs:
+            response = self.client.get("/api/boards/")
+
+        self.assertRegex(response["Server-Timing"], r'^db;desc="1 queries";dur=[\d.]+, app;dur=[\d.]+$')
+        event = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(event["event"], "slow_request")
+        self.assertEqual((event["path"], event["status"], event["queries"]), ("/api/boards/", 200, 1))
+
+    @override_settings(SQL_INSTRUMENTATION={"ENABLED": True}, ROOT_URLCONF="core.asgi_urls")
+    def test_async_requests_are_recorded(self):
+        headers = {"Authorization": f"Token {Token.objects.create(user=self.user).key}"}
+        response = async_to_sync(self.async_client.get)("/api/boards/", headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        count = int(re.match(r'^db;desc="(\d+) queries"', response["Server-Timing"])[1])
+        self.assertGreater(count, 0)
+
+    @override_settings(SQL_INSTRUMENTATION={"ENABLED": True, "SAMPLE_RATE": 0})
+    def test_unsampled_requests_are_untouched(self):
+        response = self.client.get("/api/boards/")
+        self.assertNotIn("Server-Timing", response)
+
+
+class ProfilingMiddlewareTests(APITestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        settings = override_settings(PROFILING={"DIRECTORY": self.directory.name, "MAX_PROFILES": 2})
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = User.objects.create_user(
+            email="staff@example.com", password="pw123456", fullname="Staff", is_staff=True
+        )
+        Board.objects.create(title="Board", created_by=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_staff_header_stores_profile(self):
+        response = self.client.get("/api/boards/", HTTP_X_PROFILE="1")
+        self.assertEqual(response.status_code, 200)
+        profile_id = response["X-Profile-Id"]
+
+        directory = Path(self.directory.name)
+        for suffix in (".prof", ".collapsed", ".json"):
+            self.assertTrue((directory / f"{profile_id}{suffix}").exists())
+        stacks = (directory / f"{profile_id}.collapsed").read_text().splitlines()
+        self.assertTrue(any("mixins:list" in line for line in stacks))
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in stacks))
+
+        out = StringIO()
+        call_command("profiles", "list", stdout=out)
+        self.assertIn(profile_id, out.getvalue())
+        call_command("profiles", "show", profile_id, "--limit", "5", stdout=out)
+        self.assertIn("function calls", out.getvalue())
+
+    def test_ring_is_bounded_and_header_is_staff_only(self):
+        for _ in range(3):
+            self.client.get("/api/boards/", HTTP_X_PROFILE="1")
+        self.assertEqual(len(list_profiles()), 2)
+        self.assertEqual(len(list(Path(self.directory.name).iterdir())), 6)
+
+        self.user.is_staff = False
+        self.user.save()
+        response = self.client.get("/api/boards/", HTTP_X_PROFILE="1")
+        self.assertNotIn("X-Profile-Id", response)
+
+
+@override_settings(METRICS={"ENABLED": True})
+class MetricsTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.client.force_authenticate(self.user)
+
+    def sample(self, name, **labels):
+        text = self.client.get("/metrics").content.decode()
+        pattern = "".join(f'(?=[^}}]*{key}="{value}")' for key, value in labels.items())
+        match = re.search(rf"^{name}\{{{pattern}[^}}]*\}} (\S+)$", text, re.MULTILINE)
+        return float(match.group(1)) if match else 0.0
+
+    def test_requests_are_counted_per_view_action_and_status(self):
+        labels = {"view": "TaskViewSet", "action": "assigned_to_me", "status": "200"}
+        before = self.sample("kanmind_http_requests_total", **labels)
+        for _ in range(3):
+            self.client.get("/api/tasks/assigned-to-me/")
+        self.client.get("/api/boards/999/")
+
+        self.assertEqual(self.sample("kanmind_http_requests_total", **labels), before + 3)
+        self.assertGreaterEqual(
+            self.sample("kanmind_http_request_duration_seconds_count", **labels), before + 3
+        )
+        self.assertGreaterEqual(
+            self.sample("kanmind_http_requests_total", view="BoardViewSet", action="retrieve", status="404"),
+            1,
+        )
+
+    @override_settings(METRICS={"ENABLED": False})
+    def test_disabled_metrics_are_not_served(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+    @override_settings(METRICS={"TOKEN": "secret"})
+    def test_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+
+
+class MetricsRegistryTests(SimpleTestCase):
+
+    def test_counter_is_thread_safe(self):
+        registry = Registry()
+        counter = registry.counter("hits_total", "Hits.", ["view"])
+
+        def work():
+            for _ in range(1000):
+                counter.inc(view="v")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIn('hits_total{view="v"} 8000', render(registry.snapshot()))
+
+    def test_file_mode_sums_processes(self):
+        workers = []
+        for durations in ([0.001, 0.2], [3.0]):
+            registry = Registry()
+            histogram = registry.histogram("latency_seconds", "Latency.", ["view"], buckets=[0.1, 1])
+            for duration in durations:
+                histogram.observe(duration, view="v")
+            workers.append(registry)
+
+        with tempfile.TemporaryDirectory() as directory:
+            config = {"MODE": "file", "DIRECTORY": directory}
+            workers[1].flush(directory)
+            text = render(workers[0].collect(config))
+
+        self.assertIn('latency_seconds_bucket{view="v",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{view="v",le="1.0"} 2', text)
+        self.assertIn('latency_seconds_bucket{view="v",le="+Inf"} 3', text)
+        self.assertIn('latency_seconds_count{view="v"} 3', text)
+        self.assertIn('latency_seconds_sum{view="v"} 3.201', text)
+
+    def test_forked_workers_get_their_own_snapshot_file(self):
+        registry = Registry()
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("os.getpid", return_value=100):
+                registry.flush(directory)
+            with mock.patch("os.getpid", return_value=101):
+                registry.flush(directory)
+            names = sorted(path.name.split("-")[0] for path in Path(directory).glob("*.json"))
+        self.assertEqual(names, ["100", "101"])
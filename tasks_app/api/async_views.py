@@ -0,0 +1,88 @@
+"""
+tasks_app API async views.
+
+Async versions of TaskViewSet.list, assigned_to_me and reviewing and of
+CommentViewSet.list for ASGI (see core.async_views). They return the same
+JSON as the viewsets and leave errors and non-GET methods to them.
+"""
+
+from django.db.models import Q
+
+from boards_app.api.access import BoardAccess
+from boards_app.api.conditional import etag_matches, make_etag
+from core.async_views import async_read_view, json_response
+from tasks_app.models import Task
+from .fast import FastJSONRenderer, requested_task_fields, serialize_task_rows, task_values
+from .pagination import CommentCursorPagination, TaskCursorPagination
+from .serializers import CommentReadSerializer
+from .urls import router, urlpatterns
+from .views import comment_thread, parse_since_id
+
+drf_views = {url.name: url.callback for url in router.urls}
+comment_list_view = next(
+    url.callback for url in urlpatterns if str(url.pattern) == "tasks/<int:task_id>/comments/"
+)
+
+
+def _tasks():
+    return Task.objects.select_related("assigned_to", "reviewer", "board")
+
+
+async def _list_response(queryset, drf_request, fields, headers=None):
+    """Async counterpart of TaskViewSet._list_response."""
+    rows = task_values(queryset, fields)
+    paginator = TaskCursorPagination()
+    page = await paginator.apaginate_queryset(rows, drf_request)
+    if page is not None:
+        data = {"next": paginator.get_next_link(), "results": serialize_task_rows(page, fields)}
+    else:
+        data = serialize_task_rows([row async for row in rows.aiterator()], fields)
+    return json_response(data, FastJSONRenderer, headers=headers)
+
+
+@async_read_view(drf_views["tasks-list"])
+async def task_list(request, drf_request):
+    """GET /api/tasks/"""
+    fields = requested_task_fields(drf_request.query_params)
+    access = BoardAccess.for_request(request)
+    await access.aload()
+    etag = make_etag("tasks", request.user.id, request.get_full_path(), access.versions())
+    if etag_matches(request, etag):
+        return json_response(None, status=304, headers={"ETag": etag})
+
+    user = request.user
+    queryset = _tasks().filter(Q(board__members=user) | Q(board__created_by=user)).distinct()
+    return await _list_response(queryset, drf_request, fields, headers={"ETag": etag})
+
+
+@async_read_view(drf_views["tasks-assigned-to-me"])
+async def assigned_to_me(request, drf_request):
+    """GET /api/tasks/assigned-to-me/"""
+    fields = requested_task_fields(drf_request.query_params)
+    return await _list_response(_tasks().filter(assigned_to=request.user), drf_request, fields)
+
+
+@async_read_view(drf_views["tasks-reviewing"])
+async def reviewing(request, drf_request):
+    """GET /api/tasks/reviewing/"""
+    fields = requested_task_fields(drf_request.query_params)
+    return await _list_response(_tasks().filter(reviewer=request.user), drf_request, fields)
+
+
+@async_read_view(comment_list_view)
+async def comment_list(request, drf_request, task_id):
+    """GET /api/tasks/<task_id>/comments/"""
+    board_id = await Task.objects.filter(pk=task_id).values_list("board_id", flat=True).afirst()
+    access = BoardAccess.for_request(request)
+    await access.aload()
+    if board_id is None or not access.can_access(board_id):
+        return None
+
+    queryset = comment_thread(task_id, parse_since_id(drf_request.query_params))
+    paginator = CommentCursorPagination()
+    page = await paginator.apaginate_queryset(queryset, drf_request)
+    if page is not None:
+        data = CommentReadSerializer(page, many=True).data
+        return json_response({"next": paginator.get_next_link(), "results": data})
+    comments = [comment async for comment in queryset.aiterator()]
+    return json_response(CommentReadSerializer(comments, many=True).data)
@@ -0,0 +1,157 @@
+"""
+tasks_app API bulk writes.
+
+Create or update many tasks in one request. All referenced boards, users
+and tasks are loaded up front, membership is checked against the request's
+BoardAccess, and valid items are written with bulk_create/bulk_update in a
+single transaction. Board counters and versions are recomputed afterwards
+with one UPDATE, so a batch costs a constant number of queries.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+
+from boards_app.api.access import BoardAccess
+from boards_app.events import publish_board_event
+from boards_app.models import Board
+from tasks_app.counters import recount_boards
+from tasks_app.models import Task, Tombstone
+from .serializers import TaskBulkWriteSerializer, TaskReadSerializer
+
+User = get_user_model()
+
+MAX_BATCH_SIZE = 500
+
+FORBIDDEN_DETAIL = "Du bist weder Board-Member noch Owner."
+NOT_FOUND_DETAIL = "Task wurde nicht gefunden."
+
+
+def _as_id(item, key):
+    """Return item[key] as an integer ID, or None if missing or malformed."""
+    value = item.get(key) if isinstance(item, dict) else None
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ids(items, key):
+    """Collect the integer IDs of a key across all items."""
+    return {value for value in (_as_id(item, key) for item in items) if value is not None}
+
+
+def _prefetch(items, access, extra_board_ids=()):
+    """Load every board and user referenced by the batch."""
+    board_ids = _ids(items, "board") | set(extra_board_ids)
+    user_ids = _ids(items, "assignee_id") | _ids(items, "reviewer_id")
+    access.prefetch_members(board_ids)
+    return {
+        Board: Board.objects.in_bulk(board_ids),
+        User: User.objects.in_bulk(user_ids) if user_ids else {},
+    }
+
+
+def _error(index, code, errors):
+    return {"index": index, "status": code, "errors": errors}
+
+
+def bulk_create_tasks(request, items, context):
+    """Validate and create tasks; return per-item results."""
+    access = BoardAccess.for_request(request)
+    context = {**context, "prefetched": _prefetch(items, access)}
+
+    results, tasks = [], []
+    boards = context["prefetched"][Board]
+    for index, item in enumerate(items):
+        board_id = _as_id(item, "board")
+        if board_id in boards and not access.can_access(board_id):
+            results.append(_error(index, status.HTTP_403_FORBIDDEN, {"detail": FORBIDDEN_DETAIL}))
+            continue
+
+        serializer = TaskBulkWriteSerializer(data=item, context=context)
+        if not serializer.is_valid():
+            results.append(_error(index, status.HTTP_400_BAD_REQUEST, serializer.errors))
+            continue
+
+        task = Task(created_by=request.user, **serializer.validated_data)
+        tasks.append(task)
+        results.append({"index": index, "status": status.HTTP_201_CREATED, "task": task})
+
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks)
+        recount_boards({task.board_id for task in tasks})
+
+    for task in tasks:
+        publish_board_event(task.board_id, "task.created", id=task.pk)
+    return _render(results, context)
+
+
+def bulk_update_tasks(request, items, context):
+    """Validate and partially update tasks; return per-item results."""
+    access = BoardAccess.for_request(request)
+    task_ids = _ids(items, "id")
+    instances = Task.objects.select_related("board", "assigned_to", "reviewer").in_bulk(task_ids)
+    context = {
+        **context,
+        "prefetched": _prefetch(
+            items, access, extra_board_ids={t.board_id for t in instances.values()}
+        ),
+    }
+
+    boards = context["prefetched"][Board]
+    results, tasks, fields, moves = [], [], set(), []
+    for index, item in enumerate(items):
+        task = instances.get(_as_id(item, "id"))
+        if task is None or not access.can_access(task.board_id):
+            results.append(_error(index, status.HTTP_404_NOT_FOUND, {"detail": NOT_FOUND_DETAIL}))
+            continue
+
+        board_id = _as_id(item, "board")
+        if board_id in boards and not access.can_access(board_id):
+            results.append(_error(index, status.HTTP_403_FORBIDDEN, {"detail": FORBIDDEN_DETAIL}))
+            continue
+
+        data = {key: value for key, value in item.items() if key != "id"}
+        serializer = TaskBulkWriteSerializer(task, data=data, partial=True, context=context)
+        if not serializer.is_valid():
+            results.append(_error(index, status.HTTP_400_BAD_REQUEST, serializer.errors))
+            continue
+
+        attrs = serializer.validated_data
+        if attrs.get("board", task.board).pk != task.board_id:
+            moves.append((task.pk, task.board_id))
+        for name, value in attrs.items():
+            setattr(task, name, value)
+            fields.add(name)
+        task.updated_at = timezone.now()
+        tasks.append(task)
+        results.append({"index": index, "status": status.HTTP_200_OK, "task": task})
+
+    board_ids = {task.board_id for task in tasks} | {board_id for _, board_id in moves}
+    with transaction.atomic():
+        if tasks:
+            Task.objects.bulk_update(tasks, sorted(fields | {"updated_at"}))
+        Tombstone.objects.bulk_create(
+            Tombstone(kind=Tombstone.Kind.TASK, object_id=task_id, board_id=board_id)
+            for task_id, board_id in moves
+        )
+        recount_boards(board_ids)
+
+    for task_id, board_id in moves:
+        publish_board_event(board_id, "task.deleted", id=task_id)
+    for task in tasks:
+        publish_board_event(task.board_id, "task.updated", id=task.pk)
+    return _render(results, context)
+
+
+def _render(results, context):
+    """Replace written task instances with their read representation."""
+    for result in results:
+        task = result.pop("task", None)
+        if task is not None:
+            result["data"] = TaskReadSerializer(task, context=context).data
+    return results
@@ -0,0 +1,152 @@
+"""
+tasks_app API fast read path.
+
+Task lists are built from .values() rows with a precomputed field plan
+instead of TaskReadSerializer, and rendered by FastJSONRenderer with orjson
+(see requirements.txt; without it the renderer falls back to DRF's encoder
+and most of the speedup is lost). The output is byte-for-byte identical to the
+serializer and DRF's JSONRenderer; tasks_app.tests checks the equivalence.
+
+Both helpers take an optional sparse fieldset (?fields=, see
+requested_task_fields): only the columns of the selected fields are read,
+so e.g. leaving out assignee and reviewer also drops the user joins.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+from boards_app.api.sparse import parse_selection
+from .serializers import TaskReadSerializer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - safety net, orjson is a requirement
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+
+STATUS_REPRESENTATION = {"todo": "to-do", "in_progress": "in-progress"}
+
+# (output key, kind, source columns) in TaskReadSerializer.Meta.fields order.
+TASK_PLAN = (
+    ("id", "value", ("id",)),
+    ("board", "value", ("board_id",)),
+    ("title", "value", ("title",)),
+    ("description", "value", ("description",)),
+    ("status", "status", ("status",)),
+    ("priority", "value", ("priority",)),
+    ("assignee", "user", ("assigned_to_id", "assigned_to__email", "assigned_to__fullname")),
+    ("reviewer", "user", ("reviewer_id", "reviewer__email", "reviewer__fullname")),
+    ("due_date", "date", ("due_date",)),
+    ("comments_count", "value", ("comments_count",)),
+)
+
+# Extra columns needed by TaskCursorPagination to build the next cursor.
+POSITION_COLUMNS = ("updated_at",)
+
+TASK_FIELDS = tuple(key for key, _, _ in TASK_PLAN)
+
+assert TASK_FIELDS == tuple(TaskReadSerializer.Meta.fields)
+
+
+def requested_task_fields(params):
+    """Return the task fields selected by ?fields= (id always included), or None for all."""
+    fields = parse_selection(params, "fields", TASK_FIELDS)
+    if fields is None or "id" in fields:
+        return fields
+    return ("id", *fields)
+
+
+def _plan(fields):
+    if fields is None:
+        return TASK_PLAN
+    return tuple(entry for entry in TASK_PLAN if entry[0] in fields)
+
+
+def task_values(queryset, fields=None):
+    """Return the queryset as .values() rows with the columns the plan needs."""
+    columns = [column for _, _, sources in _plan(fields) for column in sources]
+    return queryset.values(*columns, *POSITION_COLUMNS)
+
+
+def _convert(kind, row, sources):
+    value = row[sources[0]]
+    if kind == "value" or value is None:
+        return value
+    if kind == "status":
+        return STATUS_REPRESENTATION.get(value, value)
+    if kind == "date":
+        return value.isoformat()
+    return {"id": value, "email": row[sources[1]], "fullname": row[sources[2]]}
+
+
+def serialize_task_rows(rows, fields=None):
+    """Build TaskReadSerializer-compatible dicts from task_values() rows."""
+    if fields is not None:
+        plan = _plan(fields)
+        return [
+            {key: _convert(kind, row, sources) for key, kind, sources in plan} for row in rows
+        ]
+
+    statuses = STATUS_REPRESENTATION
+    results = []
+    append = results.append
+    for row in rows:
+        assignee_id = row["assigned_to_id"]
+        reviewer_id = row["reviewer_id"]
+        due_date = row["due_date"]
+        append({
+            "id": row["id"],
+            "board": row["board_id"],
+            "title": row["title"],
+            "description": row["description"],
+            "status": statuses.get(row["status"], row["status"]),
+            "priority": row["priority"],
+            "assignee": None if assignee_id is None else {
+                "id": assignee_id,
+                "email": row["assigned_to__email"],
+                "fullname": row["assigned_to__fullname"],
+            },
+            "reviewer": None if reviewer_id is None else {
+                "id": reviewer_id,
+                "email": row["reviewer__email"],
+                "fullname": row["reviewer__fullname"],
+            },
+            "due_date": None if due_date is None else due_date.isoformat(),
+            "comments_count": row["comments_count"],
+        })
+    return results
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that renders with orjson, producing DRF's compact output.
+
+    Falls back to DRF's encoder for indented output, if orjson is not
+    installed, and for values orjson rejects or would render differently
+    (dates and times, dataclasses, non-string keys, lone surrogates).
+    orjson and DRF format float exponents and NaN differently, so only use
+    it for responses without floats.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type or "", renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered = orjson.dumps(data, default=_reject, option=ORJSON_OPTIONS)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        return rendered.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def _reject(value):
+    """orjson default hook: defer everything non-native to DRF's encoder."""
+    raise TypeError
@@ -0,0 +1,181 @@
+"""
+tasks_app API pagination.
+
+This module contains opt-in keyset (cursor) paginations for task lists and
+comment threads.
+"""
+
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset pagination over (updated_at, id), newest first.
+
+    Pagination is only applied when the client sends ?cursor= or ?page_size=,
+    so existing clients keep receiving a plain list. Each page filters on the
+    last seen (updated_at, id) pair instead of using an offset, which keeps
+    the cost per page constant and means tasks updated while paging are never
+    returned twice and never push other tasks off a page.
+
+    Subclasses page over another (position_field, id) pair by overriding
+    position_field and descending.
+    """
+
+    position_field = "updated_at"
+    descending = True
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 500
+    invalid_cursor_message = "Ungültiger Cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page of tasks or None if pagination was not requested."""
+        queryset = self.page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.take_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async counterpart of paginate_queryset for async views."""
+        queryset = self.page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.take_page([row async for row in queryset])
+
+    def page_queryset(self, queryset, request):
+        """Return the queryset for one page plus one row, or None if not paginating."""
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        field = self.position_field
+        if self.descending:
+            queryset = queryset.order_by(f"-{field}", "-id")
+            after = "lt"
+        else:
+            queryset = queryset.order_by(field, "id")
+            after = "gt"
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f"{field}__{after}": value}) | Q(**{field: value, f"id__{after}": pk})
+            )
+        return queryset[: self.page_size + 1]
+
+    def take_page(self, rows):
+        """Cut the extra row off and remember where the next page starts."""
+        page = rows[: self.page_size]
+
+        self.next_position = None
+        if len(rows) > self.page_size:
+            self.next_position = self.get_position(page[-1])
+
+        return page
+
+    def get_position(self, row):
+        """Return the (position_field, id) pair of a model instance or .values() row."""
+        if isinstance(row, dict):
+            return row[self.position_field], row["id"]
+        return getattr(row, self.position_field), row.pk
+
+    def get_paginated_response(self, data):
+        """Wrap a page in the paginated envelope."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """Return the requested page size clamped to max_page_size."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self):
+        """Return the absolute URL for the next page or None."""
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def encode_cursor(self, position):
+        """Encode a (timestamp, id) pair as an opaque URL-safe token."""
+        timestamp, pk = position
+        raw = f"{timestamp.isoformat()}|{pk}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    def decode_cursor(self, request):
+        """Decode the cursor query parameter into a (timestamp, id) pair."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            timestamp, pk = raw.rsplit("|", 1)
+            moment = parse_datetime(timestamp)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if moment is None:
+            raise NotFound(self.invalid_cursor_message)
+        return moment, pk
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class CommentCursorPagination(TaskCursorPagination):
+    """
+    Keyset pagination over (created_at, id) for comment threads, oldest first.
+
+    Opt-in like TaskCursorPagination; comments created while paging appear
+    on the last page instead of shifting earlier pages.
+    """
+
+    position_field = "created_at"
+    descending = False
+    page_size = 50
+    max_page_size = 200
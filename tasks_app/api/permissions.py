@@ -7,6 +7,7 @@ This module contains permission classes used by tasks_app API views.
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import BasePermission
 
+from boards_app.api.access import BoardAccess
 from tasks_app.models import Task
 
 
@@ -15,9 +16,7 @@ class IsTaskBoardMember(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Return True if user is board creator or board member."""
-        user_id = request.user.id
-        board = obj.board
-        return board.created_by_id == user_id or board.members.filter(id=user_id).exists()
+        return BoardAccess.for_request(request).can_access(obj.board_id)
 
 
 class IsTaskBoardMemberForComment(BasePermission):
@@ -28,14 +27,13 @@ class IsTaskBoardMemberForComment(BasePermission):
         if not task_id:
             return False
 
-        try:
-            task = Task.objects.select_related("board").get(pk=task_id)
-        except Task.DoesNotExist:
+        board_id = (
+            Task.objects.filter(pk=task_id).values_list("board_id", flat=True).first()
+        )
+        if board_id is None:
             raise NotFound("Task wurde nicht gefunden.")
 
-        user_id = request.user.id
-        board = task.board
-        return board.created_by_id == user_id or board.members.filter(id=user_id).exists()
+        return BoardAccess.for_request(request).can_access(board_id)
     
 
 class IsTaskOwnerOrBoardCreator(BasePermission):
@@ -8,6 +8,8 @@ This module contains serializers for the tasks_app API.
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from boards_app.api.access import BoardAccess
+from boards_app.models import Board
 from tasks_app.models import Comment, Task
 from .validators import validate_not_empty, validate_user_is_board_member
 
@@ -116,12 +118,61 @@ class TaskWriteSerializer(serializers.ModelSerializer):
         assigned_to = attrs.get("assigned_to", getattr(self.instance, "assigned_to", None))
         reviewer = attrs.get("reviewer", getattr(self.instance, "reviewer", None))
 
-        validate_user_is_board_member(board, assigned_to, "assignee_id")
-        validate_user_is_board_member(board, reviewer, "reviewer_id")
+        request = self.context.get("request")
+        access = BoardAccess.for_request(request) if request is not None else None
+
+        validate_user_is_board_member(board, assigned_to, "assignee_id", access)
+        validate_user_is_board_member(board, reviewer, "reviewer_id", access)
 
         return attrs
     
     
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves IDs from context["prefetched"].
+
+    Bulk endpoints load all referenced rows up front, keyed by model and pk,
+    so validating a batch does not query once per item.
+    """
+
+    def to_internal_value(self, data):
+        model = self.get_queryset().model
+        prefetched = self.context.get("prefetched", {}).get(model)
+        if prefetched is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return prefetched[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class TaskBulkWriteSerializer(TaskWriteSerializer):
+    """Input serializer for one item of POST/PATCH /api/tasks/bulk/."""
+
+    board = PrefetchedPrimaryKeyRelatedField(queryset=Board.objects.all())
+    assignee_id = PrefetchedPrimaryKeyRelatedField(
+        source="assigned_to",
+        queryset=User.objects.all(),
+        required=False,
+        allow_null=True,
+        write_only=True,
+    )
+    reviewer_id = PrefetchedPrimaryKeyRelatedField(
+        source="reviewer",
+        queryset=User.objects.all(),
+        required=False,
+        allow_null=True,
+        write_only=True,
+    )
+
+
 class TaskPatchResponseSerializer(TaskReadSerializer):
     """Response serializer for PATCH/PUT /api/tasks/<id>/."""
 
@@ -149,6 +200,15 @@ class CommentReadSerializer(serializers.ModelSerializer):
         fields = ["id", "created_at", "author", "content"]
 
 
+class CommentSyncSerializer(CommentReadSerializer):
+    """Comment representation for GET /api/sync/ (includes the task ID)."""
+
+    task = serializers.IntegerField(source="task_id", read_only=True)
+
+    class Meta(CommentReadSerializer.Meta):
+        fields = ["id", "task", "created_at", "author", "content"]
+
+
 class CommentWriteSerializer(serializers.ModelSerializer):
     """Input serializer for creating a comment."""
 
@@ -1,7 +1,7 @@
 from django.urls import include, path 
 from rest_framework.routers import SimpleRouter
 
-from .views import TaskViewSet, CommentViewSet
+from .views import CommentViewSet, DashboardView, SearchView, SyncView, TaskViewSet
 
 
 router = SimpleRouter()
@@ -16,4 +16,7 @@ urlpatterns = [
     path("tasks/<int:task_id>/comments/<int:pk>/", CommentViewSet.as_view(
         {"delete": "destroy"}
     )),
+    path("sync/", SyncView.as_view()),
+    path("search/", SearchView.as_view()),
+    path("dashboard/", DashboardView.as_view()),
 ]
\ No newline at end of file
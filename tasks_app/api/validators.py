@@ -7,11 +7,20 @@ def validate_not_empty(value: str, field_name: str = "value") -> str:
         raise serializers.ValidationError(f"{field_name} darf nicht leer sein.")
     return str(value).strip()
 
-def validate_user_is_board_member(board, user, field_name: str):
-    """Raise ValidationError if the user is not a member of the board."""
+def validate_user_is_board_member(board, user, field_name: str, access=None):
+    """
+    Raise ValidationError if the user is not a member of the board.
+
+    When a request-scoped BoardAccess is given, membership is resolved from
+    its memoized data instead of querying the board members again.
+    """
     if user is None:
         return
-    if not board.members.filter(id=user.id).exists():
+    if access is not None:
+        is_member = access.is_member(board, user)
+    else:
+        is_member = board.members.filter(id=user.id).exists()
+    if not is_member:
         raise serializers.ValidationError(
             {field_name: "Benutzer muss Board-Member sein."}
         )
\ No newline at end of file
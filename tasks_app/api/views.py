@@ -1,22 +1,42 @@
 """
 tasks_app API views.
 
-Provides CRUD endpoints for tasks and comments.
+Provides CRUD endpoints for tasks and comments, a delta sync endpoint,
+full-text search and the start page dashboard.
 """
 
-from django.db.models import Count, Q
+import base64
+import binascii
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from boards_app.api.access import BoardAccess
+from boards_app.api.conditional import make_etag, not_modified
+from boards_app.api.sparse import selection_key
+from boards_app.events import publish_board_event
 from boards_app.models import Board
-from tasks_app.models import Comment, Task
+from tasks_app import dashboard, search
+from tasks_app.models import Comment, Task, Tombstone
+from .bulk import MAX_BATCH_SIZE, bulk_create_tasks, bulk_update_tasks
+from .fast import FastJSONRenderer, requested_task_fields, serialize_task_rows, task_values
+from .pagination import CommentCursorPagination, TaskCursorPagination
 from .permissions import IsTaskBoardMember, IsTaskBoardMemberForComment, IsTaskOwnerOrBoardCreator
 from .serializers import (
     CommentReadSerializer,
+    CommentSyncSerializer,
     CommentWriteSerializer,
     TaskPatchResponseSerializer,
     TaskReadSerializer,
@@ -25,17 +45,20 @@ from .serializers import (
 
 
 class TaskViewSet(viewsets.ModelViewSet):
-    """CRUD operations for tasks limited to authorized board members."""
+    """
+    CRUD operations for tasks limited to authorized board members.
+
+    The read endpoints accept ?fields=<name,...> to return only some task
+    fields; the other columns and joins are left out of the query.
+    """
 
+    pagination_class = TaskCursorPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         user = self.request.user
 
-        base = (
-            Task.objects
-            .select_related("assigned_to", "reviewer", "board")
-            .annotate(comments_count=Count("task_comments"))
-        )
+        base = Task.objects.select_related("assigned_to", "reviewer", "board")
 
         if self.action == "list":
             return (
@@ -56,7 +79,21 @@ class TaskViewSet(viewsets.ModelViewSet):
         return [IsAuthenticated(), IsTaskBoardMember()]
 
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user)
+        task = serializer.save(created_by=self.request.user)
+        publish_board_event(task.board_id, "task.created", id=task.pk)
+        return task
+
+    def perform_update(self, serializer):
+        previous_board_id = serializer.instance.board_id
+        task = serializer.save()
+        if previous_board_id != task.board_id:
+            publish_board_event(previous_board_id, "task.deleted", id=task.pk)
+        publish_board_event(task.board_id, "task.updated", id=task.pk)
+
+    def perform_destroy(self, instance):
+        task_id, board_id = instance.pk, instance.board_id
+        instance.delete()
+        publish_board_event(board_id, "task.deleted", id=task_id)
 
     def create(self, request, *args, **kwargs):
         board_id = request.data.get("board")
@@ -66,15 +103,14 @@ class TaskViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            board = Board.objects.get(id=board_id)
-        except Board.DoesNotExist:
-            return Response({"detail": "Board wurde nicht gefunden."},
-                        status=status.HTTP_404_NOT_FOUND)
-
-        is_member = board.members.filter(id=request.user.id).exists()
-        is_owner = (board.created_by_id == request.user.id)
-
-        if not (is_member or is_owner):
+            board_id = int(board_id)
+        except (TypeError, ValueError):
+            board_id = None
+
+        if board_id is None or not BoardAccess.for_request(request).can_access(board_id):
+            if board_id is None or not Board.objects.filter(id=board_id).exists():
+                return Response({"detail": "Board wurde nicht gefunden."},
+                            status=status.HTTP_404_NOT_FOUND)
             return Response({"detail": "Du bist weder Board-Member noch Owner."},
                         status=status.HTTP_403_FORBIDDEN)
 
@@ -83,7 +119,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             context=self.get_serializer_context()
         )
         write_serializer.is_valid(raise_exception=True)
-        task = write_serializer.save(created_by=request.user)
+        task = self.perform_create(write_serializer)
 
         task = self.get_queryset().get(pk=task.pk)
 
@@ -114,17 +150,139 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         return Response(data, status=response.status_code, headers=response.headers)
 
+    def list(self, request, *args, **kwargs):
+        """List tasks, or return 304 if none of the user's boards changed."""
+        fields = requested_task_fields(request.query_params)
+        versions = BoardAccess.for_request(request).versions()
+        etag = make_etag("tasks", request.user.id, request.get_full_path(), versions)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        queryset = self.filter_queryset(self.get_queryset())
+        response = self._list_response(queryset, fields)
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return a task, or 304 if its board has not changed."""
+        try:
+            task_id = int(kwargs[self.lookup_field])
+        except (KeyError, ValueError):
+            return super().retrieve(request, *args, **kwargs)
+
+        board_id = (
+            Task.objects.filter(pk=task_id).values_list("board_id", flat=True).first()
+        )
+        version = BoardAccess.for_request(request).version(board_id)
+        if version is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        fields = requested_task_fields(request.query_params)
+        etag = make_etag("task", task_id, board_id, version, *selection_key(fields=fields))
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        row = None
+        if fields is not None:
+            # Access to the task's board was checked with its version above.
+            row = task_values(Task.objects.filter(pk=task_id), fields).first()
+        if row is not None:
+            response = Response(serialize_task_rows([row], fields)[0])
+        else:
+            response = super().retrieve(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+    @action(detail=False, methods=["post", "patch"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Create (POST) or partially update (PATCH) up to MAX_BATCH_SIZE tasks.
+
+        The body is a list of task payloads; PATCH items also carry "id". The
+        response lists one result per item (index, status, data or errors).
+        Valid items are written even if others fail (207 Multi-Status).
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"detail": "Eine Liste von Tasks ist erforderlich."},
+                        status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > MAX_BATCH_SIZE:
+            return Response({"detail": f"Maximal {MAX_BATCH_SIZE} Tasks pro Anfrage."},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+        if request.method == "POST":
+            results = bulk_create_tasks(request, items, self.get_serializer_context())
+            success = status.HTTP_201_CREATED
+        else:
+            results = bulk_update_tasks(request, items, self.get_serializer_context())
+            success = status.HTTP_200_OK
+
+        failures = sum(1 for result in results if result["status"] >= 400)
+        if failures == 0:
+            code = success
+        elif failures == len(results):
+            code = status.HTTP_400_BAD_REQUEST
+        else:
+            code = status.HTTP_207_MULTI_STATUS
+        return Response(results, status=code)
+
+    def _list_response(self, queryset, fields=None):
+        """
+        Serialize a task queryset, paginated if the client asked for it.
+
+        Uses the fast read path (tasks_app.api.fast): .values() rows instead
+        of model instances and TaskReadSerializer, same output.
+        """
+        rows = task_values(queryset, fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_task_rows(page, fields))
+        return Response(serialize_task_rows(rows, fields))
+
     @action(detail=False, methods=["get"], url_path="assigned-to-me")
     def assigned_to_me(self, request):
+        fields = requested_task_fields(request.query_params)
         queryset = self.get_queryset().filter(assigned_to=request.user)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self._list_response(queryset, fields)
 
     @action(detail=False, methods=["get"], url_path="reviewing")
     def reviewing(self, request):
+        fields = requested_task_fields(request.query_params)
         queryset = self.get_queryset().filter(reviewer=request.user)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self._list_response(queryset, fields)
+
+
+def parse_since_id(params):
+    """Return the ?since_id= comment ID or None; reject anything but a non-negative integer."""
+    value = params.get("since_id")
+    if value is None:
+        return None
+    try:
+        since_id = int(value)
+    except ValueError:
+        raise ValidationError({"since_id": "Ungültige ID."})
+    if since_id < 0:
+        raise ValidationError({"since_id": "Ungültige ID."})
+    return since_id
+
+
+def comment_thread(task_id, since_id=None):
+    """
+    Return the comments of a task in thread order, (created_at, id).
+
+    Only the columns CommentReadSerializer renders are loaded: the comment's
+    own fields and the author's fullname.
+    """
+    queryset = Comment.objects.filter(task_id=task_id)
+    if since_id is not None:
+        queryset = queryset.filter(id__gt=since_id)
+    return (
+        queryset.select_related("author")
+        .only("id", "created_at", "text", "author__fullname")
+        .order_by("created_at", "id")
+    )
 
 
 class CommentViewSet(
@@ -133,9 +291,16 @@ class CommentViewSet(
     mixins.DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
-    """List, create, and delete comments nested under a task."""
+    """
+    List, create, and delete comments nested under a task.
+
+    The list is ordered by (created_at, id) and paginated by
+    CommentCursorPagination when ?cursor= or ?page_size= is sent;
+    ?since_id=<id> limits it to comments newer than that comment.
+    """
 
     permission_classes = [IsAuthenticated, IsTaskBoardMemberForComment]
+    pagination_class = CommentCursorPagination
 
     def _get_task_id(self):
         return self.kwargs.get("task_id")
@@ -145,11 +310,9 @@ class CommentViewSet(
         if task_id is None:
             return Comment.objects.none()
 
-        return (
-            Comment.objects.filter(task_id=task_id)
-            .select_related("author", "task", "task__board")
-            .order_by("id")
-            )
+        if self.action == "list":
+            return comment_thread(task_id, parse_since_id(self.request.query_params))
+        return Comment.objects.filter(task_id=task_id).select_related("author", "task")
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -158,7 +321,14 @@ class CommentViewSet(
 
     def perform_create(self, serializer):
         task = get_object_or_404(Task, pk=self.kwargs["task_id"])
-        serializer.save(task=task, author=self.request.user)
+        comment = serializer.save(task=task, author=self.request.user)
+        publish_board_event(task.board_id, "comment.created", id=comment.pk, task=task.pk)
+
+    def perform_destroy(self, instance):
+        comment_id, task_id = instance.pk, instance.task_id
+        board_id = instance.task.board_id
+        instance.delete()
+        publish_board_event(board_id, "comment.deleted", id=comment_id, task=task_id)
 
     def create(self, request, *args, **kwargs):
         write_serializer = self.get_serializer(data=request.data)
@@ -168,3 +338,150 @@ class CommentViewSet(
         comment = Comment.objects.select_related("author").get(pk=write_serializer.instance.pk)
         data = CommentReadSerializer(comment, context=self.get_serializer_context()).data
         return Response(data, status=status.HTTP_201_CREATED)
+
+
+class SyncView(APIView):
+    """
+    Delta sync: GET /api/sync/?since=<cursor>.
+
+    Returns tasks and comments created or updated after the cursor, tombstones
+    for rows deleted since then, the IDs of all accessible boards (clients drop
+    data of boards not listed) and a new cursor. Without ?since= everything
+    accessible is returned. Rows written shortly before the previous cursor
+    are sent again, so late commits are never missed; clients upsert by ID.
+
+    The cursor also records the accessible boards. Boards the user gained
+    access to since then are sent in full, boards they lost are listed under
+    deleted.boards.
+    """
+
+    permission_classes = [IsAuthenticated]
+    overlap = timedelta(seconds=2)
+
+    def get(self, request):
+        since, known_board_ids = self._decode_cursor(request.query_params.get("since"))
+        now = timezone.now()
+
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if since is not None and since < now - retention:
+            return Response(
+                {"detail": "Cursor abgelaufen, vollständige Synchronisierung nötig."},
+                status=status.HTTP_410_GONE,
+            )
+
+        board_ids = sorted(BoardAccess.for_request(request).board_ids)
+        added_board_ids = set(board_ids).difference(known_board_ids)
+        removed_board_ids = sorted(known_board_ids.difference(board_ids))
+        tasks = Task.objects.filter(board_id__in=board_ids).select_related(
+            "assigned_to", "reviewer"
+        )
+        comments = Comment.objects.filter(task__board_id__in=board_ids).select_related(
+            "author"
+        )
+        tombstones = Tombstone.objects.filter(board_id__in=board_ids)
+
+        if since is None:
+            tombstones = tombstones.none()
+        else:
+            window = since - self.overlap
+            comments = comments.filter(
+                Q(created_at__gt=window) | Q(task__board_id__in=added_board_ids)
+            )
+            tombstones = list(tombstones.filter(deleted_at__gt=window))
+            touched_task_ids = {t.task_id for t in tombstones if t.task_id}
+            tasks = tasks.filter(
+                Q(updated_at__gt=window)
+                | Q(board_id__in=added_board_ids)
+                | Q(pk__in=comments.values("task_id"))
+                | Q(pk__in=touched_task_ids)
+            )
+
+        deleted = {kind: [] for kind in Tombstone.Kind.values}
+        for tombstone in tombstones:
+            deleted[tombstone.kind].append(tombstone.object_id)
+
+        context = {"request": request}
+        return Response(
+            {
+                "cursor": self._encode_cursor(now, board_ids),
+                "boards": board_ids,
+                "tasks": TaskReadSerializer(tasks, many=True, context=context).data,
+                "comments": CommentSyncSerializer(comments, many=True, context=context).data,
+                "deleted": {
+                    **{f"{kind}s": ids for kind, ids in deleted.items()},
+                    "boards": removed_board_ids,
+                },
+            }
+        )
+
+    @staticmethod
+    def _encode_cursor(moment, board_ids=()):
+        raw = f"{moment.isoformat()}|{','.join(str(board_id) for board_id in board_ids)}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        """Return the cursor's (moment, set of board IDs), or (None, empty set) without one."""
+        if not cursor:
+            return None, set()
+        try:
+            timestamp, boards = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            moment = parse_datetime(timestamp)
+            board_ids = {int(board_id) for board_id in boards.split(",") if board_id}
+        except (binascii.Error, UnicodeError, ValueError):
+            moment = None
+        if moment is None:
+            raise ValidationError({"since": "Ungültiger Cursor."})
+        return moment, board_ids
+
+
+class SearchView(APIView):
+    """
+    Full-text search: GET /api/search/?q=<terms>[&limit=<n>].
+
+    Searches task titles, descriptions and comments of accessible boards.
+    Every term must match, the last characters of a term may be missing.
+    Results are ordered by relevance and carry a snippet with the matched
+    terms wrapped in <mark> tags; the rest of the snippet is HTML-escaped.
+    """
+
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 50
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "Suchbegriff fehlt."})
+
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Ungültiges Limit."})
+        limit = max(1, min(limit, self.max_limit))
+
+        return Response(search.search(request.user, query, limit=limit))
+
+
+class DashboardView(APIView):
+    """
+    Start page counts: GET /api/dashboard/.
+
+    Returns the assigned, reviewing, overdue, due-this-week and high-priority
+    task counts of the user's boards, in total and per board (see
+    tasks_app.dashboard). Cached per user until a task on one of the boards
+    changes; carries an ETag built from the same inputs.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        today = timezone.localdate()
+        versions = BoardAccess.for_request(request).versions()
+        etag = make_etag("dashboard", request.user.id, today, versions)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        data = dashboard.get_dashboard(request.user, today, versions)
+        return Response(data, headers={"ETag": etag})
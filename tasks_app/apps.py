@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def install_search_index(sender, using, **kwargs):
+    """Create the full-text search index once the task tables exist."""
+    from . import search
+
+    if search.install(using):
+        search.rebuild(using)
+
 
 class TasksAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks_app"
-    verbose_name = "Tasks"
\ No newline at end of file
+    verbose_name = "Tasks"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        post_migrate.connect(install_search_index, sender=self)
@@ -0,0 +1,45 @@
+"""
+Recount helpers for the denormalized Board and Task counters.
+
+Used by bulk writes, which bypass Task.save(), and by reconcile_counters.
+"""
+
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from boards_app.models import Board
+from .models import Comment, Task
+
+
+def _count(queryset, field):
+    """Return a correlated COUNT subquery grouped by the given field."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(field).annotate(total=Count("id")).values("total")
+        ),
+        0,
+    )
+
+
+def board_counter_expressions():
+    """Return the expected value of every Board counter as an expression."""
+    tasks = Task.objects.filter(board_id=OuterRef("pk"))
+    members = Board.members.through.objects.filter(board_id=OuterRef("pk"))
+    return {
+        "member_count": _count(members, "board_id"),
+        "ticket_count": _count(tasks, "board_id"),
+        "tasks_to_do_count": _count(tasks.filter(status=Task.Status.TODO), "board_id"),
+        "tasks_high_prio_count": _count(tasks.filter(priority=Task.Priority.HIGH), "board_id"),
+    }
+
+
+def task_counter_expressions():
+    """Return the expected value of every Task counter as an expression."""
+    comments = Comment.objects.filter(task_id=OuterRef("pk"))
+    return {"comments_count": _count(comments, "task_id")}
+
+
+def recount_boards(board_ids):
+    """Recompute the counters of the given boards and bump their versions."""
+    if board_ids:
+        Board.objects.filter(pk__in=board_ids).touch(**board_counter_expressions())
@@ -0,0 +1,93 @@
+"""
+tasks_app dashboard.
+
+Task counts for the start page (GET /api/dashboard/). The counts of all
+boards the user created or is a member of are computed with conditional
+aggregation in a single query, one row per board; the user totals are the
+sums of the board rows.
+
+Results are cached per user. The cache key contains the versions of the
+user's boards, which every task write bumps, and the current date, which
+moves the overdue and due-this-week windows; a write or a new day therefore
+makes the next request miss instead of deleting entries on every write.
+"""
+
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Q
+
+from boards_app.models import Board
+from .models import Task
+
+DEFAULTS = {
+    "CACHE_ALIAS": "default",
+    "TIMEOUT": 300,
+    "KEY_PREFIX": "kanmind:dashboard:",
+}
+
+# Per-board and total counters, in response order.
+COUNTERS = ("total", "assigned", "reviewing", "overdue", "due_this_week", "high_priority")
+
+OPEN_STATUSES = [status for status in Task.Status.values if status != Task.Status.DONE]
+
+
+def get_dashboard_settings():
+    """Return DASHBOARD from settings merged over the defaults."""
+    return {**DEFAULTS, **getattr(settings, "DASHBOARD", {})}
+
+
+def board_counts(user, today):
+    """
+    Return one dict per accessible board with id, title and COUNTERS.
+
+    overdue, due_this_week (today until Sunday) and high_priority only count
+    tasks that are not done.
+    """
+    week_end = today + timedelta(days=6 - today.weekday())
+    open_task = Q(tasks__status__in=OPEN_STATUSES)
+    rows = (
+        Board.objects.accessible_to(user)
+        .order_by("title", "id")
+        .values("id", "title")
+        .annotate(
+            total=Count("tasks"),
+            assigned=Count("tasks", filter=Q(tasks__assigned_to=user.id)),
+            reviewing=Count("tasks", filter=Q(tasks__reviewer=user.id)),
+            overdue=Count("tasks", filter=open_task & Q(tasks__due_date__lt=today)),
+            due_this_week=Count(
+                "tasks", filter=open_task & Q(tasks__due_date__range=(today, week_end))
+            ),
+            high_priority=Count(
+                "tasks", filter=open_task & Q(tasks__priority=Task.Priority.HIGH)
+            ),
+        )
+    )
+    return list(rows)
+
+
+def build_dashboard(user, today):
+    """Return the dashboard payload: the user totals and the per-board rows."""
+    boards = board_counts(user, today)
+    totals = {name: sum(board[name] for board in boards) for name in COUNTERS}
+    return {**totals, "boards": boards}
+
+
+def cache_key(user, today, versions, prefix=DEFAULTS["KEY_PREFIX"]):
+    """Return the cache key for a user's dashboard given their board versions."""
+    raw = f"{user.id}:{today.isoformat()}:{versions}"
+    return prefix + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get_dashboard(user, today, versions):
+    """Return the user's dashboard from the cache, computing it on a miss."""
+    config = get_dashboard_settings()
+    cache = caches[config["CACHE_ALIAS"]]
+    key = cache_key(user, today, versions, config["KEY_PREFIX"])
+    data = cache.get(key)
+    if data is None:
+        data = build_dashboard(user, today)
+        cache.set(key, data, config["TIMEOUT"])
+    return data
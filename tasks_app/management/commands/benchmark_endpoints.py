@@ -0,0 +1,274 @@
+import json
+import math
+import platform
+import statistics
+import time
+from collections import namedtuple
+
+import django
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from tasks_app.models import Comment, Task
+
+# seed_kanmind arguments per data size.
+SIZES = {
+    "small": {"users": 50, "boards": 10, "members-per-board": 5, "tasks-per-board": 100, "comments-per-task": 1},
+    "medium": {"users": 200, "boards": 50, "members-per-board": 8, "tasks-per-board": 500, "comments-per-task": 2},
+    "large": {"users": 1000, "boards": 200, "members-per-board": 10, "tasks-per-board": 2000, "comments-per-task": 3},
+}
+SEED = 1
+PASSWORD = "kanmind1234"
+
+# Latency is compared on p95; query counts must not grow at all.
+COMPARED_LATENCY = "p95_ms"
+
+Endpoint = namedtuple("Endpoint", "name method path data headers", defaults=(None, {}))
+
+
+def endpoints(fixture):
+    """Return the benchmarked requests for the given fixture objects."""
+    board, task, comment, member = fixture["board"], fixture["task"], fixture["comment"], fixture["member"]
+    new_task = {"board": board.pk, "title": "Benchmark", "status": "to-do", "assignee_id": member.pk}
+    return [
+        Endpoint("auth.registration", "post", "/api/registration/", {
+            "fullname": "Benchmark", "email": "benchmark-registration@example.com",
+            "password": PASSWORD, "repeated_password": PASSWORD,
+        }),
+        Endpoint("auth.login", "post", "/api/login/", {"email": fixture["user"].email, "password": PASSWORD}),
+        Endpoint("users.email_check", "get", f"/api/email-check/?email={member.email}"),
+        Endpoint("boards.list", "get", "/api/boards/"),
+        Endpoint("boards.create", "post", "/api/boards/", {"title": "Benchmark", "members": [member.pk]}),
+        Endpoint("boards.detail", "get", f"/api/boards/{board.pk}/"),
+        Endpoint(
+            "boards.detail_not_modified", "get", f"/api/boards/{board.pk}/",
+            headers={"HTTP_IF_NONE_MATCH": fixture["board_etag"]},
+        ),
+        Endpoint("boards.update", "patch", f"/api/boards/{board.pk}/", {"title": "Renamed"}),
+        Endpoint("boards.delete", "delete", f"/api/boards/{board.pk}/"),
+        Endpoint("boards.export", "get", f"/api/boards/{board.pk}/export/"),
+        Endpoint("tasks.list", "get", "/api/tasks/"),
+        Endpoint("tasks.list_page", "get", "/api/tasks/?page_size=50"),
+        Endpoint("tasks.create", "post", "/api/tasks/", new_task),
+        Endpoint("tasks.detail", "get", f"/api/tasks/{task.pk}/"),
+        Endpoint("tasks.update", "patch", f"/api/tasks/{task.pk}/", {"status": "done"}),
+        Endpoint("tasks.delete", "delete", f"/api/tasks/{task.pk}/"),
+        Endpoint("tasks.bulk_create", "post", "/api/tasks/bulk/", [new_task] * 50),
+        Endpoint("tasks.assigned_to_me", "get", "/api/tasks/assigned-to-me/"),
+        Endpoint("tasks.reviewing", "get", "/api/tasks/reviewing/"),
+        Endpoint("tasks.search", "get", "/api/search/?q=deploy+fix"),
+        Endpoint("tasks.sync", "get", "/api/sync/"),
+        Endpoint("comments.list", "get", f"/api/tasks/{comment.task_id}/comments/"),
+        Endpoint("comments.create", "post", f"/api/tasks/{task.pk}/comments/", {"content": "Benchmark"}),
+        Endpoint("comments.delete", "delete", f"/api/tasks/{comment.task_id}/comments/{comment.pk}/"),
+    ]
+
+
+class QueryTimer:
+    """Database execute wrapper counting queries and the time spent in them."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every API endpoint in-process against seeded data and report "
+        "latency percentiles, query counts, SQL time and response size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="small", help=f"Comma-separated, of: {', '.join(SIZES)}.")
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--endpoint", action="append", help="Only run endpoints starting with this name.")
+        parser.add_argument("--output", help="Write results as JSON to this file.")
+        parser.add_argument("--input", help="Load results from JSON instead of running (for --compare).")
+        parser.add_argument("--compare", help="Baseline JSON; report regressions against it.")
+        parser.add_argument(
+            "--threshold", type=float, default=0.10,
+            help=f"Relative {COMPARED_LATENCY} increase counted as regression (default 0.10).",
+        )
+        parser.add_argument(
+            "--min-delta-ms", type=float, default=0.5,
+            help="Ignore latency changes smaller than this (default 0.5).",
+        )
+
+    def handle(self, *args, **options):
+        if options["input"]:
+            report = self._load(options["input"])
+        else:
+            report = self._run(options)
+            if options["output"]:
+                with open(options["output"], "w", encoding="utf-8") as output:
+                    json.dump(report, output, indent=2)
+                    output.write("\n")
+        self._print(report["results"])
+
+        if options["compare"]:
+            baseline = self._load(options["compare"])
+            regressions = self._compare(
+                baseline["results"], report["results"], options["threshold"], options["min_delta_ms"]
+            )
+            if regressions:
+                raise CommandError(f"{regressions} regression(s) against {options['compare']}.")
+            self.stdout.write(self.style.SUCCESS("No regressions."))
+
+    def _load(self, path):
+        try:
+            with open(path, encoding="utf-8") as report:
+                return json.load(report)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+
+    def _run(self, options):
+        sizes = [size.strip() for size in options["sizes"].split(",") if size.strip()]
+        unknown = set(sizes) - SIZES.keys()
+        if unknown:
+            raise CommandError(f"Unknown size(s): {', '.join(sorted(unknown))}.")
+
+        results = []
+        for size in sizes:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=["testserver"]):
+                started = time.perf_counter()
+                self._seed(size)
+                self.stderr.write(f"Seeded {size} data in {time.perf_counter() - started:.1f}s")
+
+                fixture = self._fixture()
+                for endpoint in endpoints(fixture):
+                    if options["endpoint"] and not endpoint.name.startswith(tuple(options["endpoint"])):
+                        continue
+                    result = self._measure(fixture["client"], endpoint, options["iterations"], options["warmup"])
+                    results.append({"size": size, **result})
+                transaction.set_rollback(True)
+
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "iterations": options["iterations"],
+            },
+            "results": results,
+        }
+
+    def _seed(self, size):
+        arguments = [f"--{name}={value}" for name, value in SIZES[size].items()]
+        call_command("seed_kanmind", *arguments, seed=SEED, password=PASSWORD, stdout=self.stderr)
+
+    def _fixture(self):
+        """Pick a well-connected user and objects to request, and log in."""
+        task = Task.objects.filter(comments_count__gt=0).select_related("board").order_by("pk").first()
+        board = task.board
+        user = board.created_by
+        member = board.members.exclude(pk=user.pk).first() or user
+        token, _ = Token.objects.get_or_create(user=user)
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        return {
+            "client": client,
+            "user": user,
+            "member": member,
+            "board": board,
+            "task": task,
+            "comment": Comment.objects.filter(task=task).order_by("pk").first(),
+            "board_etag": client.get(f"/api/boards/{board.pk}/")["ETag"],
+        }
+
+    def _measure(self, client, endpoint, iterations, warmup):
+        """Send the request repeatedly, rolling back its writes each time."""
+        latencies, queries, sql_ms, sizes = [], [], [], []
+        for iteration in range(warmup + iterations):
+            savepoint = transaction.savepoint()
+            timer = QueryTimer()
+            with connection.execute_wrapper(timer):
+                started = time.perf_counter()
+                response = getattr(client, endpoint.method)(
+                    endpoint.path, endpoint.data, format="json", **endpoint.headers
+                )
+                body = b"".join(response.streaming_content) if response.streaming else response.content
+                elapsed = time.perf_counter() - started
+            transaction.savepoint_rollback(savepoint)
+
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{endpoint.name}: {endpoint.method.upper()} {endpoint.path} "
+                    f"returned {response.status_code}: {body[:200]!r}"
+                )
+            if iteration >= warmup:
+                latencies.append(elapsed * 1000)
+                queries.append(timer.count)
+                sql_ms.append(timer.seconds * 1000)
+                sizes.append(len(body))
+
+        return {
+            "endpoint": endpoint.name,
+            "method": endpoint.method.upper(),
+            "path": endpoint.path,
+            "status": response.status_code,
+            "iterations": iterations,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+            "queries": max(queries),
+            "sql_ms": round(statistics.mean(sql_ms), 3),
+            "bytes": max(sizes),
+        }
+
+    def _print(self, results):
+        header = f"{'size':<7} {'endpoint':<28} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>7} {'sql ms':>8} {'bytes':>9}"
+        self.stdout.write(header)
+        for result in results:
+            self.stdout.write(
+                f"{result['size']:<7} {result['endpoint']:<28} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['queries']:>7} "
+                f"{result['sql_ms']:>8.2f} {result['bytes']:>9}"
+            )
+
+    def _compare(self, baseline, current, threshold, min_delta_ms):
+        """Print changes against the baseline and return the number of regressions."""
+        previous = {(result["size"], result["endpoint"]): result for result in baseline}
+        regressions = 0
+        for result in current:
+            before = previous.get((result["size"], result["endpoint"]))
+            if before is None:
+                continue
+
+            problems = []
+            delta = result[COMPARED_LATENCY] - before[COMPARED_LATENCY]
+            if delta > min_delta_ms and delta > before[COMPARED_LATENCY] * threshold:
+                problems.append(
+                    f"{COMPARED_LATENCY} {before[COMPARED_LATENCY]:.2f} -> {result[COMPARED_LATENCY]:.2f}"
+                )
+            if result["queries"] > before["queries"]:
+                problems.append(f"queries {before['queries']} -> {result['queries']}")
+
+            if problems:
+                regressions += 1
+                self.stdout.write(self.style.ERROR(
+                    f"REGRESSION {result['size']} {result['endpoint']}: {'; '.join(problems)}"
+                ))
+        return regressions
+
+
+def _percentile(values, percent):
+    """Return the nearest-rank percentile of the values, rounded to microseconds."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return round(ordered[rank - 1], 3)
@@ -0,0 +1,99 @@
+import itertools
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from boards_app.models import Board
+from tasks_app import search
+from tasks_app.models import Comment, Task
+
+BENCH_EMAIL = "benchmark-search@example.com"
+VOCABULARY_SIZE = 20_000
+BATCH_SIZE = 10_000
+
+
+class Command(BaseCommand):
+    help = "Compare FTS5 search with the LIKE baseline on synthetic tasks and comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Number of tasks.")
+        parser.add_argument("--comments-per-task", type=float, default=0.5)
+        parser.add_argument("--queries", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError("Full-text search requires SQLite with FTS5.")
+
+        rng = random.Random(options["seed"])
+        vocabulary = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+            for _ in range(VOCABULARY_SIZE)
+        ]
+        cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+
+        def text(words):
+            return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=words))
+
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(
+                email=BENCH_EMAIL, password=None, fullname="Benchmark"
+            )
+            board = Board.objects.create(title="Benchmark", created_by=user)
+            board.members.add(user)
+
+            started = time.perf_counter()
+            self._seed(board, user, options["rows"], options["comments_per_task"], text)
+            self.stdout.write(
+                f"Seeded {options['rows']} tasks in {time.perf_counter() - started:.1f}s"
+            )
+
+            # Frequent, mid-frequency and rare terms, single and combined.
+            queries = []
+            for _ in range(options["queries"]):
+                common, medium, rare = (
+                    vocabulary[rng.randrange(10)],
+                    vocabulary[rng.randrange(100, 1000)],
+                    vocabulary[rng.randrange(5000, VOCABULARY_SIZE)],
+                )
+                queries += [rare, medium, f"{common} {medium}", rare[:-1]]
+
+            for name, function in (("LIKE", search.like_search), ("FTS5", search.search)):
+                self._run(name, function, user, queries)
+
+            transaction.set_rollback(True)
+
+    def _seed(self, board, user, rows, comments_per_task, text):
+        for offset in range(0, rows, BATCH_SIZE):
+            tasks = Task.objects.bulk_create(
+                Task(
+                    board=board,
+                    title=text(6),
+                    description=text(30),
+                    created_by=user,
+                )
+                for _ in range(min(BATCH_SIZE, rows - offset))
+            )
+            Comment.objects.bulk_create(
+                Comment(task=tasks[index % len(tasks)], author=user, text=text(20))
+                for index in range(int(len(tasks) * comments_per_task))
+            )
+
+    def _run(self, name, function, user, queries):
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            function(user, query, limit=20)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        self.stdout.write(
+            f"{name}: {len(queries)} queries, "
+            f"mean {statistics.mean(timings):.1f} ms, "
+            f"median {statistics.median(timings):.1f} ms, "
+            f"max {max(timings):.1f} ms"
+        )
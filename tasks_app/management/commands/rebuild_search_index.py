@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks_app import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of tasks and comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if not search.is_available(using):
+            raise CommandError("Full-text search requires SQLite with FTS5.")
+
+        search.rebuild(using)
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
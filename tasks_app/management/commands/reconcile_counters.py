@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+
+from boards_app.models import Board
+from tasks_app.counters import board_counter_expressions, task_counter_expressions
+from tasks_app.models import Task
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized Board and Task counters and repair drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many rows have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            for model, expressions in (
+                (Board, board_counter_expressions()),
+                (Task, task_counter_expressions()),
+            ):
+                fixed = self._reconcile(model, expressions, options["dry_run"])
+                verb = "drifted" if options["dry_run"] else "repaired"
+                self.stdout.write(f"{model._meta.label}: {fixed} row(s) {verb}")
+
+        self.stdout.write(self.style.SUCCESS("Counters reconciled."))
+
+    def _reconcile(self, model, expressions, dry_run):
+        """Update all rows whose stored counters differ from the expected ones."""
+        drift = Q()
+        for name in expressions:
+            drift |= ~Q(**{name: F(f"expected_{name}")})
+
+        drifted_ids = list(
+            model.objects.order_by()
+            .annotate(**{f"expected_{name}": expr for name, expr in expressions.items()})
+            .filter(drift)
+            .values_list("pk", flat=True)
+        )
+
+        if not dry_run:
+            for start in range(0, len(drifted_ids), BATCH_SIZE):
+                batch = drifted_ids[start:start + BATCH_SIZE]
+                model.objects.filter(pk__in=batch).update(**expressions)
+
+        return len(drifted_ids)
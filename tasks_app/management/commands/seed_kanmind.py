@@ -0,0 +1,191 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from boards_app.models import Board
+from core.utils import chunks
+from tasks_app.counters import recount_boards
+from tasks_app.models import Comment, Task
+
+EMAIL_DOMAIN = "seed.kanmind.test"
+
+# Most tasks are open and of medium priority; few are in review or urgent.
+STATUS_WEIGHTS = {
+    Task.Status.TODO: 45,
+    Task.Status.IN_PROGRESS: 20,
+    Task.Status.REVIEW: 10,
+    Task.Status.DONE: 25,
+}
+PRIORITY_WEIGHTS = {
+    Task.Priority.LOW: 30,
+    Task.Priority.MEDIUM: 55,
+    Task.Priority.HIGH: 15,
+}
+ASSIGNED_RATIO = 0.7
+REVIEWED_RATIO = 0.4
+DUE_DATE_RATIO = 0.5
+# Due dates are spread around this day, so the same --seed gives the same
+# data regardless of when the command runs.
+ANCHOR_DATE = date(2026, 1, 1)
+
+FIRST_NAMES = ("Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hannes", "Ida", "Jonas")
+LAST_NAMES = ("Becker", "Fischer", "Hoffmann", "Koch", "Meyer", "Richter", "Schmidt", "Wagner")
+WORDS = (
+    "api backend board bug cache client comment config database deploy design docs "
+    "email endpoint error export feature filter fix frontend import index invoice "
+    "layout login logging metrics migration mobile monitoring onboarding page "
+    "payment performance permission profile query refactor release report review "
+    "search security server settings signup sprint style sync task test token "
+    "upload user validation webhook workflow"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Seed users, boards, members, tasks and comments for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--boards", type=int, default=20)
+        parser.add_argument("--members-per-board", type=int, default=5)
+        parser.add_argument("--tasks-per-board", type=int, default=200)
+        parser.add_argument(
+            "--comments-per-task",
+            type=float,
+            default=2.0,
+            help="Mean comments per task; counts are skewed (exponential).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--anchor-date",
+            type=date.fromisoformat,
+            default=ANCHOR_DATE,
+            help=f"Due dates fall between 30 days before and 90 days after this day (default {ANCHOR_DATE}).",
+        )
+        parser.add_argument("--password", default="kanmind1234", help="Password of all seeded users.")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["members_per_board"] > options["users"]:
+            raise CommandError("--members-per-board must not exceed --users (at least 1).")
+
+        User = get_user_model()
+        prefix = f"seed{options['seed']}-"
+        if User.objects.filter(email__startswith=prefix, email__endswith=EMAIL_DOMAIN).exists():
+            raise CommandError(f"Data for --seed {options['seed']} exists already.")
+
+        self.rng = random.Random(options["seed"])
+        self.counts = {}
+        self.batch_size = options["batch_size"]
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            users = self._seed_users(User, prefix, options["users"], options["password"])
+            boards = self._seed_boards(users, options["boards"], options["members_per_board"])
+            self._seed_tasks(
+                boards, options["tasks_per_board"], options["comments_per_task"], options["anchor_date"]
+            )
+            for chunk in chunks([board.pk for board, _ in boards], self.batch_size):
+                recount_boards(chunk)
+
+        counts = ", ".join(f"{count} {name}" for name, count in self.counts.items())
+        self.stdout.write(
+            self.style.SUCCESS(f"Seeded {counts} in {time.perf_counter() - started:.1f}s.")
+        )
+
+    def _bulk_create(self, name, model, objects):
+        """Insert objects in batches; return them with primary keys set."""
+        created = []
+        for chunk in chunks(objects, self.batch_size):
+            created += model.objects.bulk_create(chunk)
+        self.counts[name] = self.counts.get(name, 0) + len(created)
+        return created
+
+    def _seed_users(self, User, prefix, count, password):
+        password_hash = make_password(password)
+        return self._bulk_create(
+            "users",
+            User,
+            (
+                User(
+                    email=f"{prefix}{index:07d}@{EMAIL_DOMAIN}",
+                    fullname=f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                    password=password_hash,
+                )
+                for index in range(count)
+            ),
+        )
+
+    def _seed_boards(self, users, count, members_per_board):
+        """Create boards and memberships; return (board, member IDs) pairs."""
+        user_ids = [user.pk for user in users]
+        plans = []
+        for index in range(count):
+            members = self.rng.sample(user_ids, members_per_board) if members_per_board else []
+            owner = members[0] if members else self.rng.choice(user_ids)
+            plans.append((Board(title=f"Board {index + 1}: {self._words(2, 4)}", created_by_id=owner), members))
+
+        boards = self._bulk_create("boards", Board, (board for board, _ in plans))
+        Membership = Board.members.through
+        self._bulk_create(
+            "memberships",
+            Membership,
+            (
+                Membership(board_id=board.pk, user_id=user_id)
+                for board, (_, members) in zip(boards, plans)
+                for user_id in members
+            ),
+        )
+        return [(board, members or [board.created_by_id]) for board, (_, members) in zip(boards, plans)]
+
+    def _seed_tasks(self, boards, tasks_per_board, comments_per_task, anchor_date):
+        """Create tasks board by board, followed by the comments of each batch."""
+        statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+        priorities, priority_weights = zip(*PRIORITY_WEIGHTS.items())
+
+        def tasks():
+            for board, members in boards:
+                for _ in range(tasks_per_board):
+                    task = Task(
+                        board_id=board.pk,
+                        title=self._words(3, 7).capitalize(),
+                        description=self._words(8, 30),
+                        status=self.rng.choices(statuses, status_weights)[0],
+                        priority=self.rng.choices(priorities, priority_weights)[0],
+                        due_date=(
+                            anchor_date + timedelta(days=self.rng.randint(-30, 90))
+                            if self.rng.random() < DUE_DATE_RATIO
+                            else None
+                        ),
+                        assigned_to_id=self._maybe(members, ASSIGNED_RATIO),
+                        reviewer_id=self._maybe(members, REVIEWED_RATIO),
+                        created_by_id=self.rng.choice(members),
+                        comments_count=(
+                            round(self.rng.expovariate(1 / comments_per_task)) if comments_per_task else 0
+                        ),
+                    )
+                    task._members = members
+                    yield task
+
+        for chunk in chunks(tasks(), self.batch_size):
+            created = self._bulk_create("tasks", Task, chunk)
+            self._bulk_create(
+                "comments",
+                Comment,
+                (
+                    Comment(task_id=task.pk, author_id=self.rng.choice(task._members), text=self._words(3, 20))
+                    for task in created
+                    for _ in range(task.comments_count)
+                ),
+            )
+
+    def _maybe(self, choices, ratio):
+        return self.rng.choice(choices) if self.rng.random() < ratio else None
+
+    def _words(self, low, high):
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(low, high)))
+
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(field).annotate(total=Count("id")).values("total")
+        ),
+        0,
+    )
+
+
+def populate_counters(apps, schema_editor):
+    Board = apps.get_model("boards_app", "Board")
+    Task = apps.get_model("tasks_app", "Task")
+    Comment = apps.get_model("tasks_app", "Comment")
+    Membership = Board.members.through
+
+    tasks = Task.objects.filter(board_id=OuterRef("pk"))
+    Board.objects.update(
+        member_count=_count(Membership.objects.filter(board_id=OuterRef("pk")), "board_id"),
+        ticket_count=_count(tasks, "board_id"),
+        tasks_to_do_count=_count(tasks.filter(Q(status="todo")), "board_id"),
+        tasks_high_prio_count=_count(tasks.filter(Q(priority="high")), "board_id"),
+    )
+    Task.objects.update(
+        comments_count=_count(Comment.objects.filter(task_id=OuterRef("pk")), "task_id")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_board_counters'),
+        ('tasks_app', '0006_task_and_comment_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
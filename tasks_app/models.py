@@ -1,5 +1,31 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+
+
+def _board_counter_values(state, sign=1):
+    """Return the Board counter contributions of a (board_id, status, priority) state."""
+    _, status, priority = state
+    return {
+        "ticket_count": sign,
+        "tasks_to_do_count": sign * (status == Task.Status.TODO),
+        "tasks_high_prio_count": sign * (priority == Task.Priority.HIGH),
+    }
+
+
+def apply_board_counter_delta(board_id, delta):
+    """Add the given per-counter deltas to a board and bump its version."""
+    from boards_app.models import Board
+
+    changes = {name: F(name) + value for name, value in delta.items() if value}
+    Board.objects.filter(pk=board_id).touch(**changes)
+
+
+def touch_task_board(task_id):
+    """Bump the version of the board the given task belongs to."""
+    from boards_app.models import Board
+
+    Board.objects.filter(tasks__id=task_id).touch()
 
 
 class Task(models.Model):
@@ -20,6 +46,7 @@ class Task(models.Model):
         "boards_app.Board",
         on_delete=models.CASCADE,
         related_name="tasks",
+        db_index=False,
     )
 
     title = models.CharField(max_length=255)
@@ -40,6 +67,7 @@ class Task(models.Model):
         null=True,
         blank=True,
         related_name="assigned_tasks",
+        db_index=False,
     )
 
     reviewer = models.ForeignKey(
@@ -48,6 +76,7 @@ class Task(models.Model):
         null=True,
         blank=True,
         related_name="reviewer_tasks",
+        db_index=False,
     )
 
     created_by = models.ForeignKey(
@@ -59,14 +88,108 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalized, maintained by Comment.save() and the post_delete handler.
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = ("comments_count",)
+    COUNTED_FIELDS = ("board_id", "status", "priority")
+
     class Meta:
         ordering = ["-updated_at"]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="task_updated_id_idx"),
+            models.Index(fields=["board", "status"], name="task_board_status_idx"),
+            models.Index(fields=["board", "priority"], name="task_board_priority_idx"),
+            models.Index(fields=["board", "updated_at", "id"], name="task_board_updated_idx"),
+            models.Index(
+                fields=["assigned_to", "updated_at", "id"],
+                name="task_assignee_updated_idx",
+                condition=models.Q(assigned_to__isnull=False),
+            ),
+            models.Index(
+                fields=["reviewer", "updated_at", "id"],
+                name="task_reviewer_updated_idx",
+                condition=models.Q(reviewer__isnull=False),
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def _get_counted_state(self):
+        """Return (board_id, status, priority) or None if any is deferred."""
+        if any(name not in self.__dict__ for name in self.COUNTED_FIELDS):
+            return None
+        return tuple(self.__dict__[name] for name in self.COUNTED_FIELDS)
+
+    def save(self, **kwargs):
+        """Save the task and keep its board's counters in sync."""
+        adding = self._state.adding
+        if not adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+
+        with transaction.atomic(using=kwargs.get("using")):
+            # Read the stored state under a row lock instead of trusting the
+            # state loaded with the instance: a concurrent save may have
+            # changed the row since, and deltas from a stale state drift the
+            # board counters.
+            previous = None if adding else self._load_counted_state(lock=True)
+            super().save(**kwargs)
+            current = self._written_counted_state(previous, kwargs.get("update_fields"))
+            self._update_board_counters(previous, current)
+            if previous is not None and previous[0] != current[0]:
+                Tombstone.objects.create(
+                    kind=Tombstone.Kind.TASK, object_id=self.pk, board_id=previous[0]
+                )
+
+    def _written_counted_state(self, previous, update_fields):
+        """
+        Return the stored (board_id, status, priority) after a save.
+
+        Counted fields left out of update_fields keep their previous stored
+        value, whatever a stale instance holds in memory.
+        """
+        if previous is None:
+            return self._get_counted_state() or self._load_counted_state()
+        written = set(update_fields)
+        state = []
+        for name, stored in zip(self.COUNTED_FIELDS, previous):
+            if name not in written and self._meta.get_field(name).name not in written:
+                state.append(stored)
+            elif name in self.__dict__:
+                state.append(self.__dict__[name])
+            else:
+                return self._load_counted_state()
+        return tuple(state)
+
+    def _load_counted_state(self, lock=False):
+        queryset = Task.objects.filter(pk=self.pk)
+        if lock:
+            queryset = queryset.select_for_update()
+        return queryset.values_list(*self.COUNTED_FIELDS).first()
+
+    @staticmethod
+    def _update_board_counters(previous, current):
+        """Move this task's contribution from the previous to the current state."""
+        deltas = {}
+        if previous is not None:
+            deltas[previous[0]] = _board_counter_values(previous, sign=-1)
+        if current is not None:
+            added = _board_counter_values(current)
+            removed = deltas.get(current[0], {})
+            deltas[current[0]] = {
+                name: value + removed.get(name, 0) for name, value in added.items()
+            }
+
+        for board_id, delta in deltas.items():
+            apply_board_counter_delta(board_id, delta)
+
 
 class Comment(models.Model):
     """A comment within a task."""
@@ -75,6 +198,7 @@ class Comment(models.Model):
         Task,
         on_delete=models.CASCADE,
         related_name="task_comments",
+        db_index=False,
     )
 
     author = models.ForeignKey(
@@ -90,6 +214,59 @@ class Comment(models.Model):
         ordering = ["created_at"]
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            models.Index(fields=["task", "id"], name="comment_task_id_idx"),
+            models.Index(fields=["task", "created_at", "id"], name="comment_task_created_id_idx"),
+            models.Index(fields=["created_at"], name="comment_created_idx"),
+        ]
 
     def __str__(self):
         return f"Comment #{self.id}"
+
+    def save(self, **kwargs):
+        """Save the comment, bump comments_count on create and touch the board."""
+        if not self._state.adding:
+            with transaction.atomic(using=kwargs.get("using")):
+                super().save(**kwargs)
+                touch_task_board(self.task_id)
+            return
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(**kwargs)
+            Task.objects.filter(pk=self.task_id).update(
+                comments_count=F("comments_count") + 1
+            )
+            touch_task_board(self.task_id)
+
+
+class Tombstone(models.Model):
+    """
+    Deletion log entry for delta sync clients.
+
+    Written when a task or comment is deleted directly, or when a task leaves
+    a board. Deletes that cascade from a board or task are not logged: sync
+    clients drop those rows together with their parent. Old entries are
+    removed by the prune_tombstones command.
+    """
+
+    class Kind(models.TextChoices):
+        TASK = "task", "Task"
+        COMMENT = "comment", "Comment"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    object_id = models.BigIntegerField()
+    board_id = models.BigIntegerField()
+    task_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["deleted_at"]
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+        indexes = [
+            models.Index(fields=["board_id", "deleted_at"], name="tombstone_board_deleted_idx"),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} deleted"
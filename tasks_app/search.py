@@ -0,0 +1,232 @@
+"""
+Full-text search over task titles, descriptions and comments.
+
+On SQLite, tasks and comments are indexed in FTS5 tables that use the model
+tables as external content. Triggers keep them in sync with every write,
+including bulk_create/bulk_update and cascading deletes. Results are ranked
+with bm25 and carry a snippet around the matched terms. Snippets are
+HTML-escaped; only the <mark> tags around matched terms are markup.
+
+Other database backends fall back to LIKE, which is also the baseline used by
+the benchmark_search command.
+"""
+
+import html
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from boards_app.models import Board
+from .models import Comment, Task
+
+TASK_FTS_TABLE = f"{Task._meta.db_table}_fts"
+COMMENT_FTS_TABLE = f"{Comment._meta.db_table}_fts"
+
+TITLE_WEIGHT = 10.0
+MAX_TERMS = 8
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_TOKENS = 16
+
+# Control characters that FTS5 snippet() puts around matches instead of the
+# tags, so the text can be escaped before the tags are inserted.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _index_schema():
+    """Return the DDL of the FTS tables and their sync triggers."""
+    statements = []
+    for model, fields in ((Task, ("title", "description")), (Comment, ("text",))):
+        table = model._meta.db_table
+        fts = f"{table}_fts"
+        columns = ", ".join(fields)
+        new_values = ", ".join(f"new.{field}" for field in fields)
+        old_values = ", ".join(f"old.{field}" for field in fields)
+        changed = " OR ".join(f"old.{field} IS NOT new.{field}" for field in fields)
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_values});"
+        )
+        insert = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});"
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{columns}, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {table} "
+            f"WHEN {changed} BEGIN {delete} {insert} END",
+        ]
+    return statements
+
+
+def is_available(using="default"):
+    """Return True if the database supports the FTS5 index."""
+    return connections[using].vendor == "sqlite"
+
+
+def install(using="default"):
+    """
+    Create the FTS tables and triggers if missing; return True if created.
+
+    Safe to run repeatedly. It runs after every migrate, because SQLite table
+    rebuilds in migrations drop the triggers of the rebuilt table.
+    """
+    if not is_available(using):
+        return False
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        existing = set(connection.introspection.table_names(cursor))
+        if not {Task._meta.db_table, Comment._meta.db_table} <= existing:
+            return False
+        for statement in _index_schema():
+            cursor.execute(statement)
+    return TASK_FTS_TABLE not in existing or COMMENT_FTS_TABLE not in existing
+
+
+def rebuild(using="default"):
+    """Recreate the index contents from the task and comment tables."""
+    install(using)
+    with connections[using].cursor() as cursor:
+        for table in (TASK_FTS_TABLE, COMMENT_FTS_TABLE):
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+
+
+def terms(query):
+    """Split a user query into at most MAX_TERMS search terms."""
+    return _TERM_RE.findall(query)[:MAX_TERMS]
+
+
+def match_expression(query):
+    """
+    Build an FTS5 MATCH expression from user input.
+
+    Every term is quoted, so FTS5 operators in the input are matched as text,
+    and used as a prefix. Terms are combined with AND.
+    """
+    return " ".join(f'"{term}"*' for term in terms(query))
+
+
+def _accessible_board_ids_sql(user):
+    return Board.objects.accessible_to(user).order_by().values("id").query.sql_with_params()
+
+
+def search(user, query, limit=20, using="default"):
+    """
+    Return up to limit tasks and comments matching the query, best first.
+
+    Only boards the user created or is a member of are searched. Each result
+    is a dict with type, id, task_id, board_id, title (of the task) and snippet.
+    """
+    if not terms(query):
+        return []
+    if not is_available(using):
+        return like_search(user, query, limit)
+
+    boards_sql, boards_params = _accessible_board_ids_sql(user)
+    match = match_expression(query)
+    task_table, comment_table = Task._meta.db_table, Comment._meta.db_table
+    sql = f"""
+        SELECT kind, object_id, task_id, board_id, title, snippet FROM (
+            SELECT 'task' AS kind, t.id AS object_id, t.id AS task_id, t.board_id,
+                   t.title, snippet({TASK_FTS_TABLE}, -1, %s, %s, '…', %s) AS snippet,
+                   bm25({TASK_FTS_TABLE}, %s, 1.0) AS rank
+            FROM {TASK_FTS_TABLE}
+            JOIN {task_table} t ON t.id = {TASK_FTS_TABLE}.rowid
+            WHERE {TASK_FTS_TABLE} MATCH %s AND t.board_id IN ({boards_sql})
+            UNION ALL
+            SELECT 'comment', c.id, t.id, t.board_id,
+                   t.title, snippet({COMMENT_FTS_TABLE}, 0, %s, %s, '…', %s),
+                   bm25({COMMENT_FTS_TABLE})
+            FROM {COMMENT_FTS_TABLE}
+            JOIN {comment_table} c ON c.id = {COMMENT_FTS_TABLE}.rowid
+            JOIN {task_table} t ON t.id = c.task_id
+            WHERE {COMMENT_FTS_TABLE} MATCH %s AND t.board_id IN ({boards_sql})
+        )
+        ORDER BY rank, kind DESC, object_id
+        LIMIT %s
+    """
+    snippet_params = [MATCH_START, MATCH_END, SNIPPET_TOKENS]
+    params = [
+        *snippet_params, TITLE_WEIGHT, match, *boards_params,
+        *snippet_params, match, *boards_params,
+        limit,
+    ]
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [_result(*row[:5], render_snippet(row[5])) for row in rows]
+
+
+def render_snippet(text):
+    """Escape a snippet with MATCH_START/MATCH_END markers and turn them into tags."""
+    if text is None:
+        return None
+    escaped = html.escape(text)
+    return escaped.replace(MATCH_START, SNIPPET_START).replace(MATCH_END, SNIPPET_END)
+
+
+def like_snippet(text, words):
+    """
+    Return a snippet of text around the first matched word for like_search.
+
+    Matches are marked like FTS5 snippet() does, so render_snippet applies.
+    """
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+    first = pattern.search(text)
+    if first is None:
+        return None
+    tokens = SNIPPET_TOKENS * 8
+    start = max(first.start() - tokens // 2, 0)
+    excerpt = text[start:start + tokens]
+    marked = pattern.sub(lambda match: f"{MATCH_START}{match.group()}{MATCH_END}", excerpt)
+    prefix = "…" if start else ""
+    suffix = "…" if start + tokens < len(text) else ""
+    return render_snippet(f"{prefix}{marked}{suffix}")
+
+
+def like_search(user, query, limit=20):
+    """Unranked LIKE search over the same fields, with snippets built in Python."""
+    words = terms(query)
+    if not words:
+        return []
+
+    board_ids = Board.objects.accessible_to(user).values("id")
+    task_filter, comment_filter = Q(), Q()
+    for word in words:
+        task_filter &= Q(title__icontains=word) | Q(description__icontains=word)
+        comment_filter &= Q(text__icontains=word)
+
+    tasks = (
+        Task.objects.filter(task_filter, board_id__in=board_ids)
+        .order_by("-updated_at", "-id")
+        .values_list("id", "id", "board_id", "title", "description")[:limit]
+    )
+    comments = (
+        Comment.objects.filter(comment_filter, task__board_id__in=board_ids)
+        .order_by("-created_at", "-id")
+        .values_list("id", "task_id", "task__board_id", "task__title", "text")[:limit]
+    )
+    results = [
+        _result("task", *row[:4], like_snippet(row[3], words) or like_snippet(row[4], words))
+        for row in tasks
+    ]
+    results += [_result("comment", *row[:4], like_snippet(row[4], words)) for row in comments]
+    return results[:limit]
+
+
+def _result(kind, object_id, task_id, board_id, title, snippet):
+    return {
+        "type": kind,
+        "id": object_id,
+        "task_id": task_id,
+        "board_id": board_id,
+        "title": title,
+        "snippet": snippet,
+    }
@@ -0,0 +1,54 @@
+"""
+tasks_app signal handlers.
+
+Keep the denormalized Board and Task counters in sync on deletes and write
+tombstones for delta sync. Creates and updates are handled in Task.save()
+and Comment.save().
+"""
+
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from boards_app.models import Board
+from .models import Comment, Task, Tombstone, touch_task_board
+
+
+def _deleted_via(origin, *models):
+    """Return True if the delete cascaded from one of the given models."""
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, models)
+
+
+@receiver(post_delete, sender=Task)
+def decrement_board_counters(sender, instance, origin=None, **kwargs):
+    """Remove a deleted task from its board's counters."""
+    if _deleted_via(origin, Board):
+        return
+
+    state = instance._get_counted_state()
+    if state is not None:
+        Task._update_board_counters(state, None)
+
+    Tombstone.objects.create(
+        kind=Tombstone.Kind.TASK, object_id=instance.pk, board_id=instance.board_id
+    )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comments_count(sender, instance, origin=None, **kwargs):
+    """Decrement the task's comments_count when a comment is deleted."""
+    if _deleted_via(origin, Task, Board):
+        return
+
+    Task.objects.filter(pk=instance.task_id).update(
+        comments_count=F("comments_count") - 1
+    )
+    touch_task_board(instance.task_id)
+
+    Tombstone.objects.create(
+        kind=Tombstone.Kind.COMMENT,
+        object_id=instance.pk,
+        board_id=instance.task.board_id,
+        task_id=instance.task_id,
+    )
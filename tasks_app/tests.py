@@ -1,3 +1,881 @@
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from tasks_app import search
+from tasks_app.api.fast import FastJSONRenderer, serialize_task_rows, task_values
+from tasks_app.api.serializers import TaskReadSerializer
+from tasks_app.api.views import SyncView
+from tasks_app.models import Comment, Task, Tombstone
+
+User = get_user_model()
+
+
+class TaskAPITestCase(APITestCase):
+    """Shared fixtures: one board with an owner and a member."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="owner@example.com", password="pw123456", fullname="Owner"
+        )
+        self.member = User.objects.create_user(
+            email="member@example.com", password="pw123456", fullname="Member"
+        )
+        self.board = Board.objects.create(title="Board", created_by=self.user)
+        self.board.members.set([self.user, self.member])
+        self.client.force_authenticate(self.user)
+
+    def create_tasks(self, count, **fields):
+        fields.setdefault("assigned_to", self.user)
+        fields.setdefault("reviewer", self.user)
+        return [
+            Task.objects.create(
+                board=self.board, title=f"Task {index}", created_by=self.user, **fields
+            )
+            for index in range(count)
+        ]
+
+
+class TaskCursorPaginationTests(TaskAPITestCase):
+
+    def _collect(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_unpaginated_by_default(self):
+        self.create_tasks(3)
+        response = self.client.get("/api/tasks/")
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 3)
+
+    def test_pages_cover_all_tasks_in_order(self):
+        tasks = self.create_tasks(7)
+        Task.objects.update(updated_at=timezone.now())
+
+        for endpoint in ("/api/tasks/", "/api/tasks/assigned-to-me/", "/api/tasks/reviewing/"):
+            ids = self._collect(f"{endpoint}?page_size=3")
+            self.assertEqual(ids, sorted((t.id for t in tasks), reverse=True))
+
+    def test_cursor_is_stable_under_concurrent_updates(self):
+        tasks = self.create_tasks(6)
+        now = timezone.now()
+        for offset, task in enumerate(tasks):
+            Task.objects.filter(pk=task.pk).update(updated_at=now + timedelta(seconds=offset))
+
+        first = self.client.get("/api/tasks/?page_size=2")
+        seen = [task["id"] for task in first.data["results"]]
+
+        Task.objects.filter(pk=tasks[0].pk).update(updated_at=now + timedelta(minutes=5))
+        seen.extend(self._collect(first.data["next"]))
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen, [t.id for t in reversed(tasks[1:])])
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/tasks/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+
+class CommentThreadTests(TaskAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.task = self.create_tasks(1)[0]
+        self.url = f"/api/tasks/{self.task.id}/comments/"
+        start = timezone.now() - timedelta(minutes=1)
+        self.comments = [
+            Comment.objects.create(task=self.task, author=self.member, text=f"Comment {index}")
+            for index in range(5)
+        ]
+        # Two comments share a timestamp so the id tie-breaker is exercised.
+        for index, comment in enumerate(self.comments):
+            Comment.objects.filter(pk=comment.pk).update(created_at=start + timedelta(seconds=min(index, 3)))
+
+    def _collect(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(comment["id"] for comment in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_unpaginated_list_is_in_thread_order(self):
+        with self.assertNumQueries(3):  # task board, board access, comments with author
+            response = self.client.get(self.url)
+        self.assertEqual([c["id"] for c in response.data], [c.id for c in self.comments])
+        self.assertEqual(
+            set(response.data[0]), {"id", "created_at", "author", "content"}
+        )
+        self.assertEqual(response.data[0]["author"], "Member")
+
+    def test_pages_cover_the_thread_once(self):
+        self.assertEqual(self._collect(f"{self.url}?page_size=2"), [c.id for c in self.comments])
+
+        first = self.client.get(f"{self.url}?page_size=3")
+        new = Comment.objects.create(task=self.task, author=self.user, text="late")
+        self.assertEqual(
+            [c["id"] for c in first.data["results"]] + self._collect(first.data["next"]),
+            [c.id for c in self.comments] + [new.id],
+        )
+
+    def test_since_id_returns_only_newer_comments(self):
+        response = self.client.get(f"{self.url}?since_id={self.comments[2].id}")
+        self.assertEqual([c["id"] for c in response.data], [c.id for c in self.comments[3:]])
+        self.assertEqual(
+            self._collect(f"{self.url}?since_id={self.comments[0].id}&page_size=3"),
+            [c.id for c in self.comments[1:]],
+        )
+
+        for value in ("x", "-1"):
+            response = self.client.get(f"{self.url}?since_id={value}")
+            self.assertEqual(response.status_code, 400)
+
+
+class BoardAccessResolverTests(TaskAPITestCase):
+    """Board membership is resolved at most once per request."""
+
+    def assertSingleMembershipQuery(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(url, data, format="json")
+        membership = [q for q in ctx.captured_queries if "boards_app_board_members" in q["sql"]]
+        self.assertLessEqual(len(membership), 1, membership)
+        return response
+
+    def test_task_writes(self):
+        data = {
+            "board": self.board.id,
+            "title": "New",
+            "status": "to-do",
+            "assignee_id": self.user.id,
+            "reviewer_id": self.user.id,
+        }
+        response = self.assertSingleMembershipQuery("post", "/api/tasks/", data)
+        self.assertEqual(response.status_code, 201)
+
+        url = f"/api/tasks/{response.data['id']}/"
+        response = self.assertSingleMembershipQuery("patch", url, {"title": "Renamed"})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.assertSingleMembershipQuery("post", f"{url}comments/", {"content": "Hi"})
+        self.assertEqual(response.status_code, 201)
+
+    def test_create_checks_access_and_existence(self):
+        foreign = Board.objects.create(title="Foreign", created_by=self.member)
+        data = {"board": foreign.id, "title": "New"}
+        self.assertEqual(self.client.post("/api/tasks/", data).status_code, 403)
+
+        data = {"board": foreign.id + 100, "title": "New"}
+        self.assertEqual(self.client.post("/api/tasks/", data).status_code, 404)
+
+    def test_assignee_must_be_member(self):
+        outsider = User.objects.create_user(
+            email="outsider@example.com", password="pw123456", fullname="Outsider"
+        )
+        data = {"board": self.board.id, "title": "New", "status": "to-do", "assignee_id": outsider.id}
+        response = self.client.post("/api/tasks/", data)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("assignee_id", response.data)
+
+        data["assignee_id"] = self.member.id
+        self.assertEqual(self.client.post("/api/tasks/", data).status_code, 201)
+
+
+class DenormalizedCounterTests(TaskAPITestCase):
+
+    def assertBoardCounters(self, members, tickets, to_do, high):
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (
+                self.board.member_count,
+                self.board.ticket_count,
+                self.board.tasks_to_do_count,
+                self.board.tasks_high_prio_count,
+            ),
+            (members, tickets, to_do, high),
+        )
+
+    def test_task_writes_update_board_counters(self):
+        task, other = self.create_tasks(2, priority=Task.Priority.HIGH)
+        self.assertBoardCounters(2, 2, 2, 2)
+
+        task.status = Task.Status.DONE
+        task.save()
+        self.assertBoardCounters(2, 2, 1, 2)
+
+        response = self.client.patch(f"/api/tasks/{other.id}/", {"priority": "low"})
+        self.assertEqual(response.status_code, 200)
+        self.assertBoardCounters(2, 2, 1, 1)
+
+        self.client.delete(f"/api/tasks/{other.id}/")
+        self.assertBoardCounters(2, 1, 0, 1)
+
+    def test_moving_a_task_updates_both_boards(self):
+        target = Board.objects.create(title="Target", created_by=self.user)
+        task = self.create_tasks(1)[0]
+
+        task.board = target
+        task.save()
+
+        target.refresh_from_db()
+        self.assertBoardCounters(2, 0, 0, 0)
+        self.assertEqual((target.ticket_count, target.tasks_to_do_count), (1, 1))
+
+    def test_stale_instances_do_not_drift_counters(self):
+        task = self.create_tasks(1)[0]
+        first = Task.objects.get(pk=task.pk)
+        second = Task.objects.get(pk=task.pk)
+
+        first.status = Task.Status.DONE
+        first.save()
+        second.status = Task.Status.REVIEW
+        second.save()
+        self.assertBoardCounters(2, 1, 0, 0)
+
+    def test_partial_save_of_stale_instance_keeps_counters(self):
+        task = self.create_tasks(1)[0]
+        stale = Task.objects.get(pk=task.pk)
+        task.status = Task.Status.DONE
+        task.save()
+
+        stale.title = "Renamed"
+        stale.save(update_fields=["title"])
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, Task.Status.DONE)
+        self.assertBoardCounters(2, 1, 0, 0)
+
+    def test_membership_changes_update_member_count(self):
+        third = User.objects.create_user(
+            email="third@example.com", password="pw123456", fullname="Third"
+        )
+        self.board.members.add(third, self.user)
+        self.assertBoardCounters(3, 0, 0, 0)
+
+        self.board.members.remove(third, third)
+        self.assertBoardCounters(2, 0, 0, 0)
+
+        third.boards.add(self.board)
+        self.assertBoardCounters(3, 0, 0, 0)
+
+        third.boards.clear()
+        self.assertBoardCounters(2, 0, 0, 0)
+
+    def test_comment_writes_update_comments_count(self):
+        task = self.create_tasks(1)[0]
+        url = f"/api/tasks/{task.id}/comments/"
+        first = self.client.post(url, {"content": "one"}).data
+        self.client.post(url, {"content": "two"})
+        task.refresh_from_db()
+        self.assertEqual(task.comments_count, 2)
+
+        self.client.delete(f"{url}{first['id']}/")
+        task.refresh_from_db()
+        self.assertEqual(task.comments_count, 1)
+
+    def test_board_save_keeps_counters(self):
+        stale = Board.objects.get(pk=self.board.pk)
+        self.create_tasks(1)
+        stale.title = "Renamed"
+        stale.save()
+        self.assertBoardCounters(2, 1, 1, 0)
+
+    def test_reads_run_no_aggregates(self):
+        self.create_tasks(3)
+        for url in ("/api/boards/", "/api/tasks/", f"/api/boards/{self.board.id}/"):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(url)
+            sql = " ".join(q["sql"] for q in ctx.captured_queries)
+            self.assertNotIn("COUNT(", sql, url)
+
+    def test_reconcile_counters_repairs_drift(self):
+        task = self.create_tasks(1)[0]
+        Comment.objects.create(task=task, author=self.user, text="Hi")
+        Board.objects.update(ticket_count=42, member_count=0)
+        Task.objects.update(comments_count=7)
+
+        call_command("reconcile_counters", stdout=StringIO())
+
+        task.refresh_from_db()
+        self.assertEqual(task.comments_count, 1)
+        self.assertBoardCounters(2, 1, 1, 0)
+
+
+class ConditionalGetTests(TaskAPITestCase):
+
+    def assertRevalidates(self, url, change, queries=1):
+        first = self.client.get(url)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(queries):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], etag)
+
+        change()
+        fresh = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(fresh.status_code, 200)
+        self.assertNotEqual(fresh["ETag"], etag)
+        return fresh
+
+    def test_board_detail(self):
+        task = self.create_tasks(1)[0]
+        url = f"/api/boards/{self.board.id}/"
+
+        def rename_task():
+            task.title = "Renamed"
+            task.save()
+
+        self.assertRevalidates(url, rename_task)
+        self.assertRevalidates(
+            url, lambda: Comment.objects.create(task=task, author=self.user, text="Hi")
+        )
+        self.assertRevalidates(url, lambda: self.board.members.remove(self.member))
+
+    def test_task_list_and_detail(self):
+        task = self.create_tasks(1)[0]
+        self.assertRevalidates("/api/tasks/", lambda: self.create_tasks(1))
+
+        def rename_member():
+            self.user.fullname = "Renamed"
+            self.user.save()
+
+        self.assertRevalidates(f"/api/tasks/{task.id}/", rename_member, queries=2)
+
+    def test_task_moved_to_board_with_same_version(self):
+        target = Board.objects.create(title="Target", created_by=self.user)
+        task = self.create_tasks(1)[0]
+
+        def move_task():
+            task.board = target
+            task.save()
+            Board.objects.filter(pk__in=[self.board.pk, target.pk]).update(version=7)
+
+        Board.objects.filter(pk=self.board.pk).update(version=7)
+        fresh = self.assertRevalidates(f"/api/tasks/{task.id}/", move_task, queries=2)
+        self.assertEqual(fresh.data["board"], target.id)
+
+    def test_foreign_board_is_not_revalidated(self):
+        foreign = Board.objects.create(title="Foreign", created_by=self.member)
+        response = self.client.get(f"/api/boards/{foreign.id}/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 403)
+
+
+class DeltaSyncTests(TaskAPITestCase):
+
+    def sync(self, cursor=None):
+        url = "/api/sync/" if cursor is None else f"/api/sync/?since={cursor}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def age_everything(self):
+        past = timezone.now() - timedelta(minutes=5)
+        Task.objects.update(updated_at=past)
+        Comment.objects.update(created_at=past)
+        Tombstone.objects.update(deleted_at=past)
+
+    def test_full_then_delta(self):
+        kept, changed, removed = self.create_tasks(3)
+        Comment.objects.create(task=kept, author=self.user, text="old")
+
+        full = self.sync()
+        self.assertEqual(len(full["tasks"]), 3)
+        self.assertEqual(len(full["comments"]), 1)
+        self.assertEqual(full["boards"], [self.board.id])
+
+        self.age_everything()
+        changed.title = "Changed"
+        changed.save()
+        self.client.delete(f"/api/tasks/{removed.id}/")
+        comment = self.client.post(f"/api/tasks/{kept.id}/comments/", {"content": "new"}).data
+
+        delta = self.sync(full["cursor"])
+        self.assertEqual({t["id"] for t in delta["tasks"]}, {changed.id, kept.id})
+        self.assertEqual([c["id"] for c in delta["comments"]], [comment["id"]])
+        self.assertEqual(delta["deleted"], {"tasks": [removed.id], "comments": [], "boards": []})
+
+        self.age_everything()
+        self.client.delete(f"/api/tasks/{kept.id}/comments/{comment['id']}/")
+        delta = self.sync(delta["cursor"])
+        self.assertEqual([t["id"] for t in delta["tasks"]], [kept.id])
+        self.assertEqual(delta["tasks"][0]["comments_count"], 1)
+        self.assertEqual(delta["deleted"]["comments"], [comment["id"]])
+
+    def test_task_moved_away_is_tombstoned(self):
+        task = self.create_tasks(1)[0]
+        cursor = self.sync()["cursor"]
+        foreign = Board.objects.create(title="Foreign", created_by=self.member)
+
+        task.board = foreign
+        task.save()
+
+        self.assertEqual(self.sync(cursor)["deleted"]["tasks"], [task.id])
+
+    def test_board_access_changes_between_syncs(self):
+        foreign = Board.objects.create(title="Foreign", created_by=self.member)
+        task = Task.objects.create(board=foreign, title="Existing", created_by=self.member)
+        comment = Comment.objects.create(task=task, author=self.member, text="old")
+        self.create_tasks(1)
+        cursor = self.sync()["cursor"]
+        self.age_everything()
+
+        foreign.members.add(self.user)
+        delta = self.sync(cursor)
+        self.assertEqual(delta["boards"], sorted([self.board.id, foreign.id]))
+        self.assertEqual([t["id"] for t in delta["tasks"]], [task.id])
+        self.assertEqual([c["id"] for c in delta["comments"]], [comment.id])
+
+        self.age_everything()
+        foreign.members.remove(self.user)
+        delta = self.sync(delta["cursor"])
+        self.assertEqual(delta["deleted"]["boards"], [foreign.id])
+        self.assertEqual(delta["tasks"], [])
+
+    def test_invalid_and_expired_cursor(self):
+        self.assertEqual(self.client.get("/api/sync/?since=nope").status_code, 400)
+
+        expired = SyncView._encode_cursor(timezone.now() - timedelta(days=365))
+        self.assertEqual(self.client.get(f"/api/sync/?since={expired}").status_code, 410)
+
+    def test_prune_tombstones(self):
+        self.create_tasks(1)[0].delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=60))
+        call_command("prune_tombstones", stdout=StringIO())
+        self.assertFalse(Tombstone.objects.exists())
+
+
+class BulkTaskTests(TaskAPITestCase):
+
+    def payload(self, count, **fields):
+        return [
+            {
+                "board": self.board.id,
+                "title": f"Bulk {index}",
+                "status": "to-do",
+                "assignee_id": self.member.id,
+                **fields,
+            }
+            for index in range(count)
+        ]
+
+    def count_queries(self, method, data):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)("/api/tasks/bulk/", data, format="json")
+        return response, len(ctx.captured_queries)
+
+    def test_create_uses_constant_queries(self):
+        small, small_queries = self.count_queries("post", self.payload(2))
+        large, large_queries = self.count_queries("post", self.payload(40))
+
+        self.assertEqual(small.status_code, 201)
+        self.assertEqual(large.status_code, 201)
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(large.data[0]["data"]["assignee"]["id"], self.member.id)
+
+        self.board.refresh_from_db()
+        self.assertEqual((self.board.ticket_count, self.board.tasks_to_do_count), (42, 42))
+
+    def test_update_uses_constant_queries(self):
+        small_ids = [t.id for t in self.create_tasks(2)]
+        large_ids = [t.id for t in self.create_tasks(40)]
+
+        _, small_queries = self.count_queries(
+            "patch", [{"id": pk, "status": "done"} for pk in small_ids]
+        )
+        response, large_queries = self.count_queries(
+            "patch", [{"id": pk, "status": "done", "priority": "high"} for pk in large_ids]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(response.data[0]["data"]["status"], "done")
+
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (self.board.ticket_count, self.board.tasks_to_do_count, self.board.tasks_high_prio_count),
+            (42, 0, 40),
+        )
+
+    def test_partial_failures_are_reported_per_item(self):
+        outsider = User.objects.create_user(
+            email="outsider@example.com", password="pw123456", fullname="Outsider"
+        )
+        foreign = Board.objects.create(title="Foreign", created_by=outsider)
+        data = self.payload(1)
+        data += self.payload(1, assignee_id=outsider.id)
+        data += self.payload(1, board=foreign.id)
+        data += [{"title": "No board"}]
+
+        response = self.client.post("/api/tasks/bulk/", data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([r["status"] for r in response.data], [201, 400, 403, 400])
+        self.assertIn("assignee_id", response.data[1]["errors"])
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_rejects_non_list_and_foreign_tasks(self):
+        self.assertEqual(self.client.post("/api/tasks/bulk/", {}, format="json").status_code, 400)
+
+        foreign = Board.objects.create(title="Foreign", created_by=self.member)
+        task = Task.objects.create(board=foreign, title="Hidden", created_by=self.member)
+        response = self.client.patch(
+            "/api/tasks/bulk/", [{"id": task.id, "title": "Mine"}], format="json"
+        )
+        self.assertEqual(response.data[0]["status"], 404)
+
+
+class FastReadPathTests(TaskAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create_tasks(2, status="in_progress", due_date=timezone.localdate())
+        self.create_tasks(1, assigned_to=None, reviewer=None, status="todo")
+        Task.objects.create(
+            board=self.board,
+            title='Ümläut "quoted" \\ \u2028 \u2029 \x00 \U0001f680',
+            description="line\nbreak\ttab",
+            status="done",
+            assigned_to=self.member,
+            created_by=self.user,
+            comments_count=7,
+        )
+
+    def expected(self, queryset):
+        return JSONRenderer().render(TaskReadSerializer(queryset, many=True).data)
+
+    def test_rows_render_identically_to_serializer(self):
+        queryset = Task.objects.select_related("assigned_to", "reviewer").order_by("id")
+        fast = FastJSONRenderer().render(serialize_task_rows(task_values(queryset)))
+        self.assertEqual(fast, self.expected(queryset))
+
+    def test_list_endpoints_match_serializer(self):
+        queryset = Task.objects.select_related("assigned_to", "reviewer").order_by("-updated_at", "-id")
+        self.assertEqual(self.client.get("/api/tasks/").content, self.expected(queryset))
+
+        assigned = queryset.filter(assigned_to=self.user)
+        self.assertEqual(
+            self.client.get("/api/tasks/assigned-to-me/").content, self.expected(assigned)
+        )
+
+        response = self.client.get("/api/tasks/?page_size=3")
+        body = json.loads(response.content)
+        self.assertEqual(JSONRenderer().render(body["results"]), self.expected(queryset[:3]))
+        page = self.client.get(body["next"]).json()
+        self.assertEqual([task["id"] for task in page["results"]], [queryset.last().id])
+
+    def test_renderer_falls_back_for_non_native_values(self):
+        data = {"at": timezone.now(), "1": [None, True]}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class SparseFieldsetTests(TaskAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create_tasks(2, status="in_progress", due_date=timezone.localdate())
+        self.create_tasks(1, assigned_to=None, reviewer=None)
+        self.create_tasks(1, assigned_to=self.member)
+
+    def test_every_subset_matches_the_serializer(self):
+        queryset = Task.objects.select_related("assigned_to", "reviewer").order_by("id")
+        full = TaskReadSerializer(queryset, many=True).data
+        for fields in [("id",), ("id", "status", "due_date"), ("id", "assignee", "reviewer")]:
+            rows = serialize_task_rows(task_values(queryset, fields), fields)
+            self.assertEqual(rows, [{name: task[name] for name in fields} for task in full])
+
+    def test_unrequested_columns_and_joins_are_not_queried(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tasks/?fields=title,status&page_size=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "status"})
+        self.assertIsNotNone(response.data["next"])
+
+        sql = queries[-1]["sql"]
+        self.assertIn('"title"', sql)
+        for column in ('"description"', '"comments_count"', "users_app_user"):
+            self.assertNotIn(column, sql)
+
+    def test_task_detail_and_etag(self):
+        task = Task.objects.filter(assigned_to=self.member).get()
+        url = f"/api/tasks/{task.id}/"
+        full = self.client.get(url)
+        sparse = self.client.get(f"{url}?fields=assignee")
+        self.assertEqual(sparse.data, {"id": task.id, "assignee": full.data["assignee"]})
+        self.assertNotEqual(sparse["ETag"], full["ETag"])
+        self.assertEqual(
+            self.client.get(f"{url}?fields=assignee", headers={"If-None-Match": sparse["ETag"]}).status_code,
+            304,
+        )
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get("/api/tasks/assigned-to-me/?fields=title,secret")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", response.data["fields"])
+
+
+class SeedCommandTests(TestCase):
+
+    def seed(self):
+        call_command(
+            "seed_kanmind", "--seed", "3", "--users", "6", "--boards", "3",
+            "--members-per-board", "3", "--tasks-per-board", "20", "--batch-size", "7",
+            stdout=StringIO(),
+        )
+        return list(
+            Task.objects.order_by("pk").values_list(
+                "board__title", "title", "status", "priority", "due_date", "assigned_to__email",
+                "comments_count",
+            )
+        )
+
+    def test_seed_is_deterministic_and_consistent(self):
+        first = self.seed()
+        self.assertEqual(len(first), 60)
+        for board in Board.objects.all():
+            self.assertEqual(board.member_count, 3)
+            self.assertEqual(board.ticket_count, 20)
+            self.assertEqual(board.tasks_to_do_count, board.tasks.filter(status=Task.Status.TODO).count())
+        self.assertEqual(sum(row[-1] for row in first), Comment.objects.count())
+        due_dates = [row[4] for row in first if row[4]]
+        self.assertTrue(due_dates)
+        self.assertTrue(all(date(2025, 12, 2) <= due <= date(2026, 4, 1) for due in due_dates))
+
+        with self.assertRaises(CommandError):
+            self.seed()
+
+        User.objects.all().delete()
+        self.assertEqual(self.seed(), first)
+
+
+class EndpointBenchmarkTests(TestCase):
+
+    def test_run_and_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            current = os.path.join(directory, "current.json")
+            call_command(
+                "benchmark_endpoints", "--iterations", "2", "--warmup", "0",
+                "--endpoint", "boards.list", "--endpoint", "tasks.create",
+                "--output", current, stdout=StringIO(), stderr=StringIO(),
+            )
+            with open(current) as report:
+                results = json.load(report)["results"]
+            self.assertEqual([result["endpoint"] for result in results], ["boards.list", "tasks.create"])
+            self.assertEqual(results[0]["queries"], 1)
+            self.assertGreater(results[0]["bytes"], 0)
+
+            baseline = os.path.join(directory, "baseline.json")
+            results[1]["queries"] -= 1
+            with open(baseline, "w") as report:
+                json.dump({"results": results}, report)
+            out = StringIO()
+            with self.assertRaisesMessage(CommandError, "1 regression(s)"):
+                call_command(
+                    "benchmark_endpoints", "--input", current, "--compare", baseline, stdout=out
+                )
+            self.assertIn("REGRESSION small tasks.create: queries", out.getvalue())
+
+
+class DashboardTests(TaskAPITestCase):
+
+    today = date(2026, 10, 14)  # a Wednesday; the week ends on the 18th
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = mock.patch("django.utils.timezone.localdate", return_value=self.today)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.other_board = Board.objects.create(title="Another", created_by=self.member)
+        self.other_board.members.set([self.user, self.member])
+        Board.objects.create(title="Hidden", created_by=self.member)
+
+        Status, Priority = Task.Status, Task.Priority
+        for due, status, priority, assignee, reviewer in [
+            (date(2026, 10, 13), Status.TODO, Priority.HIGH, self.user, None),
+            (date(2026, 10, 10), Status.DONE, Priority.HIGH, self.user, self.member),
+            (date(2026, 10, 14), Status.REVIEW, Priority.LOW, self.member, self.user),
+            (date(2026, 10, 18), Status.IN_PROGRESS, Priority.MEDIUM, None, self.user),
+            (date(2026, 10, 19), Status.TODO, Priority.MEDIUM, self.user, None),
+        ]:
+            Task.objects.create(
+                board=self.board, title="Task", created_by=self.user, due_date=due,
+                status=status, priority=priority, assigned_to=assignee, reviewer=reviewer,
+            )
+        Task.objects.create(
+            board=self.other_board, title="Task", created_by=self.member,
+            priority=Priority.HIGH, assigned_to=self.user,
+        )
+
+    def test_counts_in_one_query(self):
+        with self.assertNumQueries(2):  # board versions + aggregate
+            response = self.client.get("/api/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        counts = {"assigned": 4, "reviewing": 2, "overdue": 1, "due_this_week": 2, "high_priority": 2}
+        self.assertEqual({name: response.data[name] for name in counts}, counts)
+        self.assertEqual(response.data["total"], 6)
+        self.assertEqual(
+            [(board["title"], board["total"], board["assigned"], board["high_priority"])
+             for board in response.data["boards"]],
+            [("Another", 1, 1, 1), ("Board", 5, 3, 1)],
+        )
+
+    def test_cached_until_a_task_changes(self):
+        first = self.client.get("/api/dashboard/")
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get("/api/dashboard/").data, first.data)
+
+        cached = self.client.get("/api/dashboard/", headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(cached.status_code, 304)
+
+        task = Task.objects.filter(board=self.other_board).get()
+        self.client.patch(f"/api/tasks/{task.id}/", {"assignee_id": None}, format="json")
+        response = self.client.get("/api/dashboard/")
+        self.assertEqual(response.data["assigned"], first.data["assigned"] - 1)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+
+
+@skipUnless(connection.vendor == "sqlite", "FTS5 search is SQLite specific.")
+class SearchTests(TaskAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.outsider = User.objects.create_user(
+            email="outsider@example.com", password="pw123456", fullname="Outsider"
+        )
+        self.foreign = Board.objects.create(title="Foreign", created_by=self.outsider)
+
+    def search(self, query, **params):
+        response = self.client.get("/api/search/", {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result["type"], result["id"]) for result in response.data]
+
+    def test_ranked_results_with_snippets(self):
+        in_title, in_description = self.create_tasks(2)
+        in_title.title = "Deploy the invoicing service"
+        in_title.save()
+        in_description.description = "Blocked until invoicing is migrated"
+        in_description.save()
+        comment = Comment.objects.create(
+            task=in_description, author=self.user, text="Invoicing numbers look wrong"
+        )
+        Task.objects.create(
+            board=self.foreign, title="Invoicing", created_by=self.outsider
+        )
+
+        results = self.search("invoic")
+        self.assertEqual(results[0], ("task", in_title.pk))
+        self.assertCountEqual(results[1:], [("task", in_description.pk), ("comment", comment.pk)])
+        response = self.client.get("/api/search/", {"q": "numbers"})
+        self.assertEqual(response.data[0]["task_id"], in_description.pk)
+        self.assertIn("<mark>numbers</mark>", response.data[0]["snippet"])
+
+    def test_snippets_escape_user_text(self):
+        task = self.create_tasks(1)[0]
+        task.title = '<script>alert(1)</script> <img src=x onerror="alert(2)"> exploit'
+        task.save()
+        Comment.objects.create(task=task, author=self.user, text="<b>exploit</b> & more")
+
+        expected = {
+            "task": '&lt;script&gt;alert(1)&lt;/script&gt; &lt;img src=x onerror=&quot;alert(2)&quot;&gt; '
+                    "<mark>exploit</mark>",
+            "comment": "&lt;b&gt;<mark>exploit</mark>&lt;/b&gt; &amp; more",
+        }
+        fts = self.client.get("/api/search/", {"q": "exploit"}).data
+        like = search.like_search(self.user, "exploit")
+        for results in (fts, like):
+            self.assertEqual({result["type"]: result["snippet"] for result in results}, expected)
+
+    def test_index_follows_writes(self):
+        task = self.create_tasks(1)[0]
+        Comment.objects.create(task=task, author=self.user, text="needs a checklist")
+        self.assertEqual(len(self.search("checklist")), 1)
+
+        Task.objects.filter(pk=task.pk).update(title="Rewrite the parser")
+        self.assertEqual(self.search("parser"), [("task", task.pk)])
+        self.assertEqual(self.search("task"), [])
+
+        task.refresh_from_db()
+        task.board = self.foreign
+        task.save()
+        self.assertEqual(self.search("parser checklist"), [])
+        self.assertEqual(self.search("parser"), [])
+
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.search("parser"), [("task", task.pk)])
+        task.delete()
+        self.assertEqual(self.search("parser"), [])
+        self.assertEqual(self.search("checklist"), [])
+
+    def test_rebuild_and_query_syntax(self):
+        task = self.create_tasks(1)[0]
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO tasks_app_task_fts(tasks_app_task_fts) VALUES ('delete-all')")
+        self.assertEqual(self.search("task"), [])
+
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search("task"), [("task", task.pk)])
+        self.assertEqual(self.search('"Task 0"* ^('), [("task", task.pk)])
+        self.assertEqual(self.client.get("/api/search/", {"q": " "}).status_code, 400)
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite specific.")
+class TaskQueryPlanTests(TestCase):
+    """The hot task/comment querysets must be served by an index."""
+
+    def assertIndexedPlan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            details = [row[-1] for row in cursor.fetchall()]
+
+        for detail in details:
+            self.assertFalse(detail.startswith("SCAN"), f"Full scan: {details}")
+            self.assertNotIn("TEMP B-TREE", detail, f"Temp sort: {details}")
+
+    def test_board_tasks_by_status(self):
+        self.assertIndexedPlan(
+            Task.objects.filter(board_id=1, status=Task.Status.TODO).order_by().values("id")
+        )
+
+    def test_board_tasks_by_priority(self):
+        self.assertIndexedPlan(
+            Task.objects.filter(board_id=1, priority=Task.Priority.HIGH).order_by().values("id")
+        )
+
+    def test_board_tasks_ordered(self):
+        self.assertIndexedPlan(
+            Task.objects.filter(board_id=1).select_related("assigned_to", "reviewer")
+        )
+
+    def test_assigned_and_reviewing_ordered(self):
+        related = ("assigned_to", "reviewer", "board")
+        self.assertIndexedPlan(Task.objects.filter(assigned_to_id=1).select_related(*related))
+        self.assertIndexedPlan(Task.objects.filter(reviewer_id=1).select_related(*related))
 
-# Create your tests here.
+    def test_comments_by_task(self):
+        self.assertIndexedPlan(
+            Comment.objects.filter(task_id=1).select_related("author").order_by("id")
+        )
+        self.assertIndexedPlan(Comment.objects.filter(task_id=1))
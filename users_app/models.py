@@ -1,9 +1,39 @@
+import string
+
 from django.contrib.auth.models import AbstractUser, UserManager
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Lower
+
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def prefix_bounds(prefix):
+    """Return (low, high) such that low <= value < high iff value starts with prefix."""
+    last = ord(prefix[-1])
+    if last == 0x10FFFF:
+        return prefix, prefix + chr(last)
+    return prefix, prefix[:-1] + chr(last + 1)
 
 
 class CustomUserManager(UserManager):
-    """UserManager for a User model without username (email login)."""
+    """
+    UserManager for a User model without username (email login).
+
+    Case-insensitive lookups compare Lower("email") / Lower("fullname") so
+    they can use the matching expression indexes on User; __iexact and
+    __istartswith compile to LIKE/UPPER() and scan the table instead.
+    """
+
+    def fold_case(self, value):
+        """
+        Lowercase value the way the database's lower() does.
+
+        SQLite's lower() only folds ASCII letters, so "Ö" stays "Ö" in the
+        index; str.lower() would turn the term into "ö" and never match.
+        """
+        if connections[self.db].vendor == "sqlite":
+            return value.translate(ASCII_LOWER)
+        return value.lower()
 
     def _create_user(self, email, password=None, **extra_fields):
         if not email:
@@ -31,6 +61,35 @@ class CustomUserManager(UserManager):
 
         return self._create_user(email, password, **extra_fields)
 
+    def get_by_email(self, email):
+        """Return the user with the given email, ignoring case."""
+        return self.alias(email_lower=Lower("email")).get(email_lower=self.fold_case(email))
+
+    def search(self, term, limit):
+        """
+        Return up to limit users whose email or fullname starts with term.
+
+        Each field is an index range scan on its Lower() expression, read in
+        index order and cut at limit, so the cost does not grow with the
+        table. Email matches come first, then name matches; rows are dicts
+        with id, email and fullname.
+        """
+        term = self.fold_case(term)
+        if not term or limit < 1:
+            return []
+        low, high = prefix_bounds(term)
+        results = {}
+        for field in ("email", "fullname"):
+            rows = (
+                self.alias(key=Lower(field))
+                .filter(key__gte=low, key__lt=high)
+                .order_by("key", "id")
+                .values("id", "email", "fullname")[:limit]
+            )
+            for row in rows:
+                results.setdefault(row["id"], row)
+        return list(results.values())[:limit]
+
 
 class User(AbstractUser):
     username = None
@@ -42,5 +101,11 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["fullname"]
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+            models.Index(Lower("fullname"), name="user_fullname_lower_idx"),
+        ]
+
     def __str__(self):
         return f"{self.fullname} <{self.email}>"